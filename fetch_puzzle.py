@@ -1,8 +1,17 @@
+import os
 import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from typing import Iterable, Optional
 
 import aoc_helper
 
+from solutions.inputs import InputStore
+
 
 def fetch_today():
     print("fetching today's puzzle...")
@@ -14,17 +23,107 @@ def fetch_day(day: int):
         raise RuntimeError("can only fetch puzzle for day 1~-25")
 
     raw_data = aoc_helper.fetch(day, 2022)
-    path = f"puzzle/day_{day:02}.txt"
+    store = InputStore()
+    digest = store.add(day, raw_data)
+
+    print(f"Saved: {store.object_path(digest)}")
+
+
+InputUrl = "https://adventofcode.com/2022/day/{day}/input"
+UserAgent = "github.com/kapppa-joe/aoc2022 fetch_puzzle.py"
+
 
-    with open(path, "w") as f:
-        f.write(raw_data)
+class RateLimiter:
+    "Allow at most `rate` calls of wait() per second, shared by all threads"
 
-    print(f"Saved: {path}")
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
 
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        time.sleep(slot - now)
 
-def fetch_all():
-    for day in range(1, 26):
-        fetch_day(day)
+
+def read_session() -> str:
+    "Use the same session token as aoc_helper, unless given by AOC_SESSION"
+    if "AOC_SESSION" in os.environ:
+        return os.environ["AOC_SESSION"]
+    token_file = aoc_helper.data.DATA_DIR / "token.txt"
+    return token_file.read_text().strip("\n")
+
+
+def download_input(
+    day: int,
+    session: str,
+    limiter: RateLimiter,
+    url: str = InputUrl,
+    retries: int = 3,
+    backoff: float = 1.0,
+) -> str:
+    """Download an input, retrying with exponential backoff on server errors and network failures.
+    Client errors (e.g. an expired session, or a puzzle not unlocked yet) are raised right away."""
+    request = urllib.request.Request(
+        url.format(day=day),
+        headers={"Cookie": f"session={session}", "User-Agent": UserAgent},
+    )
+    for attempt in range(retries + 1):
+        limiter.wait()
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                return response.read().decode().strip("\n")
+        except urllib.error.HTTPError as error:
+            if error.code < 500 and error.code != 429 or attempt == retries:
+                raise
+        except urllib.error.URLError:
+            if attempt == retries:
+                raise
+        time.sleep(backoff * 2**attempt)
+
+    raise RuntimeError("unreachable")
+
+
+def fetch_all(
+    days: Iterable[int] = range(1, 26),
+    max_workers: int = 4,
+    rate: float = 1.0,
+    retries: int = 3,
+    backoff: float = 1.0,
+    url: str = InputUrl,
+    session: Optional[str] = None,
+    store: Optional[InputStore] = None,
+) -> dict[int, str]:
+    """Fetch the inputs of many days concurrently, at most `rate` requests per second.
+    Days that already have a valid input in the store are skipped.
+    Return the outcome of each day: "cached", "fetched", or the error if it failed."""
+    store = store or InputStore()
+    session = session or read_session()
+    limiter = RateLimiter(rate)
+
+    def fetch(day: int) -> str:
+        digest = store.digest(day)
+        if digest and store.is_valid(digest):
+            return "cached"
+        try:
+            raw = download_input(
+                day, session, limiter, url=url, retries=retries, backoff=backoff
+            )
+        except (urllib.error.URLError, OSError) as error:
+            return f"failed: {error}"
+        store.add(day, raw)
+        return "fetched"
+
+    days = list(days)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = dict(zip(days, executor.map(fetch, days)))
+
+    for day, outcome in outcomes.items():
+        print(f"day {day}: {outcome}")
+    return outcomes
 
 
 def interactive():
@@ -0,0 +1,367 @@
+"""Command line of the solutions, see `python -m solutions --help`.
+
+The module of each command is imported in its branch, so that starting one doesn't import the pools,
+sockets and subprocesses of the others. Defaults from those modules are filled in there too.
+"""
+import argparse
+import sys
+
+from solutions.cache import AnswerCache
+from solutions.runner import (
+    format_answers,
+    format_profiles,
+    format_timing_table,
+    parse_day_range,
+    parse_size,
+    run_day,
+    run_days,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m solutions")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="solve the given days in parallel")
+    run_parser.add_argument(
+        "days", nargs="?", default="1-25", help="e.g. 1-25 or 1,3,5-7"
+    )
+    run_parser.add_argument("-w", "--workers", type=int, default=None)
+    run_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="solve again even if the answers are cached",
+    )
+    run_parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="record wall / cpu time, peak memory and counters of each phase, and save them with cProfile stats to DIR",
+    )
+    run_parser.add_argument(
+        "--memory-limit",
+        metavar="SIZE",
+        type=parse_size,
+        help="solve each day in a fresh process with its address space capped to SIZE (e.g. 512M),"
+        " and report the peak memory and largest allocation sites of each phase",
+    )
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="benchmark the given days at several input sizes"
+    )
+    bench_parser.add_argument("days", nargs="?", default="1-25")
+    bench_parser.add_argument(
+        "--scales", default="1,10,100", help="comma separated input size multipliers"
+    )
+    bench_parser.add_argument("--repeat", type=int, default=1)
+    bench_parser.add_argument(
+        "--budget",
+        type=float,
+        help="skip the larger scales of a day that would take longer than this many seconds, 0 for no limit"
+        " (benchmark.DefaultBudget by default)",
+    )
+    bench_parser.add_argument(
+        "--baseline", help="benchmark.DefaultBaselinePath by default"
+    )
+    bench_parser.add_argument("--tolerance", type=float, default=0.25)
+    bench_parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="store this run as the new baseline instead of comparing against it",
+    )
+    bench_parser.add_argument("--json", help="also write the measurements to a file")
+    bench_parser.add_argument(
+        "--startup",
+        action="store_true",
+        help="time importing the CLI, the runner and each day in a fresh interpreter instead",
+    )
+
+    equiv_parser = subparsers.add_parser(
+        "equiv",
+        help="check that the alternate engines of the given days agree with their reference implementation",
+    )
+    equiv_parser.add_argument("days", nargs="?", default="1-25")
+    equiv_parser.add_argument(
+        "--scales",
+        help="comma separated input size multipliers, equivalence.DefaultScales by default",
+    )
+    equiv_parser.add_argument(
+        "--engine",
+        action="append",
+        dest="engines",
+        help="only compare this engine, can be repeated",
+    )
+    equiv_parser.add_argument("--seed", type=int, default=2022)
+    equiv_parser.add_argument(
+        "--history", help="equivalence.DefaultHistoryPath by default"
+    )
+    equiv_parser.add_argument(
+        "--label", help="label of the timings in the history, the git commit by default"
+    )
+    equiv_parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="don't add the timings of this run to the history",
+    )
+
+    subparsers.add_parser(
+        "list", help="list the days and what they provide, without importing them"
+    )
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="solve one day for many input files in parallel"
+    )
+    batch_parser.add_argument("day", type=int)
+    batch_parser.add_argument("paths", nargs="+", metavar="path")
+    batch_parser.add_argument("-w", "--workers", type=int, default=None)
+    batch_parser.add_argument("--no-cache", action="store_true")
+
+    stream_parser = subparsers.add_parser(
+        "stream",
+        help="solve a day from a file of any size, for the days in streaming.StreamingDays",
+    )
+    stream_parser.add_argument("day", type=int)
+    stream_parser.add_argument("path")
+    stream_parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="memory map the file and solve chunks of it in a pool of processes (day 1)",
+    )
+    stream_parser.add_argument("-w", "--workers", type=int, default=None)
+
+    trace_parser = subparsers.add_parser(
+        "trace",
+        help="solve a simulation day (14, 17, 23 or 24) recording sampled frames, and draw the last ones",
+    )
+    trace_parser.add_argument("day", type=int)
+    trace_parser.add_argument("--input", help="the puzzle input by default")
+    trace_parser.add_argument(
+        "--interval", type=int, default=1, help="keep a frame every INTERVAL steps"
+    )
+    trace_parser.add_argument(
+        "--capacity",
+        type=parse_size,
+        default="4M",
+        help="size of the ring buffer of frames",
+    )
+    trace_parser.add_argument(
+        "--stream", action="append", dest="streams", help="only record this stream"
+    )
+    trace_parser.add_argument(
+        "--last", type=int, default=1, help="draw the last LAST frames of each stream"
+    )
+    trace_parser.add_argument(
+        "--viewport",
+        help="top,left,bottom,right in the coordinates of the simulation, the whole frame by default",
+    )
+    trace_parser.add_argument("--palette", help="trace.DefaultPalette by default")
+
+    daemon_parser = subparsers.add_parser(
+        "daemon", help="keep the solutions warm and answer requests on a unix socket"
+    )
+    daemon_parser.add_argument(
+        "--socket", help="daemon.DefaultSocketPath by default, or $AOC_DAEMON_SOCKET"
+    )
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="write a synthetic puzzle input to a file"
+    )
+    generate_parser.add_argument("day", type=int)
+    generate_parser.add_argument(
+        "size", type=int, help="in the unit of that day, see generators.RealSizes"
+    )
+    generate_parser.add_argument("-o", "--output", required=True)
+    generate_parser.add_argument("--seed", type=int, default=2022)
+
+    args = parser.parse_args()
+
+    match args.command:
+        case "run":
+            results = run_days(
+                parse_day_range(args.days),
+                workers=args.workers,
+                profile_dir=args.profile,
+                # profiling is pointless on cached answers
+                cache=None
+                if args.no_cache or args.profile or args.memory_limit
+                else AnswerCache(),
+                memory_limit=args.memory_limit,
+            )
+            print(format_timing_table(results))
+            print()
+            print(format_answers(results))
+            if args.profile or args.memory_limit:
+                print()
+                print(format_profiles(results))
+            if args.profile:
+                print(f"\nprofiles saved to {args.profile}")
+        case "bench" if args.startup:
+            from solutions import benchmark
+
+            modules = ["solutions.__main__", "solutions.runner"] + [
+                f"solutions.day_{day:02}" for day in parse_day_range(args.days)
+            ]
+            print(benchmark.format_startup(benchmark.measure_startup(modules)))
+        case "bench":
+            sys.exit(bench(args))
+        case "equiv":
+            sys.exit(equiv(args))
+        case "list":
+            from solutions import registry
+
+            print(registry.format_days(registry.discover()))
+        case "batch":
+            sys.exit(solve_batch(args))
+        case "stream":
+            from solutions import streaming
+
+            if args.parallel:
+                answers = streaming.solve_file_parallel(
+                    args.day, args.path, args.workers
+                )
+            else:
+                answers = streaming.solve_stream(args.day, args.path)
+            for part, answer in answers.items():
+                print(f"{part.replace('_', ' ')} solution: {answer}")
+        case "trace":
+            sys.exit(trace_day(args))
+        case "daemon":
+            from solutions import daemon
+
+            daemon.serve(args.socket or daemon.DefaultSocketPath)
+        case "generate":
+            from solutions import generators
+
+            written = generators.write_input(
+                args.day, args.output, size=args.size, seed=args.seed
+            )
+            print(f"Saved: {args.output} ({written} bytes)")
+
+
+def solve_batch(args) -> int:
+    from solutions import batch
+
+    def read_inputs():
+        for path in args.paths:
+            with open(path, "r") as f:
+                yield f.read().rstrip("\n")
+
+    failed = 0
+    results = batch.solve_batch(
+        args.day,
+        read_inputs(),
+        workers=args.workers,
+        cache=None if args.no_cache else AnswerCache(),
+    )
+    for index, result in results:
+        failed += result.error is not None
+        print(f"== {args.paths[index]}")
+        print(format_answers([result]))
+
+    return 1 if failed else 0
+
+
+def bench(args) -> int:
+    from solutions import benchmark
+
+    scales = [int(scale) for scale in args.scales.split(",")]
+    baseline_path = args.baseline or benchmark.DefaultBaselinePath
+    measurements = benchmark.run_benchmark(
+        parse_day_range(args.days),
+        scales=scales,
+        repeat=args.repeat,
+        budget=benchmark.DefaultBudget if args.budget is None else args.budget,
+    )
+    print(benchmark.format_report(measurements))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            f.write(benchmark.to_json(measurements))
+
+    if args.save_baseline:
+        benchmark.save_baseline(measurements, baseline_path)
+        print(f"\nbaseline saved: {baseline_path}")
+        return 0
+
+    try:
+        baseline = benchmark.load_baseline(baseline_path)
+    except FileNotFoundError:
+        print(f"\nno baseline at {baseline_path}, run with --save-baseline first")
+        return 0
+
+    regressions = benchmark.find_regressions(
+        measurements, baseline, tolerance=args.tolerance
+    )
+    if regressions:
+        print("\nregressions found:")
+        print("\n".join(regressions))
+        return 1
+
+    print("\nno regression against baseline")
+    return 0
+
+
+def trace_day(args) -> int:
+    from solutions import trace
+
+    raw = None
+    if args.input:
+        with open(args.input, "r") as f:
+            raw = f.read().rstrip("\n")
+    viewport = None
+    if args.viewport:
+        top, left, bottom, right = map(int, args.viewport.split(","))
+        viewport = ((top, left), (bottom, right))
+
+    recorder = trace.Recorder(
+        interval=args.interval,
+        capacity=args.capacity,
+        streams=set(args.streams) if args.streams else None,
+    )
+    with recorder.recording():
+        result = run_day(args.day, raw)
+
+    streams = dict.fromkeys(frame.stream for frame in recorder.frames)
+    for stream in streams:
+        for frame in recorder.frames_of(stream)[-args.last :]:
+            print(f"== {stream} at step {frame.step}")
+            print(
+                recorder.render(frame, viewport, args.palette or trace.DefaultPalette)
+            )
+    print(format_answers([result]))
+    return 1 if result.error else 0
+
+
+def equiv(args) -> int:
+    from solutions import equivalence
+
+    scales = (
+        [float(scale) for scale in args.scales.split(",")]
+        if args.scales
+        else list(equivalence.DefaultScales)
+    )
+    history_path = args.history or equivalence.DefaultHistoryPath
+    comparisons = [
+        comparison
+        for day in parse_day_range(args.days)
+        for comparison in equivalence.compare_day(
+            day, scales=scales, engines=args.engines, seed=args.seed
+        )
+    ]
+    if not comparisons:
+        print("no alternate engines to compare")
+        return 0
+    print(equivalence.format_comparisons(comparisons))
+
+    if not args.no_history:
+        equivalence.append_history(comparisons, history_path, label=args.label)
+        print(f"\ntimings added to {history_path}")
+
+    mismatched = [c for c in comparisons if c.mismatches]
+    if mismatched:
+        print(f"\n{len(mismatched)} mismatches found")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Solve one day for many inputs.
+
+Each worker process imports the day once and runs the optional `warm_up()` of the day module,
+which builds the input independent tables (e.g. the rock shapes of day 17), so every input after that is solved warm.
+Results are yielded in the order they finish.
+"""
+from typing import Iterable, Iterator, Optional
+
+from solutions.cache import AnswerCache
+from solutions.runner import (
+    DayResult,
+    clear_instance_caches,
+    day_module,
+    run_day,
+    solver_for_day,
+)
+
+
+def warm_up(day: int):
+    solver_for_day(day)
+    module_warm_up = getattr(day_module(day), "warm_up", None)
+    if module_warm_up:
+        module_warm_up()
+
+
+def solve(day: int, raw: str, cache: Optional[AnswerCache]) -> DayResult:
+    result = run_day(day, raw, cache=cache)
+    clear_instance_caches(day)
+    return result
+
+
+def solve_batch(
+    day: int,
+    inputs: Iterable[str],
+    workers: Optional[int] = None,
+    cache: Optional[AnswerCache] = None,
+) -> Iterator[tuple[int, DayResult]]:
+    "Yield (index of input, result) as soon as each input is solved"
+    # imported here, as it takes longer to import than solving most days
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=warm_up, initargs=(day,)
+    ) as executor:
+        futures = {
+            executor.submit(solve, day, raw, cache): index
+            for index, raw in enumerate(inputs)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
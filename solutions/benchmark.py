@@ -0,0 +1,271 @@
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+from solutions.generators import RealSizes, generate
+from solutions.registry import HeavyModules
+from solutions.runner import Phases, solver_for_day
+
+DefaultScales = (1, 10, 100)
+# the largest scale of days that already take minutes at 1x
+MaxScales = {11: 1, 16: 1}
+# seconds a day may take at one scale, larger scales that would take longer are skipped
+DefaultBudget = 60.0
+# how running time is assumed to grow with the input size of a day measured at a single scale
+UnknownExponent = 2
+DefaultBaselinePath = "benchmarks/baseline.json"
+
+
+@dataclass
+class Measurement:
+    day: int
+    scale: int
+    input_bytes: int
+    seconds: dict[str, float] = field(default_factory=dict)
+    # why the scale wasn't measured, empty when it was
+    skipped: str = ""
+
+    def throughput(self, phase: str) -> float:
+        "Input bytes processed per second in the given phase"
+        return self.input_bytes / max(self.seconds[phase], 1e-9)
+
+
+def benchmark_input(day: int, scale: int, seed: int = 2022) -> str:
+    "Generate a synthetic input of `scale` times the size of the official puzzle input"
+    return generate(day, RealSizes[day] * scale, seed=seed)
+
+
+def measure(day: int, raw: str, scale: int, repeat: int = 1) -> Measurement:
+    """Time each phase of a day on the given input. Take the best of `repeat` runs to reduce noise.
+    As in run_day, parse is the time of both parses, part two parsing the input again."""
+    solver = solver_for_day(day)
+    measurement = Measurement(day=day, scale=scale, input_bytes=len(raw.encode()))
+
+    steps = [("part_one", solver.parse, solver.part_one)]
+    if solver.part_two is not None:
+        steps.append(
+            ("part_two", solver.parse_part_two or solver.parse, solver.part_two)
+        )
+
+    for _ in range(repeat):
+        parse_time = 0.0
+        for part, parse, solve in steps:
+            start = time.perf_counter()
+            parsed = parse(raw)
+            parse_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            solve(parsed)
+            solve_time = time.perf_counter() - start
+
+            measurement.seconds[part] = min(
+                solve_time, measurement.seconds.get(part, math.inf)
+            )
+        measurement.seconds["parse"] = min(
+            parse_time, measurement.seconds.get("parse", math.inf)
+        )
+
+    return measurement
+
+
+def scaling_exponent(measurements: list[Measurement], phase: str) -> Optional[float]:
+    """Fit time ~ size^k on a log-log scale with least squares and return k.
+    k close to 1 means linear, 2 means quadratic, etc."""
+    points = [
+        (math.log(m.input_bytes), math.log(max(m.seconds[phase], 1e-9)))
+        for m in measurements
+        if phase in m.seconds
+    ]
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return covariance / variance
+
+
+def run_benchmark(
+    days: list[int],
+    scales=DefaultScales,
+    repeat: int = 1,
+    budget: Optional[float] = DefaultBudget,
+    max_scales: dict[int, int] = MaxScales,
+) -> list[Measurement]:
+    """Measure each day from its smallest scale up.
+    Scales over max_scales of the day, or that are estimated to take over budget seconds, are skipped
+    and reported as such."""
+    measurements = []
+    for day in days:
+        measured = []
+        for scale in sorted(scales):
+            reason = skip_reason(day, scale, measured, repeat, budget, max_scales)
+            if reason:
+                measurements.append(Measurement(day, scale, 0, skipped=reason))
+                continue
+            measured.append(
+                measure(day, benchmark_input(day, scale), scale, repeat=repeat)
+            )
+            measurements.append(measured[-1])
+    return measurements
+
+
+def skip_reason(
+    day: int,
+    scale: int,
+    measured: list[Measurement],
+    repeat: int,
+    budget: Optional[float],
+    max_scales: dict[int, int],
+) -> str:
+    if scale > max_scales.get(day, scale):
+        return f"over the largest scale of day {day}, {max_scales[day]}x"
+    if not budget or not measured:
+        return ""
+
+    # extrapolate from the last two scales measured, assuming quadratic time until there are two of them
+    last_two = measured[-2:]
+    seconds = [sum(m.seconds.values()) for m in last_two]
+    exponent = UnknownExponent
+    if len(last_two) == 2 and min(seconds) > 0:
+        exponent = math.log(seconds[1] / seconds[0]) / math.log(
+            last_two[1].scale / last_two[0].scale
+        )
+    estimate = seconds[-1] * repeat * (scale / measured[-1].scale) ** max(exponent, 1)
+    if estimate > budget:
+        return f"would take about {estimate:.0f}s, over the budget of {budget:.0f}s"
+    return ""
+
+
+def baseline_key(measurement: Measurement, phase: str) -> str:
+    return f"day_{measurement.day:02}/x{measurement.scale}/{phase}"
+
+
+def to_baseline(measurements: list[Measurement]) -> dict[str, float]:
+    return {
+        baseline_key(m, phase): seconds
+        for m in measurements
+        for phase, seconds in m.seconds.items()
+    }
+
+
+def save_baseline(measurements: list[Measurement], path: str = DefaultBaselinePath):
+    baseline = load_baseline(path) if os.path.exists(path) else {}
+    baseline.update(to_baseline(measurements))
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str = DefaultBaselinePath) -> dict[str, float]:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def find_regressions(
+    measurements: list[Measurement],
+    baseline: dict[str, float],
+    tolerance: float = 0.25,
+    min_seconds: float = 0.005,
+) -> list[str]:
+    """List the phases that got slower than the baseline by more than `tolerance`.
+    Phases that take less than `min_seconds` are ignored, as they are dominated by timer noise."""
+    regressions = []
+    for m in measurements:
+        for phase, seconds in m.seconds.items():
+            key = baseline_key(m, phase)
+            if key not in baseline:
+                continue
+            allowed = max(baseline[key] * (1 + tolerance), min_seconds)
+            if seconds > allowed:
+                regressions.append(
+                    f"{key}: {seconds * 1000:.1f}ms > baseline {baseline[key] * 1000:.1f}ms"
+                )
+    return regressions
+
+
+def format_report(measurements: list[Measurement]) -> str:
+    header = f"{'day':>3} | {'scale':>5} | {'phase':>8} | {'time':>10} | {'MB/s':>8}"
+    rows = [header, "-" * len(header)]
+    for m in measurements:
+        if m.skipped:
+            rows.append(f"{m.day:>3} | {m.scale:>4}x | skipped: {m.skipped}")
+        for phase in Phases:
+            if phase not in m.seconds:
+                continue
+            rows.append(
+                f"{m.day:>3} | {m.scale:>4}x | {phase:>8} | "
+                f"{m.seconds[phase] * 1000:>8.1f}ms | {m.throughput(phase) / 1e6:>8.2f}"
+            )
+
+    rows.append("")
+    rows.append("scaling exponents (time ~ size^k)")
+    for day in sorted({m.day for m in measurements}):
+        of_day = [m for m in measurements if m.day == day]
+        exponents = {phase: scaling_exponent(of_day, phase) for phase in Phases}
+        fmt = ", ".join(
+            f"{phase}={k:.2f}" for phase, k in exponents.items() if k is not None
+        )
+        rows.append(f"day {day}: {fmt or 'single size only'}")
+
+    return "\n".join(rows)
+
+
+def to_json(measurements: list[Measurement]) -> str:
+    return json.dumps([asdict(m) for m in measurements], indent=2)
+
+
+@dataclass
+class StartupMeasurement:
+    module: str
+    seconds: float
+    heavy_imports: list[str]
+
+
+StartupScript = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+print(",".join(sorted(set(sys.modules) & {heavy!r})))
+"""
+
+
+def measure_startup(modules: list[str], repeat: int = 3) -> list[StartupMeasurement]:
+    """Time importing each module in a fresh interpreter, best of `repeat` runs,
+    and list the heavy modules it loaded. The start up of the interpreter itself is not counted."""
+    measurements = []
+    for module in modules:
+        script = StartupScript.format(module=module, heavy=set(HeavyModules))
+        best, heavy = math.inf, []
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=os.path.dirname(os.path.dirname(__file__)),
+            ).stdout.split("\n")
+            best = min(best, float(output[0]))
+            heavy = [name for name in output[1].split(",") if name]
+        measurements.append(StartupMeasurement(module, best, heavy))
+    return measurements
+
+
+def format_startup(measurements: list[StartupMeasurement]) -> str:
+    header = f"{'module':<22} | {'import':>10} | heavy imports"
+    rows = [header, "-" * len(header)]
+    for m in measurements:
+        rows.append(
+            f"{m.module:<22} | {m.seconds * 1000:>8.1f}ms | {', '.join(m.heavy_imports)}".rstrip()
+        )
+    return "\n".join(rows)
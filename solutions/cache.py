@@ -0,0 +1,103 @@
+"""On-disk cache of answers.
+
+An answer is keyed by the day, the part, the SHA-256 of the input and the SHA-256 of the source of the day's module,
+of the solutions modules it imports (e.g. grid.py) and of the way `runner.solver_for_day` adapts it (e.g. the y of
+day 15), so editing a solution or changing the input never gives a stale answer.
+The source digest is computed once per day in a process.
+When the cache grows over max_bytes, the least recently used answers are evicted.
+"""
+import functools
+import json
+import numbers
+import os
+from typing import Any, Callable, Optional
+
+from solutions.inputs import digest_of
+
+DefaultRoot = os.environ.get("AOC_CACHE_DIR", os.path.join(".cache", "answers"))
+DefaultMaxBytes = 1 << 20
+
+
+@functools.cache
+def source_digest(day: int) -> str:
+    "Digest of the source of the day, of every solutions module it imports, lazily or not, and of its adapter"
+    # imported here, as parsing sources with ast takes longer than importing most days
+    from solutions.registry import adapter_source, solution_sources
+
+    sources = []
+    for path in solution_sources(f"solutions.day_{day:02}"):
+        with open(path, "rb") as f:
+            sources.append(f"{os.path.basename(path)}:{digest_of(f.read())}")
+    sources.append(f"adapter:{digest_of(adapter_source(day).encode())}")
+    return digest_of("\n".join(sources).encode())
+
+
+class AnswerCache:
+    def __init__(self, root: str = DefaultRoot, max_bytes: int = DefaultMaxBytes):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def key(self, day: int, part: str, raw: str) -> str:
+        return digest_of(
+            f"{day}/{part}/{digest_of(raw.encode())}/{source_digest(day)}".encode()
+        )
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, f"{key}.json")
+
+    def get(self, day: int, part: str, raw: str) -> Optional[Any]:
+        path = self.path(self.key(day, part, raw))
+        try:
+            with open(path, "r") as f:
+                answer = json.load(f)["answer"]
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+        # mark as recently used
+        os.utime(path)
+        return answer
+
+    def put(self, day: int, part: str, raw: str, answer: Any):
+        "Save an answer. Only integers and strings are cached."
+        if isinstance(answer, numbers.Integral) and not isinstance(answer, bool):
+            answer = int(answer)
+        elif not isinstance(answer, str):
+            return
+
+        os.makedirs(self.root, exist_ok=True)
+        path = self.path(self.key(day, part, raw))
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"day": day, "part": part, "answer": answer}, f)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        "Remove the least recently used answers until the cache fits in max_bytes"
+        entries = []
+        for entry in os.scandir(self.root):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # already evicted by another process
+                pass
+            total -= size
+
+    def answer(self, day: int, part: str, raw: str, solve: Callable[[], Any]) -> Any:
+        "Return the cached answer, or solve and cache it"
+        answer = self.get(day, part, raw)
+        if answer is None:
+            answer = solve()
+            self.put(day, part, raw, answer)
+        return answer
+
+
+def cached_answer(day: int, part: str, raw: str, solve: Callable[[], Any]) -> Any:
+    return AnswerCache().answer(day, part, raw, solve)
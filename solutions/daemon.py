@@ -0,0 +1,123 @@
+"""A long-lived solver, answering requests over a Unix socket.
+
+All day modules are imported and warmed up once at start, so a request pays neither the interpreter start up
+nor the numpy import. The protocol is one JSON object per line, both ways:
+
+    -> {"day": 1, "part": "part_one", "input": "1000\\n2000"}
+    <- {"answer": 3000}
+    <- {"error": "Traceback ..."}
+
+Requests are answered one at a time, as the solutions keep state in modules (e.g. the monkeys of day 11).
+Recent answers are kept in memory, caches of methods keyed by the parsed input are cleared after each request,
+and module caches keyed by parts of the input have a maxsize, so the memory used stays bounded however many
+inputs are solved (see `runner.clear_instance_caches`).
+"""
+import json
+import numbers
+import os
+import socket
+import socketserver
+import tempfile
+import traceback
+from collections import OrderedDict
+from typing import Any
+
+from solutions.batch import warm_up
+from solutions.inputs import digest_of
+from solutions.runner import AllDays, Solver, clear_instance_caches, solver_for_day
+
+DefaultSocketPath = os.environ.get(
+    "AOC_DAEMON_SOCKET", os.path.join(tempfile.gettempdir(), "aoc2022.sock")
+)
+DefaultMaxAnswers = 4096
+
+
+def to_json(value: Any) -> Any:
+    "Answers may be numpy integers"
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    return str(value)
+
+
+class Solvers:
+    def __init__(self, max_answers: int = DefaultMaxAnswers):
+        for day in AllDays:
+            warm_up(day)
+        self.solvers: dict[int, Solver] = {day: solver_for_day(day) for day in AllDays}
+        self.answers: OrderedDict[tuple[int, str, str], Any] = OrderedDict()
+        self.max_answers = max_answers
+
+    def solve(self, day: int, part: str, raw: str) -> Any:
+        key = (day, part, digest_of(raw.encode()))
+        if key in self.answers:
+            self.answers.move_to_end(key)
+            return self.answers[key]
+
+        solver = self.solvers[day]
+        try:
+            match part:
+                case "part_one":
+                    answer = solver.part_one(solver.parse(raw))
+                case "part_two" if solver.part_two:
+                    parse = solver.parse_part_two or solver.parse
+                    answer = solver.part_two(parse(raw))
+                case _:
+                    raise ValueError(f"day {day} has no {part}")
+        finally:
+            clear_instance_caches(day)
+
+        self.answers[key] = answer
+        if len(self.answers) > self.max_answers:
+            self.answers.popitem(last=False)
+        return answer
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    server: "SolverServer"
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                answer = self.server.solvers.solve(
+                    int(request["day"]), request["part"], request["input"]
+                )
+                response = {"answer": answer}
+            except Exception:
+                response = {"error": traceback.format_exc()}
+            self.wfile.write(json.dumps(response, default=to_json).encode() + b"\n")
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: str = DefaultSocketPath, solvers=None):
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        self.solvers = solvers or Solvers()
+        super().__init__(socket_path, RequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        os.remove(self.server_address)
+
+
+def ask(day: int, part: str, raw: str, socket_path: str = DefaultSocketPath) -> Any:
+    "Ask a running daemon for an answer"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        request = {"day": day, "part": part, "input": raw}
+        client.sendall(json.dumps(request).encode() + b"\n")
+        with client.makefile("rb") as f:
+            response = json.loads(f.readline())
+
+    if "error" in response:
+        raise RuntimeError(response["error"])
+    return response["answer"]
+
+
+def serve(socket_path: str = DefaultSocketPath):
+    with SolverServer(socket_path) as server:
+        print(f"listening on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
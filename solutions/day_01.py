@@ -1,28 +1,145 @@
-import aoc_helper
+import heapq
+import itertools
+import mmap
+import os
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
-raw = aoc_helper.fetch(1, 2022)
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
+from solutions.parsing import scan
 
+if TYPE_CHECKING:
+    import numpy as np
 
-def parse_raw(raw_input: str) -> list[list[int]]:
-    elves = raw_input.split("\n\n")
-    elves_calories = [[int(line) for line in elf.split("\n")] for elf in elves]
-    return elves_calories
+TopK = 3
+# bytes of input summed by a worker at a time. Summing a chunk takes about 14 times its size in memory.
+ChunkSize = 8 << 20
 
 
-def part_one(data: list[list[int]]) -> int:
-    return max(sum(elf) for elf in data)
+def parse_lines(lines: Iterable[str]) -> Iterator[int]:
+    for not_blank, elf in itertools.groupby(lines, key=bool):
+        if not_blank:
+            yield sum(int(line) for line in elf)
 
 
-def part_two(data: list[list[int]]) -> int:
-    elves_sorted = sorted((sum(elf) for elf in data), reverse=True)
-    return sum(elves_sorted[:3])
+def parse_raw(raw_input: str) -> list[int]:
+    return list(parse_lines(raw_input.split("\n")))
+
+
+def elf_totals(data: str | bytes) -> "np.ndarray":
+    "All the numbers in one array, summed per elf with np.add.reduceat"
+    import numpy as np
+
+    if isinstance(data, str):
+        data = data.encode()
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    values, starts = scan(buffer, signed=False)
+    if len(values) == 0:
+        return values
+
+    newline = buffer == ord("\n")
+    blank_lines = np.flatnonzero(newline[1:] & newline[:-1])
+    # index of the first number of each elf, several blank lines in a row giving the same index
+    offsets = np.concatenate([[0], np.searchsorted(starts, blank_lines)])
+    offsets = offsets[offsets < len(values)]
+    offsets = offsets[np.concatenate([[True], offsets[1:] != offsets[:-1]])]
+    return np.add.reduceat(values, offsets)
+
+
+def top_k(totals: "np.ndarray", k: int = TopK) -> list[int]:
+    "The k largest totals, in no particular order, with np.partition"
+    import numpy as np
+
+    if k >= len(totals):
+        return totals.tolist()
+    return np.partition(totals, len(totals) - k)[-k:].tolist()
+
+
+def part_one(totals: Iterable[int]) -> int:
+    return max(totals)
+
+
+def part_two(totals: Iterable[int], k: int = TopK) -> int:
+    return sum(heapq.nlargest(k, totals))
+
+
+def solve_numpy(raw: str, k: int = TopK) -> dict[str, int]:
+    "Both parts from the totals of the elves, summed with numpy"
+    largest = top_k(elf_totals(raw), k)
+    return {"part_one": max(largest), "part_two": sum(largest)}
+
+
+def chunk_bounds(
+    data: bytes | mmap.mmap, chunk_size: int = ChunkSize
+) -> list[tuple[int, int]]:
+    "Split data in (start, end) chunks of about chunk_size bytes, cut at blank lines so that every elf is in one chunk"
+    bounds = []
+    start = 0
+    while start < len(data):
+        end = start + chunk_size
+        if end < len(data):
+            # the "\n\n" may start just before end
+            blank_line = data.find(b"\n\n", end - 1)
+            end = len(data) if blank_line == -1 else blank_line + 1
+        bounds.append((start, min(end, len(data))))
+        start = end
+    return bounds
+
+
+def chunk_top_k(path: str, start: int, end: int, k: int) -> list[int]:
+    "The k largest totals of the elves in a chunk of a file"
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return top_k(elf_totals(mapped[start:end]), k)
+
+
+def solve_file(
+    path: str,
+    workers: Optional[int] = None,
+    chunk_size: int = ChunkSize,
+    k: int = TopK,
+) -> dict[str, int]:
+    """Both parts for a file of any size, in chunks summed by a pool of processes.
+    The file is memory mapped, and each worker only holds its chunk and the top k totals of it,
+    which are merged at the end."""
+    if os.path.getsize(path) == 0:
+        raise ValueError(f"{path} is empty")
+
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            bounds = chunk_bounds(mapped, chunk_size)
+
+    if len(bounds) == 1 or workers == 1:
+        chunks = [chunk_top_k(path, start, end, k) for start, end in bounds]
+    else:
+        # imported here, as it takes longer to import than solving small inputs
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(
+                executor.map(
+                    chunk_top_k,
+                    itertools.repeat(path),
+                    *zip(*bounds),
+                    itertools.repeat(k),
+                )
+            )
+
+    largest = heapq.nlargest(k, itertools.chain.from_iterable(chunks))
+    return {"part_one": largest[0], "part_two": sum(largest)}
+
+
+Engines = {"numpy": solve_numpy}
 
 
 if __name__ == "__main__":
     day = 1
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
@@ -1,8 +1,35 @@
-import aoc_helper
+import itertools
+from typing import Iterable, Iterator
 
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
 
-def parse_raw(raw: str) -> list[tuple[str, str]]:
-    return [tuple(line.split(" ")) for line in raw.split("\n")]
+Round = tuple[str, str]
+# how many times each round is played
+RoundCounts = dict[Round, int]
+
+
+def parse_lines(lines: Iterable[str]) -> Iterator[Round]:
+    return (tuple(line.split(" ")) for line in lines)
+
+
+def parse_raw(raw: str) -> list[Round]:
+    return list(parse_lines(raw.split("\n")))
+
+
+def count_rounds(raw: str | bytes) -> RoundCounts:
+    "Count each of the nine possible lines in the raw bytes, without a Python object per round"
+    data = raw.encode() if isinstance(raw, str) else raw
+    counts = {
+        (opponent, player): data.count(f"{opponent} {player}".encode())
+        for opponent, player in itertools.product("ABC", "XYZ")
+    }
+
+    # every line is 3 bytes and a newline
+    rounds = sum(counts.values())
+    if len(data.rstrip(b"\n")) != max(4 * rounds - 1, 0):
+        raise ValueError(f"found {rounds} rounds, but not every line is a round")
+    return counts
 
 
 def win_lose_score(opponent: str, player: str) -> int:
@@ -38,7 +65,7 @@ def round_score(opponent: str, player: str) -> int:
     return win_lose_score(opponent, player) + shape_score(player)
 
 
-def part_one(data: list[tuple[str, str]]):
+def part_one(data: Iterable[Round]):
     return sum(round_score(*combination) for combination in data)
 
 
@@ -48,15 +75,38 @@ def round_score_part_two(opponent: str, winlose: str) -> int:
     )
 
 
-def part_two(data: list[tuple[str, str]]):
+def part_two(data: Iterable[Round]):
     return sum(round_score_part_two(*combination) for combination in data)
 
 
+# the score of each of the nine possible rounds
+ScoresPartOne = {r: round_score(*r) for r in itertools.product("ABC", "XYZ")}
+ScoresPartTwo = {r: round_score_part_two(*r) for r in itertools.product("ABC", "XYZ")}
+
+
+def table_score(counts: RoundCounts, scores: dict[Round, int]) -> int:
+    return sum(count * scores[r] for r, count in counts.items())
+
+
+def solve_counts(raw: str) -> dict[str, int]:
+    "Both parts from how many times each of the nine rounds is played"
+    counts = count_rounds(raw)
+    return {
+        "part_one": table_score(counts, ScoresPartOne),
+        "part_two": table_score(counts, ScoresPartTwo),
+    }
+
+
+Engines = {"counts": solve_counts}
+
+
 if __name__ == "__main__":
     day = 2
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
@@ -1,45 +1,158 @@
+import string
 from functools import reduce
+from operator import and_
+from typing import TYPE_CHECKING, Iterable, Iterator
 
-import aoc_helper
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# in order of priority
+Items = string.ascii_lowercase + string.ascii_uppercase
+# the bit of each byte in an item mask, bit priority - 1 for items and none for other bytes
+ItemBits = tuple(
+    1 << Items.index(chr(byte)) if chr(byte) in Items else 0 for byte in range(256)
+)
+AllItems = (1 << len(Items)) - 1
+
+
+def parse_lines(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    return ((line[0 : (len(line) // 2)], line[len(line) // 2 :]) for line in lines)
+
+
+def parse_lines_part_two(lines: Iterable[str]) -> Iterator[tuple[str, str, str]]:
+    lines = iter(lines)
+    return zip(lines, lines, lines)
 
 
 def parse_raw(raw: str) -> list[tuple[str, str]]:
-    return [
-        (line[0 : (len(line) // 2)], line[len(line) // 2 :]) for line in raw.split("\n")
-    ]
+    return list(parse_lines(raw.split("\n")))
 
 
 def parse_raw_part_two(raw: str) -> list[tuple[str, str, str]]:
-    lines = raw.split("\n")
-    return [tuple(lines[i * 3 : i * 3 + 3]) for i in range(len(lines) // 3)]
+    return list(parse_lines_part_two(raw.split("\n")))
+
+
+def item_mask(items: str) -> int:
+    "The items as a 52-bit mask, with bit priority - 1 set for each item"
+    mask = 0
+    for byte in items.encode():
+        mask |= ItemBits[byte]
+    return mask
 
 
-def find_repeat_item(*groups: list[str]) -> str:
-    intersect = reduce(lambda a, b: a & b, [set(group) for group in groups])
-    if len(intersect) != 1:
-        raise ValueError
-    return intersect.pop()
+def mask_priority(mask: int) -> int:
+    "The priority of the only item in mask"
+    if mask == 0 or mask & (mask - 1):
+        raise ValueError(f"expected a single item, got {mask:052b}")
+    return mask.bit_length()
+
+
+def find_repeat_item(*groups: str) -> str:
+    return Items[common_priority(groups) - 1]
+
+
+def common_priority(groups: Iterable[str]) -> int:
+    return mask_priority(reduce(and_, map(item_mask, groups)))
 
 
 def item_priority(char: str) -> int:
-    return ord(char.lower()) - ord("a") + (27 if char.isupper() else 1)
+    return mask_priority(ItemBits[ord(char)])
+
+
+def solve_lines(lines: Iterable[str]) -> dict[str, int]:
+    "Both parts in a single pass over the lines, holding only the group being read"
+    one = two = 0
+    group, members = AllItems, 0
+    for line in lines:
+        half = len(line) // 2
+        first, second = item_mask(line[:half]), item_mask(line[half:])
+        one += mask_priority(first & second)
+
+        group &= first | second
+        members += 1
+        if members == 3:
+            two += mask_priority(group)
+            group, members = AllItems, 0
+
+    return {"part_one": one, "part_two": two}
+
+
+def line_masks(data: str | bytes, halves: bool = False) -> "np.ndarray":
+    "The item mask of every line, or of both halves of every line, with numpy"
+    import numpy as np
+
+    if isinstance(data, str):
+        data = data.encode()
+
+    buffer = np.frombuffer(data + b"\n", dtype=np.uint8)
+    ends = np.flatnonzero(buffer == ord("\n"))
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    if halves:
+        starts = np.stack([starts, (starts + ends) // 2], axis=1).ravel()
+
+    # newlines have no bit, so that each segment can run up to the next start
+    bits = np.array(ItemBits, dtype=np.uint64)[buffer]
+    masks = np.bitwise_or.reduceat(bits, starts)
+    # reduceat gives the first byte instead of nothing for empty segments
+    masks[np.diff(starts, append=len(buffer)) == 0] = 0
+    return masks
+
+
+def compartment_masks(data: str | bytes) -> "np.ndarray":
+    "The item masks of both compartments of every rucksack, a row per rucksack"
+    return line_masks(data, halves=True).reshape(-1, 2)
+
+
+def group_masks(data: str | bytes) -> "np.ndarray":
+    "The item masks of every group of three rucksacks, a row per group, leaving out an incomplete last group"
+    masks = line_masks(data)
+    return masks[: len(masks) - len(masks) % 3].reshape(-1, 3)
+
+
+def common_priorities(masks: "np.ndarray") -> "np.ndarray":
+    "The priority of the item common to each row of masks"
+    import numpy as np
+
+    common = np.bitwise_and.reduce(masks, axis=1)
+    if (common == 0).any() or (common & (common - np.uint64(1))).any():
+        raise ValueError("expected a single common item in every row")
+    # the exponent of a power of two is its bit length
+    return np.frexp(common.astype(np.float64))[1]
+
+
+def part_one(rucksacks: Iterable[tuple[str, str]]):
+    return sum(common_priority(rucksack) for rucksack in rucksacks)
+
+
+def part_two(groups: Iterable[tuple[str, str, str]]):
+    return sum(common_priority(group) for group in groups)
 
 
-def part_one(rucksacks: list[tuple[str, str]]):
-    return sum(item_priority(find_repeat_item(*rucksack)) for rucksack in rucksacks)
+def solve_numpy(raw: str) -> dict[str, int]:
+    "Both parts from the item masks of every line, with numpy"
+    return {
+        "part_one": int(common_priorities(compartment_masks(raw)).sum()),
+        "part_two": int(common_priorities(group_masks(raw)).sum()),
+    }
 
 
-def part_two(groups: list[tuple[str, str, str]]):
-    return sum(item_priority(find_repeat_item(*group)) for group in groups)
+Engines = {"numpy": solve_numpy}
 
 
 if __name__ == "__main__":
 
     day = 3
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
     parsed_data_part_two = parse_raw_part_two(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data_part_two)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(
+        day, "part_two", raw_data, lambda: part_two(parsed_data_part_two)
+    )
+    print(f"part two solution: {answer}")
@@ -1,13 +1,27 @@
 import re
+from typing import TYPE_CHECKING, Iterable, Iterator
 
-import aoc_helper
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
+from solutions.parsing import int_lists, int_records
 
+if TYPE_CHECKING:
+    import numpy as np
 
-def parse_raw(raw: str) -> list[list[tuple[int, int]]]:
-    lines = raw.split("\n")
+    from solutions.intervals import IntervalIndex
+
+# pairs of (first, last) sections
+Assignments = Iterable[list[tuple[int, int]]]
+
+
+def parse_lines(lines: Iterable[str]) -> Iterator[list[tuple[int, int]]]:
     extract_numbers = map(lambda line: re.findall(r"\d+", line), lines)
-    convert_to_int = [[int(num) for num in line] for line in extract_numbers]
-    return [[tuple(nums[0:2]), tuple(nums[2:4])] for nums in convert_to_int]
+    convert_to_int = ([int(num) for num in line] for line in extract_numbers)
+    return ([tuple(nums[0:2]), tuple(nums[2:4])] for nums in convert_to_int)
+
+
+def parse_raw(raw: str) -> list[list[tuple[int, int]]]:
+    return [[(a, b), (c, d)] for a, b, c, d in int_lists(raw, 4)]
 
 
 def find_overlap(a: tuple[int, int], b: tuple[int, int]):
@@ -16,20 +30,53 @@ def find_overlap(a: tuple[int, int], b: tuple[int, int]):
     return None if left > right else (left, right)
 
 
-def part_one(data: list[list[tuple[int, int]]]) -> int:
+def contains(pairs: "np.ndarray") -> "np.ndarray":
+    "Whether one range of each pair contains the other"
+    a, b, c, d = pairs.T
+    return ((a <= c) & (d <= b)) | ((c <= a) & (b <= d))
+
+
+def overlaps(pairs: "np.ndarray") -> "np.ndarray":
+    "Whether the ranges of each pair have a section in common"
+    a, b, c, d = pairs.T
+    return (a <= d) & (c <= b)
+
+
+def part_one(data: Assignments) -> int:
     return sum(1 for pair in data if find_overlap(*pair) in pair)
 
 
-def part_two(data: list[list[tuple[int, int]]]) -> int:
+def part_two(data: Assignments) -> int:
     return sum(1 for pair in data if find_overlap(*pair))
 
 
+def assignment_index(data: Assignments) -> "IntervalIndex":
+    "Index the assignments of all the elves, the elves of pair p being 2 * p and 2 * p + 1"
+    from solutions.intervals import IntervalIndex
+
+    return IntervalIndex([assignment for pair in data for assignment in pair])
+
+
+def solve_numpy(raw: str) -> dict[str, int]:
+    "Both parts from the section bounds parsed straight into an array"
+    pairs = int_records(raw, 4, signed=False)
+    return {
+        "part_one": int(contains(pairs).sum()),
+        "part_two": int(overlaps(pairs).sum()),
+    }
+
+
+Engines = {"numpy": solve_numpy}
+
+
 if __name__ == "__main__":
 
     day = 4
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
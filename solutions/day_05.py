@@ -1,6 +1,6 @@
-import re
-
-import aoc_helper
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
+from solutions.parsing import int_lists
 
 
 def parse_raw(raw: str) -> dict:
@@ -17,10 +17,7 @@ def parse_raw(raw: str) -> dict:
         for stack in crates_reversed_order
     ]
 
-    instructions = [
-        tuple(map(int, re.findall(r"\d+", line)))
-        for line in instruction_raw.split("\n")
-    ]
+    instructions = [tuple(numbers) for numbers in int_lists(instruction_raw, 3)]
 
     return {"crates": crates, "instructions": instructions}
 
@@ -64,11 +61,13 @@ if __name__ == "__main__":
 
     day = 5
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
 
     # parse the data again as part one mutates the crates
     parsed_data = parse_raw(raw_data)
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
@@ -1,4 +1,5 @@
-import aoc_helper
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
 
 
 def find_start_of_unique_set(size: int, data: str) -> int:
@@ -19,7 +20,9 @@ if __name__ == "__main__":
 
     day = 6
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
 
-    print(f"part one solution: {part_one(raw_data)}")
-    print(f"part two solution: {part_two(raw_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(raw_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(raw_data))
+    print(f"part two solution: {answer}")
@@ -1,7 +1,8 @@
 import re
 from functools import cached_property
 
-import aoc_helper
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
 
 
 class Directory:
@@ -96,8 +97,10 @@ if __name__ == "__main__":
 
     day = 7
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
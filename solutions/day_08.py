@@ -1,8 +1,11 @@
 import itertools
 
-import aoc_helper
 import numpy as np
 
+from solutions.cache import cached_answer
+from solutions.grid import Grid, unit_vectors
+from solutions.inputs import load_input
+
 
 def parse_raw(raw: str) -> np.ndarray:
     return np.array([[int(digit) for digit in line] for line in raw.split("\n")])
@@ -43,30 +46,45 @@ def count_trees_saw(grid: np.ndarray, x: int, y: int) -> list[int]:
     return counts
 
 
+def look_in_four_directions(grid: np.ndarray) -> list[tuple[np.ndarray, np.ndarray]]:
+    """For every tree at once, look in each direction: how many trees are seen, and whether the view reaches the edge.
+    Looking k trees away is a view of the grid shifted by k, so the loop is over distances rather than trees."""
+    heights = Grid(grid, fill=-1)
+    inside = Grid(np.ones_like(grid, dtype=bool), fill=False)
+    results = []
+
+    for dy, dx in unit_vectors(2):
+        seen = np.zeros(grid.shape, dtype=int)
+        blocked = np.zeros(grid.shape, dtype=bool)
+        for k in range(1, max(grid.shape)):
+            delta = (-dy * k, -dx * k)
+            seen += inside.shifted(delta) & ~blocked
+            blocked |= heights.shifted(delta) >= grid
+        results.append((seen, ~blocked))
+
+    return results
+
+
 def part_one(grid: np.ndarray) -> int:
-    return sum(
-        1
-        for y in range(grid.shape[0])
-        for x in range(grid.shape[1])
-        if is_visible(grid, x, y)
+    visible = np.logical_or.reduce(
+        [to_edge for _, to_edge in look_in_four_directions(grid)]
     )
+    return int(np.count_nonzero(visible))
 
 
 def part_two(grid: np.ndarray) -> int:
-
-    return max(
-        np.prod(a=count_trees_saw(grid, x, y), dtype=int)
-        for y in range(grid.shape[0])
-        for x in range(grid.shape[1])
-    )
+    scores = np.prod([seen for seen, _ in look_in_four_directions(grid)], axis=0)
+    return int(scores.max())
 
 
 if __name__ == "__main__":
 
     day = 8
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
@@ -1,23 +1,27 @@
 from itertools import accumulate
-from typing import TypeAlias
+from typing import Iterable, Iterator, TypeAlias
 
-import aoc_helper
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
 
 Motion: TypeAlias = tuple[str, int]
 Coord: TypeAlias = tuple[int, int]
 
 
+def parse_lines(lines: Iterable[str]) -> Iterator[Motion]:
+    pairs = (line.split(" ") for line in lines)
+    return ((pair[0], int(pair[1])) for pair in pairs)
+
+
 def parse_raw(raw: str) -> list[Motion]:
-    lines = raw.split("\n")
-    pairs = [line.split(" ") for line in lines]
-    return [(pair[0], int(pair[1])) for pair in pairs]
+    return list(parse_lines(raw.split("\n")))
 
 
-def trace_head_position(
-    motions: list[Motion], start_pos: Coord = (0, 0)
-) -> list[Coord]:
-    pos = start_pos
-    position_record = [pos]
+def iter_head_positions(
+    motions: Iterable[Motion], start_pos: Coord = (0, 0)
+) -> Iterator[Coord]:
+    x0, y0 = start_pos
+    yield start_pos
     direction_delta = {
         "U": (0, 1),
         "D": (0, -1),
@@ -26,11 +30,15 @@ def trace_head_position(
     }
     for direction, steps in motions:
         dx, dy = direction_delta[direction]
-        x0, y0 = pos
-        position_record += [(x0 + dx * i, y0 + dy * i) for i in range(1, steps + 1)]
-        pos = position_record[-1]
+        for _ in range(steps):
+            x0, y0 = x0 + dx, y0 + dy
+            yield (x0, y0)
 
-    return position_record
+
+def trace_head_position(
+    motions: Iterable[Motion], start_pos: Coord = (0, 0)
+) -> list[Coord]:
+    return list(iter_head_positions(motions, start_pos))
 
 
 def is_touching(head_pos: Coord, tail_pos: Coord) -> bool:
@@ -68,20 +76,17 @@ def new_tail_position(tail_pos: Coord, head_pos: Coord) -> Coord:
     return coords_add(tail_pos, (dx, dy))
 
 
-def map_next_knot_movements(prev_knot_movement: list[Coord]) -> list[Coord]:
-    return list(accumulate(iterable=prev_knot_movement, func=new_tail_position))
-
-
-def part_one(motions: list[Motion]) -> int:
-    head_movements = trace_head_position(motions)
-    tail_movements = map_next_knot_movements(prev_knot_movement=head_movements)
+def part_one(motions: Iterable[Motion]) -> int:
+    # positions are chained lazily, so only the set of visited positions is kept in memory
+    head_movements = iter_head_positions(motions)
+    tail_movements = accumulate(head_movements, func=new_tail_position)
     return len(set(tail_movements))
 
 
-def part_two(motions: list[Motion]) -> int:
-    curr_knot_movement = trace_head_position(motions)
+def part_two(motions: Iterable[Motion]) -> int:
+    curr_knot_movement = iter_head_positions(motions)
     for _ in range(9):
-        curr_knot_movement = map_next_knot_movements(curr_knot_movement)
+        curr_knot_movement = accumulate(curr_knot_movement, func=new_tail_position)
     return len(set(curr_knot_movement))
 
 
@@ -89,8 +94,10 @@ if __name__ == "__main__":
 
     day = 9
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
@@ -1,35 +1,51 @@
-import aoc_helper
+from itertools import islice
+from typing import Iterable, Iterator
 
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
 
-def parse_raw(raw: str) -> list[tuple[int, int]]:
-    lines = raw.split("\n")
 
+LastCycle = 240
+
+
+def parse_lines(lines: Iterable[str]) -> Iterator[tuple[int, int]]:
     cycle = 0
-    delta_x = []
 
     for line in lines:
         if line.startswith("addx"):
             cycle += 2
             inc_value = int(line[5:])
-            delta_x.append((cycle, inc_value))
+            yield (cycle, inc_value)
         else:
             cycle += 1
 
-    return delta_x
+
+def parse_raw(raw: str) -> list[tuple[int, int]]:
+    return list(parse_lines(raw.split("\n")))
 
 
-def x_values_for_all_cycles(delta_x: list[tuple[int, int]]) -> list[int]:
-    result = [1]
+def iter_x_values(delta_x: Iterable[tuple[int, int]]) -> Iterator[int]:
+    latest_value, length = 1, 1
+    yield latest_value
     for cycle, inc_value in delta_x:
-        latest_value = result[-1]
-        result += [latest_value] * (cycle + 1 - len(result))
-        result.append(latest_value + inc_value)
+        for _ in range(cycle + 1 - length):
+            yield latest_value
+        latest_value += inc_value
+        length = cycle + 2
+        yield latest_value
+
+
+def x_values_for_all_cycles(delta_x: Iterable[tuple[int, int]]) -> list[int]:
+    return list(iter_x_values(delta_x))
+
 
-    return result
+def x_values_until_last_cycle(delta_x: Iterable[tuple[int, int]]) -> list[int]:
+    "The screen is drawn in 240 cycles, anything after that is not consumed"
+    return list(islice(iter_x_values(delta_x), LastCycle + 1))
 
 
-def part_one(delta_x: list[tuple[int, int]]) -> int:
-    x_values = x_values_for_all_cycles(delta_x)
+def part_one(delta_x: Iterable[tuple[int, int]]) -> int:
+    x_values = x_values_until_last_cycle(delta_x)
 
     return sum(cycle * x_values[cycle] for cycle in range(20, 220 + 1, 40))
 
@@ -40,8 +56,8 @@ def pixel_onoff_at_cycle(x_values: list[int], cycle: int) -> bool:
     return abs(x_value_at_cycle - crt_x_pos) <= 1
 
 
-def part_two(delta_x: list[tuple[int, int]]) -> str:
-    x_values = x_values_for_all_cycles(delta_x)
+def part_two(delta_x: Iterable[tuple[int, int]]) -> str:
+    x_values = x_values_until_last_cycle(delta_x)
 
     screen = []
     pixel_representation = ".#"
@@ -61,8 +77,10 @@ if __name__ == "__main__":
 
     day = 10
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: \n\n{part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: \n\n{answer}")
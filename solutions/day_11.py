@@ -2,7 +2,9 @@ import math
 import re
 from typing import Callable
 
-import aoc_helper
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
+from solutions.parsing import int_list
 
 
 class Monkey:
@@ -85,15 +87,13 @@ class Monkey:
 
 
 def create_monkey(lines: list[str], part_two=False) -> Monkey:
-    starting_items = [int(item) for item in re.findall(r"\d+", lines[1])]
+    starting_items = int_list(lines[1])
 
     operation_raw = lines[2].replace("Operation: new = ", "")
     operation_sanitised = re.sub(r"[^0-9old =\+\-\*]", "", operation_raw)
     operation = lambda old: eval(operation_sanitised)
 
-    test_divisor, next_monkey_true, next_monkey_false = [
-        int(re.findall(r"\d+", line)[0]) for line in lines[3:6]
-    ]
+    test_divisor, next_monkey_true, next_monkey_false = int_list("\n".join(lines[3:6]))
 
     return Monkey(
         starting_items, operation, test_divisor, next_monkey_true, next_monkey_false
@@ -128,11 +128,15 @@ if __name__ == "__main__":
 
     day = 11
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     monkeys = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(monkeys)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(monkeys))
+    print(f"part one solution: {answer}")
 
     Monkey.reset_monkeys()
     monkeys_part_two = parse_raw(raw_data)
-    print(f"part two solution: {part_two(monkeys_part_two)}")
+    answer = cached_answer(
+        day, "part_two", raw_data, lambda: part_two(monkeys_part_two)
+    )
+    print(f"part two solution: {answer}")
@@ -1,17 +1,18 @@
 from typing import Callable, TypeAlias
 
-import aoc_helper
+from solutions.cache import cached_answer
+from solutions.grid import Grid
+from solutions.inputs import load_input
+from solutions.search import bfs
 
-Grid: TypeAlias = list[list[int]]
 Coord: TypeAlias = tuple[int, int]
 
 
 def parse_raw(raw: str) -> tuple[Coord, Coord, Grid]:
+    "The grid of heights is indexed by (x, y)"
     start, dest = [find_coordinate(raw=raw, char=char) for char in ("S", "E")]
-    grid = [
-        [ord(char) - ord("a") for char in line]
-        for line in raw.replace("S", "a").replace("E", "z").split("\n")
-    ]
+    lines = raw.replace("S", "a").replace("E", "z").split("\n")
+    grid = Grid.from_lines(lines, cell=lambda char: ord(char) - ord("a"))
     return (start, dest, grid)
 
 
@@ -27,39 +28,34 @@ def find_coordinate(raw: str, char: str) -> Coord:
     return (x, y)
 
 
-def neighbours(curr_coord: Coord, grid: Grid) -> list[Coord]:
-    x, y = curr_coord
-    y_limit = len(grid) - 1
-    x_limit = len(grid[0]) - 1
-
-    return [
-        (a, b)
-        for (a, b) in [(x + 1, y), (x, y + 1), (x - 1, y), (x, y - 1)]
-        if 0 <= a <= x_limit and 0 <= b <= y_limit
-    ]
-
-
 def get_height(coord: Coord, grid: Grid) -> int:
-    x, y = coord
-    return grid[y][x]
-
-
-def reachable_neighbours(curr_coord: Coord, grid: Grid, reversed=False) -> list[Coord]:
-    if reversed:
-        reachable = (
-            lambda curr, to_reach: get_height(to_reach, grid) - get_height(curr, grid)
-            >= -1
-        )
-    else:
-        reachable = (
-            lambda curr, to_reach: get_height(curr, grid) - get_height(to_reach, grid)
-            >= -1
-        )
-    return [
-        neighbour_coord
-        for neighbour_coord in neighbours(curr_coord, grid)
-        if reachable(curr=curr_coord, to_reach=neighbour_coord)
-    ]
+    # skip the bounds check of grid[coord], coordinates here always come from grid.neighbours
+    return grid.array.item(coord)
+
+
+def climbable_neighbours(grid: Grid, reversed=False) -> Callable[[int], list[int]]:
+    """Neighbours of cells numbered x * height + y that can be climbed to, at most one higher,
+    or when reversed that can be climbed from, at most one lower.
+    On a flat list of heights instead of the grid, as this is the inner loop of the search."""
+    width, height = grid.shape
+    heights = grid.array.ravel().tolist()
+    sign = -1 if reversed else 1
+
+    def neighbours(state: int) -> list[int]:
+        x, y = divmod(state, height)
+        limit = heights[state] * sign + 1
+        candidates = []
+        if x + 1 < width:
+            candidates.append(state + height)
+        if y + 1 < height:
+            candidates.append(state + 1)
+        if x > 0:
+            candidates.append(state - height)
+        if y > 0:
+            candidates.append(state - 1)
+        return [n for n in candidates if heights[n] * sign <= limit]
+
+    return neighbours
 
 
 def find_shortest_path_length(
@@ -68,28 +64,16 @@ def find_shortest_path_length(
     grid: Grid,
     reversed=False,
 ) -> int:
-    candidates = {start: 0}
-    visited = set()
-
-    while candidates:
-        curr = next(coord for coord in candidates)
-        curr_distance = candidates[curr]
-        next_candidates = {
-            coord: curr_distance + 1
-            for coord in reachable_neighbours(
-                curr_coord=curr, grid=grid, reversed=reversed
-            )
-            if not coord in visited
-        }
-
-        if any(stop_criteria(coord, grid) for coord in next_candidates):
-            return curr_distance + 1
-
-        candidates.update(next_candidates)
-        visited.add(curr)
-        candidates.pop(curr)
-
-    raise RuntimeError("Fail to reach destination")
+    _, height = grid.shape
+    result = bfs(
+        starts=[start[0] * height + start[1]],
+        neighbours=climbable_neighbours(grid, reversed=reversed),
+        n_states=grid.array.size,
+        is_goal=lambda state: stop_criteria(divmod(state, height), grid),
+    )
+    if result.distance is None:
+        raise RuntimeError("Fail to reach destination")
+    return result.distance
 
 
 def part_one(start: Coord, destination: Coord, grid: Grid) -> int:
@@ -111,8 +95,14 @@ if __name__ == "__main__":
 
     day = 12
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     start, destination, grid = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(start, destination, grid)}")
-    print(f"part two solution: {part_two(destination, grid)}")
+    answer = cached_answer(
+        day, "part_one", raw_data, lambda: part_one(start, destination, grid)
+    )
+    print(f"part one solution: {answer}")
+    answer = cached_answer(
+        day, "part_two", raw_data, lambda: part_two(destination, grid)
+    )
+    print(f"part two solution: {answer}")
@@ -1,10 +1,11 @@
 import json
 import re
-from functools import cache, cmp_to_key
+from functools import cmp_to_key, lru_cache
 from itertools import zip_longest
 from typing import TypeAlias
 
-import aoc_helper
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
 
 Packet: TypeAlias = list["PacketElement"]
 PacketElement: TypeAlias = int | Packet
@@ -20,7 +21,7 @@ def add_divider_packets(pairs: list[tuple[str, str]]) -> list[str]:
     return [packet_str for pair in pairs for packet_str in pair] + DividerPackets
 
 
-@cache
+@lru_cache(maxsize=1 << 16)
 def parse_packet_string(packet_string: str) -> Packet:
     return json.loads(packet_string)
 
@@ -60,7 +61,7 @@ def convert_int_to_list(value: int | list) -> list:
     return value
 
 
-@cache
+@lru_cache(maxsize=1 << 16)
 def cmp_packets_strings(left_str: str, right_str: str) -> int:
     left, right = parse_packet_string(left_str), parse_packet_string(right_str)
     return compare_packets(left, right)
@@ -84,10 +85,14 @@ if __name__ == "__main__":
 
     day = 13
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
 
     packet_strings_with_divider = add_divider_packets(parsed_data)
-    print(f"part two solution: {part_two(packet_strings_with_divider)}")
+    answer = cached_answer(
+        day, "part_two", raw_data, lambda: part_two(packet_strings_with_divider)
+    )
+    print(f"part two solution: {answer}")
@@ -1,12 +1,21 @@
 import itertools
-from typing import Callable, Optional, cast
+from typing import Iterable, Optional
 
-import aoc_helper
+import numpy as np
+
+from solutions import trace
+from solutions.cache import cached_answer
+from solutions.grid import Grid
+from solutions.inputs import load_input
+from solutions.instrument import count
+from solutions.jit import kernel
 
 Coord = tuple[int, int]
 
 SourceOfSand = (500, 0)
 
+Empty, Rock, Sand = range(3)
+
 
 class FallToAbyss(RuntimeError):
     "Sand starts falling to abyss."
@@ -47,67 +56,152 @@ def all_points_in_line(start: Coord, end: Coord) -> set[Coord]:
         return set(itertools.product(range(min(x0, x1), max(x0, x1) + 1), [y0]))
 
 
-def drop_sand(rocks: set[Coord], sands: set[Coord] = set()) -> Coord:
-    lowest_rock_y = max(y for (_, y) in rocks)
-
-    x, y = simulate_sand_falling_down(
-        rocks=rocks, sands=sands, stop_condition=lambda _, y: y >= lowest_rock_y
-    )
-    if y >= lowest_rock_y:
-        raise FallToAbyss
-
-    return x, y
-
-
-def drop_sand_part_two(rocks: set[Coord], sands: set[Coord] = set()) -> Coord:
-    lowest_rock_y = max(y for (_, y) in rocks)
+class SandCave:
+    """Rocks and sands on a grid, indexed by (x, y).
+    The grid grows as sand piles up sideways, so membership tests are array lookups rather than tuple hashing."""
+
+    Empty, Rock, Sand = Empty, Rock, Sand
+
+    def __init__(self, rocks: Iterable[Coord], sands: Iterable[Coord] = ()):
+        rocks = list(rocks)
+        self.lowest_rock_y = max(y for (_, y) in rocks)
+        rocks_grid = Grid.from_coords(rocks)
+        self.grid = Grid(rocks_grid.array * np.int8(self.Rock), rocks_grid.offset)
+        # room for the widest pile of sand in part two
+        floor_y = self.lowest_rock_y + 2
+        self.grid.grow_to_include(SourceOfSand)
+        self.grid.grow_to_include((SourceOfSand[0] - floor_y, floor_y))
+        self.grid.grow_to_include((SourceOfSand[0] + floor_y, floor_y))
+        for sand in sands:
+            self.grid[sand] = self.Sand
+        # the path of the last grain. The next grain follows the same path until the last step, so it resumes from there.
+        self.path = [SourceOfSand]
+
+    def is_blocked(self, x: int, y: int) -> bool:
+        return self.grid[x, y] != self.Empty
+
+    def drop(self, part_two=False) -> Coord:
+        """Drop a grain of sand and return where it rests.
+        Raise FallToAbyss when it falls below the lowest rock (part one), or SandSourceBlocked when sand reaches the source."""
+        stop_y = self.lowest_rock_y + 1 if part_two else self.lowest_rock_y
+        if self.is_blocked(*SourceOfSand):
+            raise SandSourceBlocked
+
+        path = self.path
+        while path and self.is_blocked(*path[-1]):
+            path.pop()
+
+        x, y = path[-1]
+        while y < stop_y:
+            next_step = next(
+                (
+                    (x1, y + 1)
+                    for x1 in (x, x - 1, x + 1)
+                    if not self.is_blocked(x1, y + 1)
+                ),
+                None,
+            )
+            if next_step is None:
+                break
+            x, y = next_step
+            path.append(next_step)
+
+        if y >= stop_y and not part_two:
+            raise FallToAbyss
+
+        self.grid[x, y] = self.Sand
+        return x, y
+
+    def pour(self, part_two=False, max_grains: Optional[int] = None) -> int:
+        "Drop grains until one would fall to the abyss or the source is blocked, or max_grains rest. Return how many rest."
+        stop_y = self.lowest_rock_y + 1 if part_two else self.lowest_rock_y
+        source_x, source_y = self.grid.index(SourceOfSand)
+        args = (self.grid.array, source_x, source_y, stop_y - self.grid.offset[1])
+
+        every = trace.interval("sand")
+        if every is None:
+            return pour_sand(*args, part_two, -1 if max_grains is None else max_grains)
+
+        # pour in batches, with a frame of the cave after each
+        grains = 0
+        while grains != max_grains:
+            batch = every if max_grains is None else min(every, max_grains - grains)
+            poured = pour_sand(*args, part_two, batch)
+            grains += poured
+            if poured < batch:
+                break
+            self.record_frame(grains)
+        return grains
+
+    def record_frame(self, grains: int):
+        x0, y0 = self.grid.offset
+        trace.frame("sand", grains, self.grid.array.T, origin=(y0, x0))
+
+    def sands(self) -> set[Coord]:
+        return {
+            (int(x), int(y))
+            for x, y in np.argwhere(self.grid.array == self.Sand) + self.grid.offset
+        }
+
+
+@kernel()
+def pour_sand(
+    cells: np.ndarray,
+    source_x: int,
+    source_y: int,
+    stop_y: int,
+    part_two: bool,
+    max_grains: int,
+) -> int:
+    """The loop of SandCave.drop over array indices, for all grains. Resting grains are marked in cells.
+    Stop when a grain would fall to stop_y (part one), the source is blocked, or max_grains (if not negative) rest.
+    """
+    path_x = np.empty(stop_y - source_y + 1, dtype=np.int64)
+    path_y = np.empty(stop_y - source_y + 1, dtype=np.int64)
+    path_x[0], path_y[0] = source_x, source_y
+    depth = 1
+    grains = 0
+    while grains != max_grains and cells[source_x, source_y] == Empty:
+        while cells[path_x[depth - 1], path_y[depth - 1]] != Empty:
+            depth -= 1
+        x, y = path_x[depth - 1], path_y[depth - 1]
+        while y < stop_y:
+            if cells[x, y + 1] == Empty:
+                pass
+            elif cells[x - 1, y + 1] == Empty:
+                x -= 1
+            elif cells[x + 1, y + 1] == Empty:
+                x += 1
+            else:
+                break
+            y += 1
+            path_x[depth], path_y[depth] = x, y
+            depth += 1
 
-    return simulate_sand_falling_down(
-        rocks=rocks, sands=sands, stop_condition=lambda _, y: y >= lowest_rock_y + 1
-    )
+        if y >= stop_y and not part_two:
+            break
+        cells[x, y] = Sand
+        grains += 1
 
+    return grains
 
-def simulate_sand_falling_down(
-    rocks: set[Coord], sands: set[Coord], stop_condition: Callable[[int, int], bool]
-) -> Coord:
-    x, y = SourceOfSand
-    obstacles = rocks.union(sands)
-    if SourceOfSand in obstacles:
-        raise SandSourceBlocked
 
-    while not stop_condition(x, y):
-        possible_steps = [(x, y + 1), (x - 1, y + 1), (x + 1, y + 1)]
+def drop_sand(rocks: set[Coord], sands: set[Coord] = set()) -> Coord:
+    return SandCave(rocks, sands).drop()
 
-        next_step = next(
-            (coord for coord in possible_steps if coord not in obstacles), None
-        )
-        match next_step:
-            case (int(), int()):
-                x, y = next_step
-                continue
-            case None:
-                return (x, y)
 
-    return x, y
+def drop_sand_part_two(rocks: set[Coord], sands: set[Coord] = set()) -> Coord:
+    return SandCave(rocks, sands).drop(part_two=True)
 
 
 def keep_dropping_sand(
     rocks: set[Coord], times: Optional[int] = None, part_two=False
 ) -> set[Coord]:
-    sands = set()
-
-    counter = range(times) if times else itertools.repeat(None)
-    for _ in counter:
-        try:
-            if part_two:
-                new_sand = drop_sand_part_two(rocks, sands)
-            else:
-                new_sand = drop_sand(rocks, sands)
-            sands.add(new_sand)
-        except (FallToAbyss, SandSourceBlocked):
-            break
+    cave = SandCave(rocks)
+    grains = cave.pour(part_two=part_two, max_grains=times or None)
 
-    return sands
+    count("grains", grains)
+    return cave.sands()
 
 
 def visualize(rocks: set[Coord], sands: set[Coord]):
@@ -131,15 +225,11 @@ def visualize(rocks: set[Coord], sands: set[Coord]):
 
 def part_one(rocks: set[Coord]) -> int:
     sands_until_fall_into_abyss = keep_dropping_sand(rocks=rocks)
-    v = visualize(rocks=rocks, sands=sands_until_fall_into_abyss)
-    print(v)
     return len(sands_until_fall_into_abyss)
 
 
 def part_two(rocks: set[Coord]) -> int:
     sands_until_source_blocked = keep_dropping_sand(rocks=rocks, part_two=True)
-    # v = visualize(rocks=rocks, sands=sands_until_source_blocked)
-    # print(v)
     return len(sands_until_source_blocked)
 
 
@@ -147,8 +237,10 @@ if __name__ == "__main__":
 
     day = 14
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
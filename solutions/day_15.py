@@ -1,22 +1,20 @@
 import functools
-import re
 from typing import Iterable, Optional
 
-import aoc_helper
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
+from solutions.parsing import int_lists
 
 Coord = tuple[int, int]
 Coverage = tuple[int, int] | None
 
 
 def parse_raw(raw: str) -> list[list[Coord]]:
-    numbers_in_each_line = [
-        [int(num) for num in re.findall(r"-?\d+", line)] for line in raw.split("\n")
-    ]
+    return [[(a, b), (c, d)] for (a, b, c, d) in int_lists(raw, 4)]
 
-    return [[(a, b), (c, d)] for (a, b, c, d) in numbers_in_each_line]
 
-
-@functools.cache
+# keyed by coordinates of the input, so bounded for a long-lived process solving many inputs
+@functools.lru_cache(maxsize=1 << 12)
 def manhattan_distance(start: Coord, end: Coord) -> int:
     x0, y0 = start
     x1, y1 = end
@@ -108,8 +106,14 @@ if __name__ == "__main__":
 
     day = 15
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data, y=2000000)}")
-    print(f"part two solution: {part_two(parsed_data, boundary=4000000)}")
+    answer = cached_answer(
+        day, "part_one", raw_data, lambda: part_one(parsed_data, y=2000000)
+    )
+    print(f"part one solution: {answer}")
+    answer = cached_answer(
+        day, "part_two", raw_data, lambda: part_two(parsed_data, boundary=4000000)
+    )
+    print(f"part two solution: {answer}")
@@ -4,8 +4,9 @@ import re
 from dataclasses import dataclass
 from typing import Iterable
 
-import aoc_helper
-import numpy as np
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
+from solutions.search import Unreached, bfs
 
 ValveSet = frozenset[str]
 
@@ -31,25 +32,22 @@ class ValveNetwork:
         return self._edges[valve_name]
 
     def calc_all_distances(self) -> dict[tuple[str, str], int]:
-        n = len(self.valves)
-        arr = np.full(shape=(n, n), fill_value=n + 1)
-
-        for valve in range(n):
-            arr[valve, valve] = 0
-
-        for (a, b) in itertools.combinations(list(range(n)), 2):
-            if self.valves[b] in self.neighbour_valves(self.valves[a]):
-                arr[a, b] = 1
-                arr[b, a] = 1
-
-        for (k, i, j) in itertools.product(list(range(n)), repeat=3):
-            arr[i, j] = min(arr[i, j], arr[i, k] + arr[k, j])
-
-        dist = {
-            (self.valves[x], self.valves[y]): arr[x, y]
-            for x in range(n)
-            for y in range(n)
-        }
+        "BFS from every valve, as the tunnels all have length 1"
+        valves = self.valves
+        n = len(valves)
+        index = {valve: i for i, valve in enumerate(valves)}
+        edges = [[index[b] for b in self.neighbour_valves(a)] for a in valves]
+
+        dist = {}
+        for x, source in enumerate(valves):
+            distances = bfs(
+                starts=[x], neighbours=edges.__getitem__, n_states=n
+            ).distances
+            for y, target in enumerate(valves):
+                # unreachable valves are farther than any path
+                dist[(source, target)] = (
+                    distances[y] if distances[y] != Unreached else n + 1
+                )
         return dist
 
     def flow_rate(self, valve_name: str) -> int:
@@ -158,8 +156,10 @@ if __name__ == "__main__":
 
     day = 16
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
@@ -3,9 +3,14 @@ import itertools
 from dataclasses import dataclass
 from typing import Iterable, Optional
 
-import aoc_helper
 import numpy as np
 
+from solutions import trace
+from solutions.cache import cached_answer
+from solutions.grid import Grid
+from solutions.inputs import load_input
+from solutions.jit import kernel
+
 Coord = tuple[int, int]
 
 
@@ -15,20 +20,31 @@ class RockComeToRest(RuntimeError):
 
 
 class Jet:
+    "The counter is the position in the pattern of the next jet"
+
     def __init__(self, pattern: str):
         self.counter = 0
         self.pattern = pattern
-        self.iter = itertools.cycle(pattern)
+
+    @functools.cached_property
+    def directions(self) -> np.ndarray:
+        "The pattern as x offsets, for settle_rock"
+        offsets = {"<": -1, ">": 1}
+        if not set(self.pattern) <= offsets.keys():
+            raise RuntimeError("invalid jet direction")
+        return np.array([offsets[char] for char in self.pattern])
 
     def take(self, n: int) -> Iterable[str]:
+        start = self.counter
         self.counter = (self.counter + n) % len(self.pattern)
 
-        return itertools.islice(self.iter, n)
+        return itertools.islice(itertools.cycle(self.pattern), start, start + n)
 
     def __iter__(self):
         while True:
+            jet_direction = self.pattern[self.counter]
             self.counter = (self.counter + 1) % len(self.pattern)
-            yield next(self.iter)
+            yield jet_direction
 
 
 @functools.cache
@@ -48,6 +64,12 @@ def rock_array(kind: int) -> np.ndarray:
             raise RuntimeError("rock of invalid kind")
 
 
+def warm_up():
+    "Build the rock shapes ahead, for solving many inputs in a long-lived process"
+    for kind in range(5):
+        rock_array(kind)
+
+
 def rock_width(kind: int) -> int:
     return rock_array(kind).shape[1]
 
@@ -87,18 +109,30 @@ class Cave:
     def __init__(self, jet: Jet, width=7, array=None):
         self.jet = jet
         self.width = width
-        if array:
-            self.array = np.ndarray(array)
+        if array is not None:
+            self.array = array
         else:
-            self.array: np.ndarray = np.zeros((1, self.width), int)
+            # indexed by (y, x), y going up. Only the lowest cave_height rows are in use, the rest is room to grow.
+            self.grid = Grid.zeros((1, self.width), dtype=int)
+            self.cave_height = 1
         self.rock_tower_height = 0
         self.rest_rock_count = 0
         self.current_rock = None
         self.current_rock_pos = None
         self.pattern_seen = {}
 
+    @property
+    def array(self) -> np.ndarray:
+        return self.grid.array[: self.cave_height]
+
+    @array.setter
+    def array(self, array: np.ndarray):
+        self.grid = Grid(np.array(array, dtype=int))
+        self.cave_height = len(array)
+
     def extend_upper(self, n: int = 1):
-        self.array = np.append(self.array, np.zeros((n, self.width), int), axis=0)
+        self.cave_height += n
+        self.grid.grow_to_include((self.cave_height - 1, 0))
 
     def make_next_rock(self):
         self.current_rock_pos = (self.rock_tower_height + 3, 2)
@@ -145,10 +179,6 @@ class Cave:
 
         return (self.current_rock.array & area_to_occupy).any()
 
-    @property
-    def cave_height(self):
-        return self.array.shape[0]
-
     def select_area_by_rock_shape(self, pos: Coord, kind: int) -> np.array:
         y0, x0 = pos
         dy, dx = rock_shape(kind)
@@ -173,14 +203,31 @@ class Cave:
         )
 
     def fall_until_rock_rest(self) -> bool:
-        try:
-            for jet_direction in self.jet.iter:
-                self.blow_rock(jet_direction)
-                self.rock_fall()
-        except RockComeToRest:
-            self.handle_rock_rest()
-            return True
-        raise RuntimeError("Rock not come to rest but iter stopped")
+        "Same as blow_rock and rock_fall in turn until the rock comes to rest, in a kernel"
+        y, x = self.current_rock_pos
+        dy, _ = self.current_rock.shape
+        # the rows above cave_height are empty room for the rock to start in
+        self.grid.grow_to_include((y + dy - 1, 0))
+
+        y, x, self.jet.counter = settle_rock(
+            self.grid.array,
+            self.current_rock.array,
+            y,
+            x,
+            self.jet.directions,
+            self.jet.counter,
+        )
+        self.current_rock_pos = (y, x)
+        self.handle_rock_rest()
+        if trace.wants("tower", self.rest_rock_count):
+            # top of the tower first, rows being -y
+            trace.frame(
+                "tower",
+                self.rest_rock_count,
+                self.array[::-1],
+                origin=(1 - self.cave_height, 0),
+            )
+        return True
 
     def simulate_rock_fall(self, number_of_rocks: int):
         for _ in range(number_of_rocks):
@@ -249,6 +296,39 @@ class Cave:
         return "\n".join(with_left_right_walls + [floor])
 
 
+@kernel()
+def settle_rock(
+    cells: np.ndarray,
+    rock: np.ndarray,
+    y: int,
+    x: int,
+    directions: np.ndarray,
+    jet_index: int,
+) -> tuple[int, int, int]:
+    """Blow and drop a rock from (y, x) until it rests, cells having room above it.
+    Return where it rests, and the index of the next jet."""
+    height, width = rock.shape
+    while True:
+        new_x = x + directions[jet_index]
+        jet_index = (jet_index + 1) % len(directions)
+        if 0 <= new_x <= cells.shape[1] - width:
+            blocked = False
+            for i in range(height):
+                for j in range(width):
+                    if rock[i, j] and cells[y + i, new_x + j]:
+                        blocked = True
+            if not blocked:
+                x = new_x
+
+        if y == 0:
+            return y, x, jet_index
+        for i in range(height):
+            for j in range(width):
+                if rock[i, j] and cells[y - 1 + i, x + j]:
+                    return y, x, jet_index
+        y -= 1
+
+
 def parse_raw(raw: str) -> Cave:
     jet = Jet(pattern=raw)
     return Cave(jet=jet)
@@ -270,8 +350,10 @@ if __name__ == "__main__":
 
     day = 17
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
@@ -2,7 +2,11 @@ import itertools
 from collections import defaultdict
 from typing import Iterable, Iterator
 
-import aoc_helper
+import numpy as np
+
+from solutions.cache import cached_answer
+from solutions.grid import Grid, shift, unit_vectors
+from solutions.inputs import load_input
 
 Cube = tuple[int, int, int]
 Boundries = tuple[tuple[int, int], tuple[int, int], tuple[int, int]]
@@ -21,11 +25,14 @@ def is_touching(cube_a: Cube, cube_b: Cube) -> bool:
 
 
 def find_surface_area(cubes: Iterable[Cube]) -> int:
-    possible_pairs = itertools.combinations(cubes, r=2)
-    touching_pairs = sum(is_touching(a, b) for a, b in possible_pairs)
-    total_faces = len(cubes) * 6
+    voxels = Grid.from_coords(cubes, ndim=3)
+    # each pair of cubes touching along an axis hides two faces
+    touching_pairs = sum(
+        np.count_nonzero(voxels.array & voxels.shifted(delta))
+        for delta in [(1, 0, 0), (0, 1, 0), (0, 0, 1)]
+    )
 
-    return total_faces - touching_pairs * 2
+    return voxels.count() * 6 - touching_pairs * 2
 
 
 def part_one(lava_cubes: list[Cube]) -> int:
@@ -119,19 +126,44 @@ def classify_cubes(lava_cubes: list[Cube]) -> dict:
     return result
 
 
+def find_exterior(lava: Grid) -> np.ndarray:
+    "Air connected to the outside of the grid, by flooding in from the edges until it stops spreading"
+    air = ~lava.array
+    exterior = np.zeros_like(air)
+    edges = tuple(slice(1, -1) for _ in range(lava.ndim))
+    exterior[...] = True
+    exterior[edges] = False
+    exterior &= air
+
+    while True:
+        spread = exterior.copy()
+        for delta in unit_vectors(lava.ndim):
+            spread |= shift(exterior, delta)
+        spread &= air
+        if (spread == exterior).all():
+            return exterior
+        exterior = spread
+
+
 def part_two(lava_cubes: list[Cube]) -> int:
-    groups = classify_cubes(lava_cubes=lava_cubes)
-    trapped_air = groups["trapped_air"]
+    lava = Grid.from_coords(lava_cubes, padding=1, ndim=3)
+    exterior = find_exterior(lava)
 
-    return find_surface_area(lava_cubes) - find_surface_area(trapped_air)
+    # a face is exposed if the cube next to it is exterior air
+    return sum(
+        np.count_nonzero(lava.array & shift(exterior, delta))
+        for delta in unit_vectors(lava.ndim)
+    )
 
 
 if __name__ == "__main__":
 
     day = 18
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
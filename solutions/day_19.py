@@ -1,8 +1,10 @@
 import functools
-import re
 from typing import NamedTuple
 
-import aoc_helper
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
+from solutions.instrument import count
+from solutions.parsing import int_lists
 
 
 class Blueprint(NamedTuple):
@@ -189,6 +191,7 @@ class RobotFactory:
                     blueprint_num=blueprint_num, input_state=state
                 )
             )
+            count("states_explored", len(all_states))
             all_states = self.prune_inferior_state(all_states)
         return all_states
 
@@ -201,10 +204,8 @@ class RobotFactory:
 
 
 def parse_raw(raw: str) -> RobotFactory:
-    numbers_each_line = (
-        list(map(int, re.findall(r"\d+", line))) for line in raw.splitlines()
-    )
-    blueprint_params = (numbers[1:] for numbers in numbers_each_line)
+    # the first number of each line is the blueprint id
+    blueprint_params = [numbers[1:] for numbers in int_lists(raw, 7)]
     blueprints = [Blueprint(*params) for params in blueprint_params]
 
     return RobotFactory(blueprints=blueprints)
@@ -230,8 +231,10 @@ if __name__ == "__main__":
 
     day = 19
 
-    raw_data = aoc_helper.fetch(day, 2022)
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
@@ -1,3 +1,12 @@
+from typing import TYPE_CHECKING
+
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
+from solutions.jit import kernel
+
+if TYPE_CHECKING:
+    import numpy as np
+
 PartTwoMagicNum = 811589153
 
 
@@ -38,11 +47,12 @@ class NumberBoxes:
         return after_rotation
 
     def mix_whole_list(self, times=1) -> tuple[int]:
-        token_list = self.initial_tokens()
-        for _ in range(times):
-            for token in range(self.len):
-                token_list = self.mix_number(token_list=token_list, token=token)
-        return token_list
+        "Same as mix_number for every token in turn, times over, in a kernel"
+        import numpy as np
+
+        moves = np.array(self._boxes, dtype=np.int64)
+        tokens = np.array(self.initial_tokens(), dtype=np.int64)
+        return tuple(np.asarray(mix_tokens(moves, tokens, times)).tolist())
 
     def nth_after_zero(self, token_list: tuple[int], n: int) -> int:
         token_of_zero = self._boxes.index(0)
@@ -52,6 +62,40 @@ class NumberBoxes:
         return self[token_of_wanted_number]
 
 
+def mix_with_tuples(
+    moves: "np.ndarray", tokens: "np.ndarray", times: int
+) -> tuple[int]:
+    box = NumberBoxes(numbers=moves.tolist())
+    token_list = tuple(tokens.tolist())
+    for _ in range(times):
+        for token in range(box.len):
+            token_list = box.mix_number(token_list=token_list, token=token)
+    return token_list
+
+
+@kernel(fallback=mix_with_tuples)
+def mix_tokens(moves: "np.ndarray", tokens: "np.ndarray", times: int) -> "np.ndarray":
+    "Mix tokens in place, moving the tokens in between one step each"
+    n = len(tokens)
+    for _ in range(times):
+        for token in range(n):
+            pos = 0
+            while tokens[pos] != token:
+                pos += 1
+
+            # same position as NumberBoxes.rotate_number, between 1 and n - 1
+            new_pos = (pos + moves[token]) % (n - 1)
+            if new_pos < 1:
+                new_pos += n - 1
+
+            for i in range(pos, new_pos):
+                tokens[i] = tokens[i + 1]
+            for i in range(pos, new_pos, -1):
+                tokens[i] = tokens[i - 1]
+            tokens[new_pos] = token
+    return tokens
+
+
 def parse_raw(raw: str) -> NumberBoxes:
     numbers = [int(line) for line in raw.splitlines()]
     return NumberBoxes(numbers=numbers)
@@ -78,8 +122,10 @@ if __name__ == "__main__":
 
     day = 20
 
-    raw_data = open(f"puzzle/day_{day}.txt", "r").read()
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
@@ -3,6 +3,9 @@ import re
 from enum import Enum
 from fractions import Fraction
 
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
+
 
 class Op(Enum):
     Add, Subtract, Multiply, Divide = range(4)
@@ -227,10 +230,12 @@ if __name__ == "__main__":
 
     day = 21
 
-    raw_data = open(f"puzzle/day_{day}.txt", "r").read()
+    raw_data = load_input(day)
 
     parsed_data = parse_raw(raw_data)
-    print(f"part one solution: {part_one(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
 
     parsed_data = parse_raw(raw_data)
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
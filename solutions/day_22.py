@@ -4,6 +4,12 @@ import re
 from enum import Enum
 from typing import Optional
 
+import numpy as np
+
+from solutions.cache import cached_answer
+from solutions.grid import Grid
+from solutions.inputs import load_input
+
 
 class Facing(Enum):
     Right, Down, Left, Up = range(4)
@@ -21,6 +27,9 @@ class Tile(str, Enum):
     Void = " "
 
 
+AllTiles = list(Tile)
+
+
 class TurnDirection(str, Enum):
     Left = "L"
     Right = "R"
@@ -35,8 +44,9 @@ Path = list[Step]
 class MonkeyMap:
     def __init__(self, input_map: list[str], path: list[Step]):
         self.map = input_map
-        self.map_width = len(input_map[0])
-        self.map_height = len(input_map)
+        # tiles as indices of AllTiles, indexed by (x, y)
+        self.tiles = Grid.from_lines(input_map, cell=lambda char: AllTiles.index(char))
+        self.map_width, self.map_height = self.tiles.shape
         self.path = path
 
     @property
@@ -44,7 +54,7 @@ class MonkeyMap:
         return (self.map_height, self.map_width)
 
     def get_tile(self, x: int, y: int) -> Tile:
-        return Tile(self.map[y][x])
+        return AllTiles[self.tiles.array[x, y]]
 
     def get_init_state(self) -> State:
         try:
@@ -106,9 +116,8 @@ class MonkeyMapCube(MonkeyMap):
         self.connect_faces()
 
     def detect_side_width(self) -> int:
-        total_area = sum(
-            1 for tile in "".join(self.map) if tile in (Tile.Block, Tile.Space)
-        )
+        void = AllTiles.index(Tile.Void)
+        total_area = int(np.count_nonzero(self.tiles.array != void))
 
         sqrt_of_one_face = (total_area / 6) ** 0.5
         if sqrt_of_one_face**2 != (total_area // 6):
@@ -286,10 +295,14 @@ if __name__ == "__main__":
 
     day = 22
 
-    raw_data = open(f"puzzle/day_{day}.txt", "r").read()
+    raw_data = load_input(day)
 
     parsed_data = parse_raw(raw_data)
-    print(f"part one solution: {part_one(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
 
     parsed_data_part_two = parse_raw(raw_data, as_cube=True)
-    print(f"part two solution: {part_one(parsed_data_part_two)}")
+    answer = cached_answer(
+        day, "part_two", raw_data, lambda: part_one(parsed_data_part_two)
+    )
+    print(f"part two solution: {answer}")
@@ -1,8 +1,15 @@
 import functools
-from collections import Counter
 from enum import Enum
 from typing import NamedTuple, TypeAlias
 
+import numpy as np
+
+from solutions import trace
+from solutions.cache import cached_answer
+from solutions.grid import Grid, shift
+from solutions.inputs import load_input
+from solutions.jit import kernel
+
 
 class Direction(tuple, Enum):
     N = (0, -1)
@@ -40,6 +47,7 @@ class Direction(tuple, Enum):
 
 
 AllDirections = [*Direction]
+RuleOrder = (Direction.N, Direction.S, Direction.W, Direction.E)
 
 
 class Coord(NamedTuple):
@@ -93,9 +101,8 @@ def propose_move(coord: Coord, elves: Elves, turn_number: int) -> Coord:
     if not neighbour_elves:
         return coord
 
-    rule_order = (Direction.N, Direction.S, Direction.W, Direction.E)
     for i in range(4):
-        direction_to_try = rule_order[(turn_number + i) % 4]
+        direction_to_try = RuleOrder[(turn_number + i) % 4]
         got_elves_for_this_direction = neighbour_elves.intersection(
             direction_to_try.with_two_adjs
         )
@@ -106,24 +113,111 @@ def propose_move(coord: Coord, elves: Elves, turn_number: int) -> Coord:
     return coord
 
 
-def resolve_next_turn(elves: Elves, turn_number: int) -> Elves:
-    all_elves = list(elves)
-    all_proposed_moves = {
-        elf: propose_move(coord=elf, elves=elves, turn_number=turn_number)
-        for elf in all_elves
+def move_elves(grid: Grid, turn_number: int) -> bool:
+    "Resolve one turn for all elves at once, moving them on the grid in place. Return whether any elf moved."
+    grid.ensure_margin(1)
+    moved = step_elves(grid.array, turn_number % 4)
+
+    x0, y0 = grid.offset
+    trace.frame("elves", turn_number + 1, grid.array.T, origin=(y0, x0))
+    return moved
+
+
+def step_elves_numpy(cells: np.ndarray, first_rule: int) -> bool:
+    """step_elves on whole grid shifted views: occupied[d] tells, for every cell, whether there is an elf in direction d of it.
+    Elves must be at least one cell away from the edges."""
+    # views into one padded copy, rather than a shifted copy per direction
+    padded = np.pad(cells, 1)
+    occupied = {
+        direction: padded[
+            1 + direction[0] : 1 + direction[0] + cells.shape[0],
+            1 + direction[1] : 1 + direction[1] + cells.shape[1],
+        ]
+        for direction in Direction
     }
-    counts = Counter(all_proposed_moves.values())
 
-    resolved_moves = [
-        proposed_move if counts[proposed_move] == 1 else current_position
-        for current_position, proposed_move in all_proposed_moves.items()
-    ]
-    convert_to_set = frozenset(resolved_moves)
+    undecided = cells & np.logical_or.reduce(list(occupied.values()))
+    proposals = {}
+    for i in range(4):
+        direction = RuleOrder[(first_rule + i) % 4]
+        free = ~np.logical_or.reduce([occupied[dir] for dir in direction.with_two_adjs])
+        proposals[direction] = undecided & free
+        undecided &= ~free
+
+    # elves proposing the same tile can only come from opposite directions, so count the proposals per tile
+    proposal_counts = sum(
+        shift(proposed, direction).astype(np.int8)
+        for direction, proposed in proposals.items()
+    )
+    not_contested = proposal_counts == 1
+
+    moved_from = np.zeros_like(cells)
+    moved_to = np.zeros_like(cells)
+    for direction, proposed in proposals.items():
+        moving = proposed & shift(not_contested, (-direction[0], -direction[1]))
+        moved_from |= moving
+        moved_to |= shift(moving, direction)
+
+    cells &= ~moved_from
+    cells |= moved_to
+    return bool(moved_from.any())
+
+
+@kernel(fallback=step_elves_numpy)
+def step_elves(cells: np.ndarray, first_rule: int) -> bool:
+    """Move the elves of a boolean (x, y) grid in place for one turn, trying the rules N, S, W, E from first_rule.
+    Elves must be at least one cell away from the edges. Return whether any elf moved."""
+    xs, ys = np.nonzero(cells)
+    target_xs = xs.copy()
+    target_ys = ys.copy()
+    counts = np.zeros(cells.shape, dtype=np.int8)
+
+    for elf in range(len(xs)):
+        x, y = xs[elf], ys[elf]
+        crowded = False
+        for dx in range(-1, 2):
+            for dy in range(-1, 2):
+                if (dx != 0 or dy != 0) and cells[x + dx, y + dy]:
+                    crowded = True
+        if not crowded:
+            continue
+
+        for i in range(4):
+            rule = (first_rule + i) % 4
+            # N, S, W, E
+            dx = 0 if rule < 2 else 2 * rule - 5
+            dy = 2 * rule - 1 if rule < 2 else 0
+            free = True
+            for k in range(-1, 2):
+                if cells[x + dx + k * dy * dy, y + dy + k * dx * dx]:
+                    free = False
+            if free:
+                target_xs[elf], target_ys[elf] = x + dx, y + dy
+                counts[x + dx, y + dy] += 1
+                break
+
+    moved = False
+    for elf in range(len(xs)):
+        x, y, target_x, target_y = xs[elf], ys[elf], target_xs[elf], target_ys[elf]
+        if (x != target_x or y != target_y) and counts[target_x, target_y] == 1:
+            cells[x, y] = False
+            cells[target_x, target_y] = True
+            moved = True
+    return moved
+
+
+def to_grid(elves: Elves) -> Grid:
+    return Grid.from_coords(elves, padding=1)
 
-    if len(convert_to_set) != len(all_elves):
-        raise RuntimeError("some elves disappeared! a bug caught")
 
-    return convert_to_set
+def from_grid(grid: Grid) -> Elves:
+    return frozenset(Coord(*coord) for coord in grid.coords())
+
+
+def resolve_next_turn(elves: Elves, turn_number: int) -> Elves:
+    grid = to_grid(elves)
+    move_elves(grid, turn_number=turn_number)
+    return from_grid(grid)
 
 
 def count_empty_ground(elves: Elves) -> int:
@@ -140,34 +234,38 @@ def count_empty_ground(elves: Elves) -> int:
 
 
 def run_n_turns(elves: Elves, n: int) -> Elves:
-    state = elves
+    grid = to_grid(elves)
     for i in range(n):
-        state = resolve_next_turn(elves=state, turn_number=i)
-    return state
+        move_elves(grid, turn_number=i)
+    return from_grid(grid)
 
 
 def part_one(elves: Elves) -> int:
-    final_state = run_n_turns(elves, 10)
-    return count_empty_ground(final_state)
+    grid = to_grid(elves)
+    for i in range(10):
+        move_elves(grid, turn_number=i)
+
+    lower, upper = grid.bounding_box()
+    total_area = (upper[0] - lower[0] + 1) * (upper[1] - lower[1] + 1)
+    return total_area - grid.count()
 
 
 def part_two(elves: Elves) -> int:
-    prev_state = None
-    curr_state = elves
+    grid = to_grid(elves)
     i = 0
-    while prev_state != curr_state:
-        prev_state = curr_state
-        curr_state = resolve_next_turn(elves=curr_state, turn_number=i)
+    while move_elves(grid, turn_number=i):
         i += 1
-    return i
+    return i + 1
 
 
 if __name__ == "__main__":
 
     day = 23
 
-    raw_data = open(f"puzzle/day_{day}.txt", "r").read()
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
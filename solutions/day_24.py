@@ -1,8 +1,16 @@
 import functools
+import math
 from enum import Enum
 
 import numpy as np
 
+from solutions import trace
+from solutions.cache import cached_answer
+from solutions.grid import Grid, unit_vectors
+from solutions.inputs import load_input
+from solutions.instrument import count
+from solutions.search import bfs_layers, time_expanded
+
 
 class Tile(Enum):
     Empty = 0
@@ -55,6 +63,14 @@ class Tile(Enum):
 ObstacleMaps = dict[Tile, np.ndarray]
 
 
+def warm_up():
+    "Build the tile tables ahead, for solving many inputs in a long-lived process"
+    for tile_string in Tile.string_representations().values():
+        Tile.from_str(tile_string)
+    for tile_value in range(2 ** len(Tile)):
+        Tile.to_str(tile_value)
+
+
 class BlizzardBasin:
     def __init__(self, raw_string: str):
         combined_map = self.string_to_combined_map(raw_string)
@@ -96,7 +112,8 @@ class BlizzardBasin:
 
         return self.combine_map_to_string(combined_map)
 
-    @functools.cache
+    # bounded, so that long-lived processes solving many inputs don't keep every basin alive
+    @functools.lru_cache(maxsize=1 << 14)
     def forecast_blizzard_for_turn_n(self, n: int, blizzard_type: Tile) -> np.ndarray:
         """Return the locations of certain blizzard on turn N.
         If we only consider the inner area (those cells within the walls),
@@ -161,16 +178,6 @@ class BlizzardBasin:
 
         return new_maps
 
-    def four_directions(self, coord: tuple[int, int]) -> list[tuple[int, int]]:
-        output = []
-        y0, x0 = coord
-        for dy, dx in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            y1, x1 = y0 + dy, x0 + dx
-            if 0 <= y1 < self.height and 0 <= x1 < self.width:
-                output.append((y1, x1))
-
-        return output
-
     def next_turn_moves(self, current_locations: np.ndarray) -> np.ndarray:
         """Simulate all possible moves that Expedition can take in next turn.
         Ignore any obstacles. Only consider boundries and the diffusion to four directions.
@@ -181,12 +188,10 @@ class BlizzardBasin:
         Returns:
             np.ndarray: An np.array in bool that denote all possible moves for the Expedition to take in next turn.
         """
-        new_state = np.zeros(shape=current_locations.shape, dtype=bool)
-
-        for coord in np.argwhere(current_locations == True):
-            four_neighbour_tiles = self.four_directions(coord)
-            for y, x in [coord, *four_neighbour_tiles]:
-                new_state[y, x] = True
+        locations = Grid(current_locations, fill=False)
+        new_state = current_locations.copy()
+        for delta in unit_vectors(2):
+            new_state |= locations.shifted(delta)
 
         return new_state
 
@@ -203,20 +208,74 @@ class BlizzardBasin:
 
         return all_possible_moves
 
+    @functools.cached_property
+    def period(self) -> int:
+        "The blizzards are back to where they started every period turns"
+        return math.lcm(self.inner_height, self.inner_width)
+
+    @functools.cached_property
+    def moves(self) -> np.ndarray:
+        "For each cell numbered row * width + col, the cells after waiting or moving in four directions, -1 if outside"
+        rows, cols = np.divmod(np.arange(self.height * self.width), self.width)
+        moves = []
+        for d_row, d_col in [(0, 0)] + unit_vectors(2):
+            new_rows, new_cols = rows + d_row, cols + d_col
+            inside = (
+                (0 <= new_rows)
+                & (new_rows < self.height)
+                & (0 <= new_cols)
+                & (new_cols < self.width)
+            )
+            moves.append(np.where(inside, new_rows * self.width + new_cols, -1))
+        return np.stack(moves, axis=1)
+
+    def free_cells_for_turn_n(self, n: int) -> np.ndarray:
+        "Flat boolean array over cells numbered row * width + col, True where there's no obstacle"
+        obstacles = sum(self.make_obstacle_maps_for_turn_n(n).values())
+        return ~obstacles.astype(bool).ravel()  # pyright: ignore
+
+    def draw(self, n: int, cells: np.ndarray) -> np.ndarray:
+        "The valley on turn n for trace frames: 0 where free, 1 for walls and blizzards, 2 where the Expedition may be"
+        valley = (~self.free_cells_for_turn_n(n)).astype(np.uint8)
+        valley[cells] = 2
+        return valley.reshape(self.height, self.width)
+
     def bfs(
         self, start: tuple[int, int], goal: tuple[int, int], starting_turn: int = 0
     ) -> int:
-        initial_state = np.zeros(shape=(self.height, self.width), dtype=bool)
-        initial_state[start] = True
-
-        locations = initial_state
-        turn_number = starting_turn
-
-        while not locations[goal]:
-            next_turn_obstacles = self.make_obstacle_maps_for_turn_n(n=turn_number + 1)
-            locations = self.simulate_next_turn(locations, next_turn_obstacles)
-            turn_number += 1
+        """Search over (turn % period, cell) states, as being on a cell at turn t and at turn t + period
+        leads to the same moves. Each turn, every possible location of the Expedition is expanded at once."""
+        n_cells = self.height * self.width
+        goal_cell = goal[0] * self.width + goal[1]
+        moves = self.moves
+
+        def expand(states: np.ndarray, turn: int) -> np.ndarray:
+            next_cells = moves[states % n_cells].ravel()
+            next_cells = next_cells[next_cells >= 0]
+            next_cells = next_cells[self.free_cells_for_turn_n(turn + 1)[next_cells]]
+            if trace.wants("valley", turn + 1):
+                trace.frame("valley", turn + 1, self.draw(turn + 1, next_cells))
+            return time_expanded(turn + 1, next_cells, self.period, n_cells)
+
+        result = bfs_layers(
+            starts=[
+                time_expanded(
+                    starting_turn,
+                    start[0] * self.width + start[1],
+                    self.period,
+                    n_cells,
+                )
+            ],
+            expand=expand,
+            n_states=self.period * n_cells,
+            is_goal=lambda states: states % n_cells == goal_cell,
+            start_depth=starting_turn,
+        )
+        if result is None:
+            raise RuntimeError("Fail to reach goal")
 
+        turn_number, _ = result
+        count("turns", turn_number - starting_turn)
         return turn_number
 
 
@@ -246,8 +305,10 @@ if __name__ == "__main__":
 
     day = 24
 
-    raw_data = open(f"puzzle/day_{day}.txt", "r").read()
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
@@ -1,3 +1,9 @@
+from typing import Iterable
+
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
+
+
 class SNAFU:
     @classmethod
     def to_int(cls, snafu_number: str) -> int:
@@ -24,11 +30,15 @@ class SNAFU:
             return SNAFU.from_int(remaining // 5) + digit
 
 
+def parse_lines(lines: Iterable[str]) -> Iterable[str]:
+    return lines
+
+
 def parse_raw(raw: str) -> list[str]:
     return raw.splitlines()
 
 
-def part_one(snafu_number_list: list[str]) -> str:
+def part_one(snafu_number_list: Iterable[str]) -> str:
     sum_of_snafu_numbers = sum(SNAFU.to_int(snafu) for snafu in snafu_number_list)
     return SNAFU.from_int(sum_of_snafu_numbers)
 
@@ -37,7 +47,8 @@ if __name__ == "__main__":
 
     day = 25
 
-    raw_data = open(f"puzzle/day_{day}.txt", "r").read()
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
@@ -1,3 +1,7 @@
+from solutions.cache import cached_answer
+from solutions.inputs import load_input
+
+
 def parse_raw(raw: str) -> list[str]:
     return []
 
@@ -14,8 +18,10 @@ if __name__ == "__main__":
 
     day = None
 
-    raw_data = open(f"puzzle/day_{day}.txt", "r").read()
+    raw_data = load_input(day)
     parsed_data = parse_raw(raw_data)
 
-    print(f"part one solution: {part_one(parsed_data)}")
-    print(f"part two solution: {part_two(parsed_data)}")
+    answer = cached_answer(day, "part_one", raw_data, lambda: part_one(parsed_data))
+    print(f"part one solution: {answer}")
+    answer = cached_answer(day, "part_two", raw_data, lambda: part_two(parsed_data))
+    print(f"part two solution: {answer}")
@@ -0,0 +1,245 @@
+"""Check that the alternate engines of a day give the same answers as its reference implementation.
+
+The reference is the plain `parse_raw` / `part_one` / `part_two` of the day (as adapted by `runner.solver_for_day`),
+with its jit kernels running their Python source, and without the answer cache of `run_day`.
+The alternate engines of a day are
+- "stream": solving it line by line with `streaming.solve_stream`, for the streaming days
+- "<kernel>=<variant>": each variant of each jit kernel of the day but the Python one, see `jit.Kernel.variants`
+- the entries of an `Engines` dict in the day module, mapping a name to a function of the raw input
+  that returns the answers of both parts, like `{"part_one": ..., "part_two": ...}`
+
+`compare_day` solves generated inputs of increasing size with the reference and every engine,
+timing each of them and listing the parts whose answers differ, run by `python -m solutions equiv`.
+The timings are appended to a history file, labelled by the git commit, to track speedups across releases.
+"""
+import io
+import json
+import os
+import subprocess
+import time
+import traceback
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Iterator, Optional
+
+from solutions.generators import RealSizes, generate
+from solutions.jit import Kernel
+from solutions.runner import day_module, solver_for_day
+from solutions.streaming import StreamingDays, solve_stream
+
+DefaultScales = (0.1, 0.3, 1)
+DefaultHistoryPath = "benchmarks/equivalence.json"
+
+Engine = Callable[[str], dict[str, Any]]
+
+
+@dataclass
+class Comparison:
+    day: int
+    engine: str
+    scale: float
+    input_bytes: int
+    reference_seconds: float
+    engine_seconds: float
+    # e.g. "part_two: 45000 != 44999", or why the engine failed
+    mismatches: list[str] = field(default_factory=list)
+
+    @property
+    def speedup(self) -> float:
+        return self.reference_seconds / max(self.engine_seconds, 1e-9)
+
+
+def solve_day(day: int, raw: str) -> dict[str, Any]:
+    "Both parts with the parse and parts of the day, as the kernels of the day are currently implemented"
+    solver = solver_for_day(day)
+    answers = {"part_one": solver.part_one(solver.parse(raw))}
+    if solver.part_two is not None:
+        parse_part_two = solver.parse_part_two or solver.parse
+        answers["part_two"] = solver.part_two(parse_part_two(raw))
+    return answers
+
+
+def day_kernels(day: int) -> dict[str, Kernel]:
+    "The jit kernels defined in the day module, kernels imported from other modules are checked with their own day"
+    module = day_module(day)
+    return {
+        name: value
+        for name, value in vars(module).items()
+        if isinstance(value, Kernel) and value.__module__ == module.__name__
+    }
+
+
+def solve_reference(day: int, raw: str) -> dict[str, Any]:
+    with ExitStack() as stack:
+        for kernel in day_kernels(day).values():
+            stack.enter_context(kernel_implementation(kernel, kernel.func))
+        return solve_day(day, raw)
+
+
+@contextmanager
+def kernel_implementation(kernel: Kernel, implementation: Callable) -> Iterator:
+    "Run the kernel with the given implementation within the block"
+    saved = kernel.implementation
+    kernel.implementation = implementation
+    try:
+        yield
+    finally:
+        kernel.implementation = saved
+
+
+def kernel_engine(day: int, kernel: Kernel, implementation: Callable) -> Engine:
+    def solve(raw: str) -> dict[str, Any]:
+        with kernel_implementation(kernel, implementation):
+            return solve_day(day, raw)
+
+    return solve
+
+
+def stream_engine(day: int) -> Engine:
+    return lambda raw: solve_stream(day, io.BytesIO(raw.encode()))
+
+
+def engines_for_day(day: int) -> dict[str, Engine]:
+    module = day_module(day)
+    engines = {}
+    if day in StreamingDays:
+        engines["stream"] = stream_engine(day)
+
+    for name, kernel in day_kernels(day).items():
+        for variant, implementation in kernel.variants().items():
+            # the Python source is what the reference runs
+            if variant != "python":
+                engines[f"{name}={variant}"] = kernel_engine(
+                    day, kernel, implementation
+                )
+
+    engines.update(getattr(module, "Engines", {}))
+    return engines
+
+
+def timed(solve: Engine, raw: str) -> tuple[Optional[dict[str, Any]], float, str]:
+    "Answers, seconds taken and the error if the engine failed"
+    start = time.perf_counter()
+    try:
+        answers, error = solve(raw), ""
+    except Exception:
+        answers, error = None, traceback.format_exc().strip().splitlines()[-1]
+    return answers, time.perf_counter() - start, error
+
+
+def find_mismatches(expected: dict[str, Any], actual: dict[str, Any]) -> list[str]:
+    mismatches = []
+    for part, answer in expected.items():
+        if part not in actual:
+            mismatches.append(f"{part}: missing")
+        elif actual[part] != answer:
+            mismatches.append(f"{part}: {actual[part]} != {answer}")
+    return mismatches
+
+
+def equivalence_input(day: int, scale: float, seed: int = 2022) -> str:
+    "Generate an input of `scale` times the size of the official puzzle input, at least one unit long"
+    return generate(day, max(1, round(RealSizes[day] * scale)), seed=seed)
+
+
+def compare_day(
+    day: int,
+    scales=DefaultScales,
+    engines: Optional[list[str]] = None,
+    seed: int = 2022,
+) -> list[Comparison]:
+    """Compare the engines of a day (or only the ones named in engines) with the reference, at each scale.
+    A day without alternate engines gives no comparisons."""
+    candidates = {
+        name: solve
+        for name, solve in engines_for_day(day).items()
+        if engines is None or name in engines
+    }
+    if not candidates:
+        return []
+
+    comparisons = []
+    for scale in scales:
+        raw = equivalence_input(day, scale, seed=seed)
+        expected, reference_seconds, reference_error = timed(
+            lambda raw: solve_reference(day, raw), raw
+        )
+
+        for name, solve in candidates.items():
+            answers, seconds, error = timed(solve, raw)
+            if reference_error:
+                mismatches = [f"reference failed: {reference_error}"]
+            elif error:
+                mismatches = [f"failed: {error}"]
+            else:
+                mismatches = find_mismatches(expected, answers)
+
+            comparisons.append(
+                Comparison(
+                    day=day,
+                    engine=name,
+                    scale=scale,
+                    input_bytes=len(raw.encode()),
+                    reference_seconds=reference_seconds,
+                    engine_seconds=seconds,
+                    mismatches=mismatches,
+                )
+            )
+    return comparisons
+
+
+def release_label() -> str:
+    "The current git commit, or 'unknown' outside of a git checkout"
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def load_history(path: str = DefaultHistoryPath) -> list[dict]:
+    if not os.path.exists(path):
+        return []
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def append_history(
+    comparisons: list[Comparison],
+    path: str = DefaultHistoryPath,
+    label: Optional[str] = None,
+):
+    "Add a record of the timings of this run to the history file"
+    history = load_history(path)
+    history.append(
+        {
+            "label": label or release_label(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "comparisons": [asdict(c) for c in comparisons],
+        }
+    )
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(history, f, indent=2)
+
+
+def format_comparisons(comparisons: list[Comparison]) -> str:
+    header = (
+        f"{'day':>3} | {'scale':>5} | {'engine':<22} | {'reference':>10} | "
+        f"{'engine':>10} | {'speedup':>7} | result"
+    )
+    rows = [header, "-" * len(header)]
+    for c in comparisons:
+        result = "; ".join(c.mismatches) if c.mismatches else "same"
+        rows.append(
+            f"{c.day:>3} | {c.scale:>4g}x | {c.engine:<22} | "
+            f"{c.reference_seconds * 1000:>8.1f}ms | {c.engine_seconds * 1000:>8.1f}ms | "
+            f"{c.speedup:>6.2f}x | {result}"
+        )
+    return "\n".join(rows)
@@ -0,0 +1,631 @@
+"""Seeded generators of synthetic puzzle inputs, for stress testing the solvers with inputs much larger than the official ones.
+
+Each generator takes a random.Random and a size, and yields fragments of the puzzle text,
+so that huge inputs can be written to disk without holding the whole text in memory.
+The unit of size depends on the day (number of elves, lines, grid cells, valves etc.), see RealSizes.
+"""
+import itertools
+import math
+import random
+import string
+from typing import Callable, Iterable, Iterator
+
+Generator = Callable[[random.Random, int], Iterator[str]]
+
+ChunkSize = 1 << 16
+
+# Roughly the size of the official puzzle inputs, in the unit that each generator takes.
+RealSizes = {
+    1: 250,  # elves
+    2: 2500,  # rounds
+    3: 300,  # rucksacks
+    4: 1000,  # pairs
+    5: 500,  # move instructions
+    6: 4096,  # characters
+    7: 180,  # directories
+    8: 99 * 99,  # grid cells
+    9: 2000,  # motions
+    10: 140,  # instructions
+    11: 8,  # monkeys
+    12: 161 * 41,  # grid cells
+    13: 150,  # packet pairs
+    14: 150,  # rock paths
+    15: 30,  # sensors
+    16: 60,  # valves
+    17: 10091,  # jets
+    18: 2800,  # cubes
+    19: 30,  # blueprints
+    20: 5000,  # numbers
+    21: 2300,  # monkeys
+    22: 6 * 50 * 50,  # map tiles
+    23: 73 * 73,  # grid cells
+    24: 120 * 25,  # inner grid cells
+    25: 120,  # SNAFU numbers
+}
+
+
+def joined(lines: Iterable[str], separator: str = "\n") -> Iterator[str]:
+    "Yield lines with separators in between, so that the text does not end with a newline just like the official inputs"
+    for i, line in enumerate(lines):
+        yield line if i == 0 else separator + line
+
+
+def random_chars(rng: random.Random, alphabet: str, n: int) -> Iterator[str]:
+    "Yield n random characters from alphabet, in chunks"
+    for start in range(0, n, ChunkSize):
+        yield "".join(rng.choices(alphabet, k=min(ChunkSize, n - start)))
+
+
+def grid_shape(size: int, aspect: float = 1.0, min_side: int = 1) -> tuple[int, int]:
+    "Return (width, height) of a grid with about `size` cells and width / height = aspect"
+    height = max(min_side, round(math.sqrt(size / aspect)))
+    width = max(min_side, size // height)
+    return width, height
+
+
+def day_01(rng: random.Random, size: int) -> Iterator[str]:
+    def elves():
+        for _ in range(size):
+            items = rng.randint(1, 15)
+            yield "\n".join(str(rng.randint(1000, 60000)) for _ in range(items))
+
+    return joined(elves(), separator="\n\n")
+
+
+def day_02(rng: random.Random, size: int) -> Iterator[str]:
+    return joined(f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(size))
+
+
+def day_03(rng: random.Random, size: int) -> Iterator[str]:
+    """Rucksacks are made in groups of three. Each group splits the item types into a badge and three private sets,
+    so that exactly one item type is shared by both compartments of a rucksack, and exactly one by the whole group.
+    """
+    items = string.ascii_letters
+
+    def rucksack(private: list[str], badge: str) -> str:
+        repeated = rng.choice(private + [badge])
+        others = [item for item in private if item != repeated]
+        left_pool, right_pool = others[: len(others) // 2], others[len(others) // 2 :]
+        compartment_size = rng.randint(2, 16)
+
+        left = [repeated] + rng.choices(left_pool, k=compartment_size - 1)
+        right = [repeated] + rng.choices(right_pool, k=compartment_size - 1)
+        if repeated != badge:
+            left[1] = badge
+        rng.shuffle(left)
+        rng.shuffle(right)
+        return "".join(left + right)
+
+    def rucksacks():
+        for _ in range(math.ceil(size / 3)):
+            badge, *rest = rng.sample(items, k=len(items))
+            for i in range(3):
+                yield rucksack(rest[i::3], badge)
+
+    return joined(rucksacks())
+
+
+def day_04(rng: random.Random, size: int) -> Iterator[str]:
+    def section(rng: random.Random) -> str:
+        start = rng.randint(1, 99)
+        return f"{start}-{rng.randint(start, 99)}"
+
+    return joined(f"{section(rng)},{section(rng)}" for _ in range(size))
+
+
+def day_05(rng: random.Random, size: int) -> Iterator[str]:
+    "9 stacks of crates. Moves never empty a stack, so both parts always have a crate on top of each stack."
+    size = max(1, size)
+    heights = [rng.randint(2, 8) for _ in range(9)]
+    for row in reversed(range(max(heights))):
+        yield " ".join(
+            f"[{rng.choice(string.ascii_uppercase)}]" if height > row else "   "
+            for height in heights
+        ) + "\n"
+    yield " " + "   ".join(str(i + 1) for i in range(9)) + " \n"
+
+    for _ in range(size):
+        from_stack = rng.choice([i for i, height in enumerate(heights) if height > 1])
+        to_stack = rng.choice([i for i in range(9) if i != from_stack])
+        num = rng.randint(1, heights[from_stack] - 1)
+        heights[from_stack] -= num
+        heights[to_stack] += num
+        yield f"\nmove {num} from {from_stack + 1} to {to_stack + 1}"
+
+
+def day_06(rng: random.Random, size: int) -> Iterator[str]:
+    "The noise uses only 8 kinds of characters, so that the first start-of-message marker is at the very end"
+    yield from random_chars(rng, "abcdefgh", max(0, size - 14))
+    yield "".join(rng.sample("ijklmnopqrstuvwxyz", k=14))
+
+
+def day_07(rng: random.Random, size: int) -> Iterator[str]:
+    def list_directory(budget: int) -> tuple[list[str], list[tuple[str, int]]]:
+        "Make the output of ls for a directory that has `budget` directories below it"
+        subdir_count = rng.randint(1, min(budget, 4)) if budget else 0
+        cuts = sorted(
+            rng.randint(0, budget - subdir_count) for _ in range(subdir_count - 1)
+        )
+        subdir_budgets = [
+            b - a for a, b in itertools.pairwise([0, *cuts, budget - subdir_count])
+        ]
+
+        names = set()
+        entry_count = subdir_count + rng.randint(0, 4)
+        while len(names) < entry_count:
+            names.add("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8))))
+        names = list(names)
+        rng.shuffle(names)
+
+        subdirs = list(zip(names[:subdir_count], subdir_budgets))
+        entries = [f"dir {name}" for name, _ in subdirs]
+        entries += [
+            f"{rng.randint(1000, 300000)} {name}" for name in names[subdir_count:]
+        ]
+        rng.shuffle(entries)
+        return ["$ ls", *entries], subdirs
+
+    def lines():
+        yield "$ cd /"
+        output, subdirs = list_directory(size - 1)
+        yield from output
+
+        pending = [subdirs]
+        while pending:
+            if not pending[-1]:
+                pending.pop()
+                if pending:
+                    yield "$ cd .."
+                continue
+            name, budget = pending[-1].pop()
+            yield f"$ cd {name}"
+            output, subdirs = list_directory(budget)
+            yield from output
+            pending.append(subdirs)
+
+    return joined(lines())
+
+
+def day_08(rng: random.Random, size: int) -> Iterator[str]:
+    width, height = grid_shape(size)
+    return joined("".join(rng.choices(string.digits, k=width)) for _ in range(height))
+
+
+def day_09(rng: random.Random, size: int) -> Iterator[str]:
+    return joined(f"{rng.choice('UDLR')} {rng.randint(1, 19)}" for _ in range(size))
+
+
+def day_10(rng: random.Random, size: int) -> Iterator[str]:
+    "Pad the program with noop so that it runs for at least the 240 cycles needed to draw the screen"
+
+    def lines():
+        cycles = 0
+        for i in itertools.count():
+            if i >= size and cycles >= 240:
+                return
+            if rng.random() < 0.7:
+                cycles += 2
+                yield f"addx {rng.choice([-5, -4, -3, -2, -1, 1, 2, 3, 4, 5])}"
+            else:
+                cycles += 1
+                yield "noop"
+
+    return joined(lines())
+
+
+def primes() -> Iterator[int]:
+    found = []
+    for n in itertools.count(2):
+        if all(n % p for p in found if p * p <= n):
+            found.append(n)
+            yield n
+
+
+def day_11(rng: random.Random, size: int) -> Iterator[str]:
+    size = max(2, size)
+
+    def monkeys():
+        for index, divisor in zip(range(size), primes()):
+            items = ", ".join(
+                str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8))
+            )
+            operation = rng.choice(
+                [
+                    "old * old",
+                    f"old * {rng.randint(2, 19)}",
+                    f"old + {rng.randint(1, 8)}",
+                ]
+            )
+            if_true, if_false = (
+                rng.sample([i for i in range(size) if i != index], k=2)
+                if size > 2
+                else [1 - index] * 2
+            )
+            yield "\n".join(
+                [
+                    f"Monkey {index}:",
+                    f"  Starting items: {items}",
+                    f"  Operation: new = {operation}",
+                    f"  Test: divisible by {divisor}",
+                    f"    If true: throw to monkey {if_true}",
+                    f"    If false: throw to monkey {if_false}",
+                ]
+            )
+
+    return joined(monkeys(), separator="\n\n")
+
+
+def day_12(rng: random.Random, size: int) -> Iterator[str]:
+    """The height rises from a on the left to z on the right, with random pits dug into it.
+    The top row, the leftmost and the rightmost columns are kept free of pits, so that E is always reachable from S.
+    """
+    width, height = grid_shape(size, aspect=4, min_side=2)
+    width = max(width, 26)
+    start_y, end_y = rng.randrange(height), rng.randrange(height)
+
+    def row(y: int) -> str:
+        heights = [x * 26 // width for x in range(width)]
+        if y > 0:
+            for x in range(1, width - 1):
+                if rng.random() < 0.3:
+                    heights[x] = max(0, heights[x] - rng.randint(1, 3))
+        chars = [chr(ord("a") + h) for h in heights]
+        if y == start_y:
+            chars[0] = "S"
+        if y == end_y:
+            chars[-1] = "E"
+        return "".join(chars)
+
+    return joined(row(y) for y in range(height))
+
+
+def day_13(rng: random.Random, size: int) -> Iterator[str]:
+    def packet(depth: int = 0) -> str:
+        elements = [
+            packet(depth + 1)
+            if depth < 4 and rng.random() < 0.3
+            else str(rng.randint(0, 10))
+            for _ in range(rng.randint(0, 5))
+        ]
+        return "[" + ",".join(elements) + "]"
+
+    return joined((f"{packet()}\n{packet()}" for _ in range(size)), separator="\n\n")
+
+
+def day_14(rng: random.Random, size: int) -> Iterator[str]:
+    "The cave gets deeper as more paths are added, so that the rock density stays similar to the official input"
+    depth = 13 + math.isqrt(size) * 13
+
+    def path() -> str:
+        x, y = rng.randint(500 - depth // 2, 500 + depth // 2), rng.randint(13, depth)
+        points = [(x, y)]
+        for i in range(rng.randint(1, 5)):
+            length = rng.randint(1, 10) * rng.choice((-1, 1))
+            if i % 2 == 0:
+                x += length
+            else:
+                y = max(1, y + length)
+            points.append((x, y))
+        return " -> ".join(f"{x},{y}" for x, y in points)
+
+    return joined(path() for _ in range(size))
+
+
+def day_15(rng: random.Random, size: int, boundary: int = 4000000) -> Iterator[str]:
+    """Pick a hole in [0, boundary]^2 and surround it with 8 sensors, 4 touching it along the axes and 4 along the diagonals.
+    Between them they cover every other position of the area, so part two has exactly one answer.
+    The rest of the sensors are scattered randomly, each with a coverage that does not reach the hole.
+    """
+    hole_x, hole_y = rng.randint(0, boundary), rng.randint(0, boundary)
+    r = boundary + 1
+
+    def report(sensor_x: int, sensor_y: int, radius: int) -> str:
+        dx = rng.randint(-radius, radius)
+        dy = (radius - abs(dx)) * rng.choice((-1, 1))
+        return f"Sensor at x={sensor_x}, y={sensor_y}: closest beacon is at x={sensor_x + dx}, y={sensor_y + dy}"
+
+    def reports():
+        for _ in range(max(0, size - 8)):
+            x, y = rng.randint(0, boundary), rng.randint(0, boundary)
+            distance_to_hole = abs(x - hole_x) + abs(y - hole_y)
+            if distance_to_hole > 1:
+                yield report(x, y, rng.randint(1, distance_to_hole - 1))
+            else:
+                yield report(hole_x + r, hole_y, r - 1)
+
+        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+            yield report(hole_x + dx * r, hole_y + dy * r, r - 1)
+        for dx, dy in [(1, 1), (1, -1), (-1, 1), (-1, -1)]:
+            yield report(hole_x + dx * r, hole_y + dy * r, 2 * r - 1)
+
+    return joined(reports())
+
+
+def valve_names(rng: random.Random, size: int) -> list[str]:
+    length = 2 if size <= 26 * 26 else math.ceil(math.log(size, 26))
+    names = set()
+    while len(names) < size - 1:
+        name = "".join(rng.choices(string.ascii_uppercase, k=length))
+        if name != "AA":
+            names.add(name)
+    return ["AA", *names]
+
+
+def day_16(rng: random.Random, size: int) -> Iterator[str]:
+    "A random spanning tree plus some extra tunnels. Like the official input, only up to 15 valves have a non zero flow rate."
+    size = max(2, size)
+    names = valve_names(rng, size)
+    tunnels = [set() for _ in range(size)]
+    edges = [(i, rng.randrange(i)) for i in range(1, size)]
+    edges += [tuple(rng.sample(range(size), k=2)) for _ in range(size // 4)]
+    for a, b in edges:
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+
+    useful = set(rng.sample(range(1, size), k=min(15, size - 1)))
+
+    def line(i: int) -> str:
+        rate = rng.randint(3, 25) if i in useful else 0
+        neighbours = ", ".join(names[j] for j in sorted(tunnels[i]))
+        if len(tunnels[i]) == 1:
+            return f"Valve {names[i]} has flow rate={rate}; tunnel leads to valve {neighbours}"
+        return f"Valve {names[i]} has flow rate={rate}; tunnels lead to valves {neighbours}"
+
+    return joined(line(i) for i in range(size))
+
+
+def day_17(rng: random.Random, size: int) -> Iterator[str]:
+    return random_chars(rng, "<>", size)
+
+
+def day_18(rng: random.Random, size: int) -> Iterator[str]:
+    "Fill a cube with lava at random, with a density similar to the official input"
+    side = max(3, round((size / 0.35) ** (1 / 3)))
+    probability = min(1.0, size / side**3)
+
+    def cubes():
+        for x, y, z in itertools.product(range(side), repeat=3):
+            if (x, y, z) == (0, 0, 0) or rng.random() < probability:
+                yield f"{x},{y},{z}"
+
+    return joined(cubes())
+
+
+def day_19(rng: random.Random, size: int) -> Iterator[str]:
+    def blueprint(i: int) -> str:
+        return (
+            f"Blueprint {i}: Each ore robot costs {rng.randint(2, 4)} ore. "
+            f"Each clay robot costs {rng.randint(2, 4)} ore. "
+            f"Each obsidian robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} clay. "
+            f"Each geode robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} obsidian."
+        )
+
+    return joined(blueprint(i) for i in range(1, size + 1))
+
+
+def day_20(rng: random.Random, size: int) -> Iterator[str]:
+    size = max(2, size)
+    zero_index = rng.randrange(size)
+    return joined(
+        "0" if i == zero_index else str(rng.randint(1, 10000) * rng.choice((-1, 1)))
+        for i in range(size)
+    )
+
+
+def monkey_names(rng: random.Random) -> Iterator[str]:
+    "Unique 4 letters names in a scrambled order, skipping the reserved root and humn"
+    total = 26**4
+    step = rng.randrange(1, total, 2)
+    while math.gcd(step, total) != 1:
+        step = rng.randrange(1, total, 2)
+    offset = rng.randrange(total)
+    for i in range(total):
+        n = (offset + i * step) % total
+        name = "".join(string.ascii_lowercase[(n // 26**k) % 26] for k in range(4))
+        if name not in ("root", "humn"):
+            yield name
+
+
+def day_21(rng: random.Random, size: int) -> Iterator[str]:
+    """Build a random expression tree of `size` monkeys, emitting each monkey after its operands.
+    The right operand of * and / is always a number, and divisions are exact, so that part one has an integer answer.
+    humn is the leftmost leaf, which sits below the left side of root and never under the right side of * or /,
+    so the tree can be reversed in part two without dividing by zero.
+    """
+    size = max(3, size | 1)
+    names = monkey_names(rng)
+    tasks: list[tuple] = [("enter", size, "root")]
+    results: list[tuple[str, int]] = []
+    humn_pending = True
+
+    while tasks:
+        task = tasks.pop()
+        if task[0] == "enter":
+            _, budget, name = task
+            if budget == 1:
+                name = "humn" if humn_pending else next(names)
+                humn_pending = False
+                value = rng.randint(1, 9)
+                results.append((name, value))
+                yield f"{name}: {value}\n"
+                continue
+
+            name = name or next(names)
+            op = "+" if name == "root" else rng.choice("+-*/")
+            tasks.append(("exit", name, op))
+            if op in "*/":
+                tasks.append(("enter", budget - 2, None))
+            else:
+                left_budget = rng.randrange(1, budget - 1, 2)
+                tasks.append(("enter", budget - 1 - left_budget, None))
+                tasks.append(("enter", left_budget, None))
+        else:
+            _, name, op = task
+            if op in "*/":
+                left_name, left_value = results.pop()
+                right_name = next(names)
+                if op == "*":
+                    right_value = rng.randint(1, 9)
+                    value = left_value * right_value
+                else:
+                    right_value = rng.choice(
+                        [d for d in range(1, 10) if left_value % d == 0]
+                    )
+                    value = left_value // right_value
+                yield f"{right_name}: {right_value}\n"
+            else:
+                right_name, right_value = results.pop()
+                left_name, left_value = results.pop()
+                value = (
+                    left_value + right_value if op == "+" else left_value - right_value
+                )
+            results.append((name, value))
+            yield f"{name}: {left_name} {op} {right_name}" + (
+                "" if name == "root" else "\n"
+            )
+
+
+def day_22(rng: random.Random, size: int) -> Iterator[str]:
+    "The map is folded in the same shape as the official input"
+    side = max(2, math.isqrt(size // 6))
+    faces = [(1, 0), (2, 0), (1, 1), (0, 2), (1, 2), (0, 3)]
+
+    for y in range(4 * side):
+        columns = [x for x, face_y in faces if face_y == y // side]
+        row = [" "] * (side * (max(columns) + 1))
+        for x in columns:
+            row[x * side : (x + 1) * side] = rng.choices(".#", weights=(9, 1), k=side)
+        if y == 0:
+            row[side] = "."
+        yield "".join(row).rstrip() + "\n"
+
+    yield "\n"
+    moves = max(1, size // 7)
+    for start in range(0, moves, ChunkSize):
+        yield "".join(
+            f"{rng.choice('LR') if start + i else ''}{rng.randint(1, side)}"
+            for i in range(min(ChunkSize, moves - start))
+        )
+
+
+def day_23(rng: random.Random, size: int) -> Iterator[str]:
+    width, height = grid_shape(size)
+    return joined("".join(rng.choices(".#", k=width)) for _ in range(height))
+
+
+def basin_is_passable(rows: list[str], reverse: bool = False) -> bool:
+    """Check if the expedition can cross a blizzard basin, given its inner rows.
+    The possible positions of the expedition are simulated turn by turn, with each row of the basin kept as a bitmask.
+    As the expedition can always wait at the entrance, the possible positions at turn t + period is a superset of those at turn t.
+    So if they stop growing after a whole period, the exit is unreachable."""
+    height, width = len(rows), len(rows[0])
+    full = (1 << width) - 1
+    masks = {
+        char: [
+            sum(1 << x for x, cell in enumerate(row) if cell == char) for row in rows
+        ]
+        for char in "<>^v"
+    }
+
+    def rotate(mask: int, n: int) -> int:
+        n %= width
+        return ((mask << n) | (mask >> (width - n))) & full
+
+    def blocked(y: int, turn: int) -> int:
+        return (
+            rotate(masks[">"][y], turn)
+            | rotate(masks["<"][y], -turn)
+            | masks["^"][(y + turn) % height]
+            | masks["v"][(y - turn) % height]
+        )
+
+    entrance_y, entrance_bit, exit_y, exit_bit = 0, 1, height - 1, 1 << (width - 1)
+    if reverse:
+        entrance_y, entrance_bit, exit_y, exit_bit = (
+            exit_y,
+            exit_bit,
+            entrance_y,
+            entrance_bit,
+        )
+
+    period = math.lcm(height, width)
+    positions = [0] * height
+    last_checkpoint = None
+    for turn in itertools.count(1):
+        if positions[exit_y] & exit_bit:
+            return True
+        if turn % period == 0:
+            if positions == last_checkpoint:
+                return False
+            last_checkpoint = positions
+
+        spread = [
+            row
+            | (row << 1)
+            | (row >> 1)
+            | (positions[y - 1] if y > 0 else 0)
+            | (positions[y + 1] if y < height - 1 else 0)
+            for y, row in enumerate(positions)
+        ]
+        spread[entrance_y] |= entrance_bit
+        positions = [row & full & ~blocked(y, turn) for y, row in enumerate(spread)]
+
+
+def day_24(rng: random.Random, size: int) -> Iterator[str]:
+    """Like the official input, no blizzard moves vertically in the columns of the entrance and the exit.
+    The basin is rerolled until the expedition can cross it both ways, so the whole basin is kept in memory."""
+    width, height = grid_shape(size, aspect=5, min_side=2)
+
+    def row() -> str:
+        cells = rng.choices(".<>^v", weights=(5, 1, 1, 1, 1), k=width)
+        for x in (0, width - 1):
+            if cells[x] in "^v":
+                cells[x] = rng.choice("<>")
+        return "".join(cells)
+
+    rows = [row() for _ in range(height)]
+    while not (basin_is_passable(rows) and basin_is_passable(rows, reverse=True)):
+        rows = [row() for _ in range(height)]
+
+    lines = itertools.chain(
+        ["#." + "#" * width],
+        (f"#{row}#" for row in rows),
+        ["#" * width + ".#"],
+    )
+    return joined(lines)
+
+
+def day_25(rng: random.Random, size: int) -> Iterator[str]:
+    def snafu() -> str:
+        digits = rng.choices("=-012", k=rng.randint(0, 19))
+        return rng.choice("12") + "".join(digits)
+
+    return joined(snafu() for _ in range(size))
+
+
+Generators: dict[int, Generator] = {
+    int(name[4:]): func for name, func in globals().items() if name.startswith("day_")
+}
+
+
+def generate(day: int, size: int, seed: int = 2022) -> str:
+    return "".join(Generators[day](random.Random(seed), size))
+
+
+def write_input(day: int, path: str, size: int, seed: int = 2022) -> int:
+    "Stream the generated input to a file, and return the number of characters written"
+    written = 0
+    buffer: list[str] = []
+    buffered = 0
+
+    with open(path, "w") as f:
+        for fragment in Generators[day](random.Random(seed), size):
+            buffer.append(fragment)
+            buffered += len(fragment)
+            if buffered >= ChunkSize:
+                f.write("".join(buffer))
+                written += buffered
+                buffer, buffered = [], 0
+        f.write("".join(buffer))
+
+    return written + buffered
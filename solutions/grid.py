@@ -0,0 +1,183 @@
+"""A grid of cells backed by a numpy array, shared by the grid days.
+
+Cells are addressed by integer coordinates, in the order of the array axes (so (x, y) for a grid made from
+lines by `from_lines`). Coordinates may be negative or outside of the array: reading there gives `fill`,
+and writing there grows the array, with enough padding that growing one cell at a time stays cheap.
+Whole grid operations work on shifted views instead of looping over coordinates.
+"""
+import functools
+import itertools
+import operator
+from typing import Callable, Iterable, Iterator, Optional, Sequence
+
+import numpy as np
+
+Coord = tuple[int, ...]
+
+
+@functools.cache
+def unit_vectors(ndim: int) -> list[Coord]:
+    "The 2 * ndim orthogonal neighbour offsets"
+    return [
+        tuple(sign if axis == i else 0 for i in range(ndim))
+        for axis in range(ndim)
+        for sign in (1, -1)
+    ]
+
+
+@functools.cache
+def all_vectors(ndim: int) -> list[Coord]:
+    "The 3 ** ndim - 1 neighbour offsets, diagonals included"
+    return [delta for delta in itertools.product((-1, 0, 1), repeat=ndim) if any(delta)]
+
+
+def shift(array: np.ndarray, delta: Sequence[int], fill=0) -> np.ndarray:
+    "Move the content of an array by delta: shift(a, d)[p + d] == a[p]. Cells moved in from outside get fill."
+    result = np.full_like(array, fill)
+    source, target = [], []
+    for d, size in zip(delta, array.shape):
+        if abs(d) >= size:
+            return result
+        source.append(slice(max(0, -d), size - max(0, d)))
+        target.append(slice(max(0, d), size - max(0, -d)))
+    result[tuple(target)] = array[tuple(source)]
+    return result
+
+
+class Grid:
+    def __init__(
+        self, array: np.ndarray, offset: Optional[Sequence[int]] = None, fill=0
+    ):
+        self.array = array
+        self.offset = tuple(offset) if offset is not None else (0,) * array.ndim
+        self.fill = fill
+
+    @classmethod
+    def zeros(cls, shape: Sequence[int], dtype=bool, offset=None) -> "Grid":
+        return cls(np.zeros(shape, dtype=dtype), offset=offset)
+
+    @classmethod
+    def from_lines(
+        cls, lines: Sequence[str], cell: Callable[[str], int], dtype=np.int8
+    ) -> "Grid":
+        "Grid indexed by (x, y), the value of each cell given by cell(char). Lines should be of equal length."
+        rows = [[cell(char) for char in line] for line in lines]
+        return cls(np.array(rows, dtype=dtype).T)
+
+    @classmethod
+    def from_coords(
+        cls, coords: Iterable[Sequence[int]], padding: int = 0, ndim: int = 2
+    ) -> "Grid":
+        "Boolean grid with the given coordinates set, just large enough to hold them plus padding"
+        points = np.array(list(coords), dtype=int).reshape(-1, ndim)
+        if len(points) == 0:
+            return cls.zeros((1 + 2 * padding,) * ndim, offset=(-padding,) * ndim)
+
+        lower = points.min(axis=0) - padding
+        upper = points.max(axis=0) + padding + 1
+        grid = cls.zeros(upper - lower, offset=lower)
+        grid.array[tuple((points - lower).T)] = True
+        return grid
+
+    @property
+    def ndim(self) -> int:
+        return self.array.ndim
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.array.shape
+
+    @property
+    def lower(self) -> Coord:
+        "The smallest coordinate stored"
+        return self.offset
+
+    @property
+    def upper(self) -> Coord:
+        "One past the largest coordinate stored"
+        return tuple(o + size for o, size in zip(self.offset, self.array.shape))
+
+    def index(self, coord: Sequence[int]) -> Coord:
+        return tuple(map(operator.sub, coord, self.offset))
+
+    def in_bounds(self, coord: Sequence[int]) -> bool:
+        # plain loop, as this is called in the inner loops of the solutions
+        for c, o, size in zip(coord, self.offset, self.array.shape):
+            if not 0 <= c - o < size:
+                return False
+        return True
+
+    def __getitem__(self, coord: Sequence[int]):
+        if not self.in_bounds(coord):
+            return self.fill
+        return self.array.item(self.index(coord))
+
+    def __setitem__(self, coord: Sequence[int], value):
+        if not self.in_bounds(coord):
+            self.grow_to_include(coord)
+        self.array[self.index(coord)] = value
+
+    def grow_to_include(self, coord: Sequence[int], margin: int = 0):
+        """Grow the array so that coord (and margin cells around it) is stored.
+        Each side that grows gets as much padding as the current size, so repeated growth is amortized.
+        """
+        lower = list(self.lower)
+        upper = list(self.upper)
+        for axis, (c, size) in enumerate(zip(coord, self.shape)):
+            if c - margin < lower[axis]:
+                lower[axis] = c - margin - size
+            if c + margin >= upper[axis]:
+                upper[axis] = c + margin + 1 + size
+
+        if lower == list(self.lower) and upper == list(self.upper):
+            return
+
+        shape = [u - l for l, u in zip(lower, upper)]
+        array = np.full(shape, self.fill, dtype=self.array.dtype)
+        start = [o - l for o, l in zip(self.offset, lower)]
+        array[
+            tuple(slice(s, s + size) for s, size in zip(start, self.shape))
+        ] = self.array
+        self.array, self.offset = array, tuple(lower)
+
+    def ensure_margin(self, margin: int = 1):
+        "Make sure that no non-empty cell is within margin of the edge of the array"
+        coords = np.argwhere(self.array != self.fill)
+        if len(coords) == 0:
+            return
+        lower = coords.min(axis=0) + self.offset
+        upper = coords.max(axis=0) + self.offset
+        self.grow_to_include(lower, margin)
+        self.grow_to_include(upper, margin)
+
+    def neighbours(self, coord: Sequence[int], diagonal=False) -> Iterator[Coord]:
+        "Neighbour coordinates within the array"
+        deltas = all_vectors(self.ndim) if diagonal else unit_vectors(self.ndim)
+        for delta in deltas:
+            neighbour = tuple(map(operator.add, coord, delta))
+            if self.in_bounds(neighbour):
+                yield neighbour
+
+    def shifted(self, delta: Sequence[int]) -> np.ndarray:
+        "The array with its content moved by delta, i.e. grid.shifted(d)[index(p + d)] == grid[p]"
+        return shift(self.array, delta, fill=self.fill)
+
+    def coords(self) -> list[Coord]:
+        "Coordinates of the cells that are not empty"
+        return [
+            tuple(int(c) for c in index + self.offset)
+            for index in np.argwhere(self.array != self.fill)
+        ]
+
+    def bounding_box(self) -> tuple[Coord, Coord]:
+        "Smallest and largest coordinates of non-empty cells"
+        indices = np.argwhere(self.array != self.fill)
+        lower = indices.min(axis=0) + self.offset
+        upper = indices.max(axis=0) + self.offset
+        return tuple(map(int, lower)), tuple(map(int, upper))
+
+    def count(self) -> int:
+        return int(np.count_nonzero(self.array != self.fill))
+
+    def copy(self) -> "Grid":
+        return Grid(self.array.copy(), offset=self.offset, fill=self.fill)
@@ -0,0 +1,116 @@
+"""Offline store of puzzle inputs.
+
+Inputs are saved once (by fetch_puzzle.py) under their SHA-256 digest, and an index records the current input of each day.
+Reading an input never touches the network, and importing this module does no I/O.
+
+    puzzle/
+        index.json          {"1": "<sha256>", ...}
+        objects/<sha256>    the raw input text
+"""
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+from typing import Optional
+
+DefaultRoot = os.environ.get("AOC_PUZZLE_DIR", "puzzle")
+
+
+def digest_of(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class InputStore:
+    def __init__(self, root: str = DefaultRoot):
+        self.root = root
+        # the threads of fetch_puzzle.fetch_all share a store, and each of them updates the index
+        self.index_lock = threading.Lock()
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.root, "index.json")
+
+    def object_path(self, digest: str) -> str:
+        return os.path.join(self.root, "objects", digest)
+
+    def legacy_path(self, day: int) -> str:
+        "Where inputs were saved before the store existed"
+        return os.path.join(self.root, f"day_{day:02}.txt")
+
+    def read_index(self) -> dict[str, str]:
+        try:
+            with open(self.index_path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def write_atomic(self, path: str, data: bytes):
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        # a name unique to this call, as several threads or processes may write the same path
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def add(self, day: int, raw: str) -> str:
+        "Save an input and make it the current input of the day. Return its digest."
+        data = raw.encode()
+        digest = digest_of(data)
+        if not os.path.exists(self.object_path(digest)):
+            self.write_atomic(self.object_path(digest), data)
+
+        with self.index_lock:
+            index = self.read_index()
+            index[str(day)] = digest
+            self.write_atomic(self.index_path, json.dumps(index, indent=2).encode())
+        return digest
+
+    def digest(self, day: int) -> Optional[str]:
+        "Digest of the current input of the day. Inputs saved in the legacy location are moved into the store on the way."
+        digest = self.read_index().get(str(day))
+        if digest is None and os.path.exists(self.legacy_path(day)):
+            with open(self.legacy_path(day), "r") as f:
+                digest = self.add(day, f.read())
+        return digest
+
+    def is_valid(self, digest: str) -> bool:
+        "Check that the saved object still matches its digest"
+        try:
+            with open(self.object_path(digest), "rb") as f:
+                return digest_of(f.read()) == digest
+        except FileNotFoundError:
+            return False
+
+    def open(self, day: int, digest: Optional[str] = None) -> mmap.mmap | bytes:
+        """Memory-map an input, so that large inputs can be scanned without reading them into memory.
+        Close it (or use it as a context manager) when done."""
+        digest = digest or self.digest(day)
+        if digest is None:
+            raise FileNotFoundError(
+                f"No input saved for day {day}. Run `python fetch_puzzle.py` to fetch it."
+            )
+
+        with open(self.object_path(digest), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap can't map an empty file
+                return b""
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def load(self, day: int, digest: Optional[str] = None) -> str:
+        buffer = self.open(day, digest)
+        try:
+            return buffer[:].decode()
+        finally:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+
+def load_input(day: int, digest: Optional[str] = None) -> str:
+    return InputStore().load(day, digest)
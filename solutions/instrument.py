@@ -0,0 +1,208 @@
+"""Opt-in instrumentation of the solving phases.
+
+Solutions report what their hot loops did with `count("states", n)`. This does nothing unless a Profiler is recording,
+so it is safe to leave in the solutions. While a Profiler records a phase, it measures wall time, CPU time,
+peak memory allocated (by tracemalloc), peak resident memory of the process and collects the counters,
+and can also run cProfile on it and list the lines holding the most memory near its peak.
+
+    profiler = Profiler(cprofile=True)
+    with profiler.phase("part_one"):
+        day_19.part_one(factory)
+    profiler.save("day_19")  # day_19.json, and day_19.prof for snakeviz / flameprof / gprof2dot
+
+`memory_limit` caps the address space of the process, so that a blowup raises MemoryError instead of swapping.
+"""
+import cProfile
+import json
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from typing import Iterator, Optional
+
+_counters: Optional[Counter] = None
+
+
+def count(name: str, n: int = 1):
+    if _counters is not None:
+        _counters[name] += n
+
+
+def reset_peak_rss():
+    "Only on Linux. Elsewhere the peak resident memory is since the start of the process"
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def peak_rss_bytes() -> int:
+    "Peak resident memory of the process, since the last reset_peak_rss()"
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+@contextmanager
+def memory_limit(limit_bytes: Optional[int]) -> Iterator[None]:
+    """Cap the address space of the process (RLIMIT_AS) within the block, allocating past it raises MemoryError.
+    The cap counts the whole process, including about 100MB for the interpreter and numpy."""
+    if limit_bytes is None:
+        yield
+        return
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit_bytes = min(limit_bytes, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, hard))
+    try:
+        yield
+    finally:
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot, limit: int) -> list[dict]:
+    statistics = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            # the thread of PeakSnapshots
+            tracemalloc.Filter(False, threading.__file__),
+        ]
+    ).statistics("lineno")
+    return [
+        {
+            "site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            "size_bytes": stat.size,
+            "count": stat.count,
+        }
+        for stat in statistics[:limit]
+    ]
+
+
+class PeakSnapshots:
+    """Snapshot the traced allocations whenever they grow past the last snapshot by `growth`, from a thread
+    polling every `interval` seconds. Temporary allocations are gone by the end of a phase, so this finds
+    the lines holding memory at (about) the peak; peaks shorter than the interval can be missed.
+    The thread is started outside of any memory limit, as its stack may not fit under it."""
+
+    def __init__(self, interval: float = 0.005, growth: float = 1.1):
+        self.interval = interval
+        self.growth = growth
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.size = 0
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.poll, daemon=True)
+
+    def poll(self):
+        while not self.stopped.wait(self.interval):
+            self.take_if_grown()
+
+    def take_if_grown(self):
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.size * self.growth:
+            try:
+                self.snapshot, self.size = tracemalloc.take_snapshot(), current
+            except MemoryError:
+                # the snapshots count against the memory limit too, keep the last one that fit
+                self.stopped.set()
+
+    def __enter__(self) -> "PeakSnapshots":
+        soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (hard, hard))
+        try:
+            self.thread.start()
+        finally:
+            resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+        return self
+
+    def __exit__(self, *exc):
+        self.stopped.set()
+        self.thread.join()
+        self.take_if_grown()
+
+
+@dataclass
+class PhaseProfile:
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_memory_bytes: int = 0
+    peak_rss_bytes: int = 0
+    counters: dict[str, int] = field(default_factory=dict)
+    # the lines holding the most memory near the peak, when the traced memory was top_allocations_at_bytes
+    top_allocations: list[dict] = field(default_factory=list)
+    top_allocations_at_bytes: int = 0
+
+
+class Profiler:
+    def __init__(self, cprofile: bool = False, top_allocations: int = 0):
+        "top_allocations: how many of the lines holding the most memory near the peak of each phase to keep"
+        self.phases: dict[str, PhaseProfile] = {}
+        self.cprofile = cProfile.Profile() if cprofile else None
+        self.top_allocations = top_allocations
+
+    @contextmanager
+    def phase(self, name: str):
+        "Record a phase. Recording the same phase again (e.g. parsing for part two) adds to it."
+        global _counters
+        profile = self.phases.setdefault(name, PhaseProfile())
+        counters = Counter(profile.counters)
+
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        reset_peak_rss()
+        _counters = counters
+        snapshots = PeakSnapshots() if self.top_allocations else nullcontext()
+        if self.cprofile:
+            self.cprofile.enable()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+
+        try:
+            with snapshots:
+                yield profile
+        finally:
+            profile.wall_seconds += time.perf_counter() - wall_start
+            profile.cpu_seconds += time.process_time() - cpu_start
+            if self.cprofile:
+                self.cprofile.disable()
+            _counters = None
+            _, peak = tracemalloc.get_traced_memory()
+            if (
+                self.top_allocations
+                and snapshots.snapshot
+                and peak >= profile.peak_memory_bytes
+            ):
+                # keep the sites of the recording with the highest peak
+                profile.top_allocations = top_allocations(
+                    snapshots.snapshot, self.top_allocations
+                )
+                profile.top_allocations_at_bytes = snapshots.size
+            if not was_tracing:
+                tracemalloc.stop()
+            profile.peak_memory_bytes = max(profile.peak_memory_bytes, peak)
+            profile.peak_rss_bytes = max(profile.peak_rss_bytes, peak_rss_bytes())
+            profile.counters = dict(counters)
+
+    def to_dict(self) -> dict:
+        return {name: asdict(profile) for name, profile in self.phases.items()}
+
+    def save(self, path_prefix: str):
+        "Write the phases to <path_prefix>.json, and the cProfile stats to <path_prefix>.prof"
+        with open(f"{path_prefix}.json", "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        if self.cprofile:
+            self.cprofile.dump_stats(f"{path_prefix}.prof")
@@ -0,0 +1,135 @@
+"""Overlap queries over many inclusive integer intervals, e.g. the section assignments of day 4.
+
+`IntervalIndex` answers questions across the whole list of intervals, not just within a pair:
+
+- `overlap_counts`: how many other intervals each one overlaps, from two sorted arrays in O(n log n)
+- `overlapping_pairs`: every overlapping pair, by a sweep in order of first value in O(n log n + k)
+- `overlapping` / `stab`: the intervals overlapping a range or containing a value, in O(log n + k)
+- `count_overlapping`: how many intervals overlap a range, in O(log n)
+
+The range queries go down a centered interval tree: each node keeps the intervals containing its center,
+sorted by first and by last value, and the intervals entirely left and right of it are in its children.
+The tree is built with numpy, a whole node at a time, and small nodes are left as leaves scanned in full.
+Intervals are given by their index in the list the index was built from.
+"""
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+import numpy as np
+
+# intervals of a node left as a leaf, cheaper to scan than to split further
+LeafSize = 32
+
+
+@dataclass
+class Node:
+    # the intervals of a leaf, or the intervals containing center sorted by first value
+    by_first: np.ndarray
+    firsts: np.ndarray
+    center: Optional[int] = None
+    # the intervals containing center sorted by last value, and the children, for inner nodes only
+    by_last: Optional[np.ndarray] = None
+    lasts: Optional[np.ndarray] = None
+    left: Optional["Node"] = None
+    right: Optional["Node"] = None
+
+
+class IntervalIndex:
+    def __init__(self, intervals):
+        "Index intervals given as (first, last) pairs, last included"
+        bounds = np.asarray(intervals, dtype=np.int64).reshape(-1, 2)
+        self.firsts = np.ascontiguousarray(bounds[:, 0])
+        self.lasts = np.ascontiguousarray(bounds[:, 1])
+        if (self.firsts > self.lasts).any():
+            raise ValueError("intervals must end after they start")
+
+        self.order = np.argsort(self.firsts, kind="stable")
+        self.sorted_firsts = self.firsts[self.order]
+        self.last_order = np.argsort(self.lasts, kind="stable")
+        self.sorted_lasts = self.lasts[self.last_order]
+        self.root = self.build(self.order) if len(self) else None
+
+    def __len__(self) -> int:
+        return len(self.firsts)
+
+    def build(self, ids: np.ndarray) -> Node:
+        "The tree of the intervals ids, sorted by first value"
+        firsts, lasts = self.firsts[ids], self.lasts[ids]
+        if len(ids) <= LeafSize:
+            return Node(by_first=ids, firsts=firsts)
+
+        # the first value of the median interval is in at least one interval, so no node is empty
+        center = int(firsts[len(ids) // 2])
+        left, right = lasts < center, firsts > center
+        here = ids[~(left | right)]
+        by_last = here[np.argsort(self.lasts[here], kind="stable")]
+        return Node(
+            by_first=here,
+            firsts=self.firsts[here],
+            center=center,
+            by_last=by_last,
+            lasts=self.lasts[by_last],
+            left=self.build(ids[left]) if left.any() else None,
+            right=self.build(ids[right]) if right.any() else None,
+        )
+
+    def overlap_counts(self) -> np.ndarray:
+        "How many other intervals each interval overlaps"
+        # those starting before its end, less those ending before its start, less itself.
+        # searchsorted is several times faster with sorted values to look up
+        starting = np.empty(len(self), dtype=np.int64)
+        starting[self.last_order] = np.searchsorted(
+            self.sorted_firsts, self.sorted_lasts, side="right"
+        )
+        ended = np.empty(len(self), dtype=np.int64)
+        ended[self.order] = np.searchsorted(
+            self.sorted_lasts, self.sorted_firsts, side="left"
+        )
+        return starting - ended - 1
+
+    def overlapping_pairs(self) -> Iterator[tuple[int, int]]:
+        """Every pair of overlapping intervals once, as (i, j) with i < j.
+        Sweeping in order of first value, an interval overlaps exactly the next ones that start before it ends."""
+        ends = np.searchsorted(
+            self.sorted_firsts, self.lasts[self.order], side="right"
+        ).tolist()
+        order = self.order.tolist()
+        for position, end in enumerate(ends):
+            i = order[position]
+            for j in order[position + 1 : end]:
+                yield (i, j) if i < j else (j, i)
+
+    def overlapping(self, first: int, last: int) -> np.ndarray:
+        "The intervals with a value in common with first..last, in no particular order"
+        found = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            if node.center is None:
+                lasts = self.lasts[node.by_first]
+                found.append(node.by_first[(node.firsts <= last) & (lasts >= first)])
+                children = ()
+            elif last < node.center:
+                found.append(
+                    node.by_first[: np.searchsorted(node.firsts, last, "right")]
+                )
+                children = (node.left,)
+            elif first > node.center:
+                found.append(node.by_last[np.searchsorted(node.lasts, first, "left") :])
+                children = (node.right,)
+            else:
+                found.append(node.by_first)
+                children = (node.left, node.right)
+            stack.extend(child for child in children if child is not None)
+
+        return np.concatenate(found) if found else np.zeros(0, dtype=np.int64)
+
+    def stab(self, value: int) -> np.ndarray:
+        "The intervals containing value, in no particular order"
+        return self.overlapping(value, value)
+
+    def count_overlapping(self, first: int, last: int) -> int:
+        "How many intervals have a value in common with first..last, in O(log n)"
+        starting = np.searchsorted(self.sorted_firsts, last, side="right")
+        ended = np.searchsorted(self.sorted_lasts, first, side="left")
+        return int(starting - ended)
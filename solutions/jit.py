@@ -0,0 +1,61 @@
+"""Optional JIT compilation of the innermost loops, with numba.
+
+A kernel is a function of numpy arrays and scalars written as plain loops, in the subset of Python numba compiles.
+When numba is installed, the kernel is compiled on its first call (and cached on disk by numba).
+Otherwise its fallback runs instead: a version with the same signature that is fast without a compiler,
+e.g. vectorized with numpy, or the kernel itself when its loops are cheap enough in the interpreter.
+
+    @kernel(fallback=mix_with_tuples)
+    def mix(moves: np.ndarray, tokens: np.ndarray, times: int) -> np.ndarray:
+        ...
+
+Set AOC_JIT=0 to always run the fallbacks. numba is only imported on the first call of a kernel.
+"""
+import functools
+import os
+from typing import Callable, Optional
+
+Enabled = os.environ.get("AOC_JIT", "1") != "0"
+
+
+@functools.cache
+def numba_module():
+    if not Enabled:
+        return None
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba
+
+
+def available() -> bool:
+    return numba_module() is not None
+
+
+class Kernel:
+    def __init__(self, func: Callable, fallback: Optional[Callable] = None):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.fallback = fallback or func
+        self.implementation: Optional[Callable] = None
+
+    def compile(self) -> Callable:
+        numba = numba_module()
+        return numba.njit(cache=True)(self.func) if numba else self.fallback
+
+    def variants(self) -> dict[str, Callable]:
+        "Every way to run the kernel, for testing that they agree"
+        variants = {"python": self.func, "fallback": self.fallback}
+        if available():
+            variants["numba"] = self.compile()
+        return variants
+
+    def __call__(self, *args):
+        if self.implementation is None:
+            self.implementation = self.compile()
+        return self.implementation(*args)
+
+
+def kernel(fallback: Optional[Callable] = None) -> Callable[[Callable], Kernel]:
+    return lambda func: Kernel(func, fallback)
@@ -0,0 +1,148 @@
+"""Pull all the integers out of an input in one pass.
+
+Many inputs are lines of numbers wrapped in words, e.g. "Sensor at x=2, y=18: closest beacon is at x=-2, y=15".
+Instead of a regex and int() for every number, `ints` finds the digit runs of the whole buffer with numpy,
+and `int_records` shapes them into one row per line:
+
+    >>> int_records("2-4,6-8\\n2-3,4-5", 4).tolist()
+    [[2, 4, 6, 8], [2, 3, 4, 5]]
+
+A "-" directly before a number makes it negative, unless it follows a digit, as in the ranges above.
+Numbers have at most 18 digits, to fit in int64, longer ones raise ValueError.
+
+numpy is imported on first use. `int_list` and `int_lists` give plain lists, and only use numpy when it is
+already imported or the input is large enough to pay for importing it, so that cheap days start fast.
+"""
+import re
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# below this, a regex is faster than the fixed cost of the numpy calls
+SmallInput = 1 << 10
+# importing numpy takes about as long as a regex over this much input
+LargeInput = 1 << 20
+
+# the most digits that always fit in int64
+MaxDigits = 18
+
+SignedPattern = re.compile(rb"(?<![0-9])-?[0-9]+")
+UnsignedPattern = re.compile(rb"[0-9]+")
+
+
+def scan(buffer: "np.ndarray", signed: bool) -> tuple["np.ndarray", "np.ndarray"]:
+    "The integers in a uint8 array, and where each of them starts"
+    import numpy as np
+
+    digits = buffer - np.uint8(ord("0"))
+    # padded with a non digit on both sides, so that every number has a start and an end
+    is_digit = np.zeros(len(buffer) + 2, dtype=bool)
+    np.less(digits, 10, out=is_digit[1:-1])
+    bounds = np.flatnonzero(is_digit[1:] != is_digit[:-1])
+    starts, ends = bounds[0::2], bounds[1::2]
+    if len(starts) == 0:
+        return np.zeros(0, dtype=np.int64), starts
+
+    # Horner's rule on all numbers at once, one digit position at a time
+    lengths = ends - starts
+    longest = int(lengths.max())
+    if longest > MaxDigits:
+        raise too_long(longest)
+    values = digits[starts].astype(np.int64)
+    for k in range(1, longest):
+        longer = np.flatnonzero(lengths > k)
+        values[longer] = values[longer] * 10 + digits[starts[longer] + k]
+
+    if signed:
+        minus = (starts >= 1) & (buffer[starts - 1] == ord("-"))
+        # is_digit[starts - 1] is whether the character before the "-" is a digit
+        values[minus & ~is_digit[starts - 1]] *= -1
+
+    return values, starts
+
+
+def ints(data: str | bytes, signed: bool = True) -> "np.ndarray":
+    "All the integers in data, in order"
+    import numpy as np
+
+    if isinstance(data, str):
+        data = data.encode()
+
+    if len(data) < SmallInput:
+        pattern = SignedPattern if signed else UnsignedPattern
+        return np.array(regex_ints(pattern, data), dtype=np.int64)
+
+    values, _ = scan(np.frombuffer(data, dtype=np.uint8), signed)
+    return values
+
+
+def int_records(
+    data: str | bytes, per_record: int, signed: bool = True
+) -> "np.ndarray":
+    """The integers in data as an array of shape (lines, per_record).
+    Raise ValueError if a line doesn't have exactly per_record integers."""
+    import numpy as np
+
+    if isinstance(data, str):
+        data = data.encode()
+
+    buffer = np.frombuffer(data.removesuffix(b"\n"), dtype=np.uint8)
+    values, starts = scan(buffer, signed)
+    newlines = np.flatnonzero(buffer == ord("\n"))
+    counts = np.bincount(np.searchsorted(newlines, starts), minlength=len(newlines) + 1)
+    wrong = np.flatnonzero(counts != per_record)
+    if len(wrong):
+        raise wrong_count(wrong[0], counts[wrong[0]], per_record)
+    return values.reshape(-1, per_record)
+
+
+def regex_ints(pattern: re.Pattern, data: bytes) -> list[int]:
+    numbers = pattern.findall(data)
+    longest = max((len(m.lstrip(b"-")) for m in numbers), default=0)
+    if longest > MaxDigits:
+        raise too_long(longest)
+    return [int(m) for m in numbers]
+
+
+def too_long(digits: int) -> ValueError:
+    return ValueError(f"found a number of {digits} digits, at most {MaxDigits} fit")
+
+
+def wrong_count(line: int, count: int, per_record: int) -> ValueError:
+    return ValueError(f"line {line + 1} has {count} integers, expected {per_record}")
+
+
+def worth_numpy(data: bytes) -> bool:
+    return "numpy" in sys.modules or len(data) >= LargeInput
+
+
+def int_list(data: str | bytes, signed: bool = True) -> list[int]:
+    "Same as ints(data).tolist()"
+    if isinstance(data, str):
+        data = data.encode()
+    if worth_numpy(data):
+        return ints(data, signed=signed).tolist()
+
+    pattern = SignedPattern if signed else UnsignedPattern
+    return regex_ints(pattern, data)
+
+
+def int_lists(
+    data: str | bytes, per_record: int, signed: bool = True
+) -> list[list[int]]:
+    "Same as int_records(data, per_record).tolist()"
+    if isinstance(data, str):
+        data = data.encode()
+    if worth_numpy(data):
+        return int_records(data, per_record, signed=signed).tolist()
+
+    pattern = SignedPattern if signed else UnsignedPattern
+    rows = []
+    for line, text in enumerate(data.removesuffix(b"\n").split(b"\n")):
+        row = regex_ints(pattern, text)
+        if len(row) != per_record:
+            raise wrong_count(line, len(row), per_record)
+        rows.append(row)
+    return rows
@@ -0,0 +1,164 @@
+"""Find the days and what they provide without importing them.
+
+Importing a day runs its module level code and its imports (numpy alone takes about 100ms),
+so tools that only need to know which days exist, which have a part two or can be streamed,
+read the source of the day modules with `ast` instead.
+"""
+import ast
+import functools
+import os
+import re
+from dataclasses import dataclass
+
+SolutionsDir = os.path.dirname(__file__)
+
+HeavyModules = frozenset(["numpy", "pandas"])
+
+
+@dataclass(frozen=True)
+class DaySpec:
+    day: int
+    path: str
+    # functions, classes and variables defined at the top of the module
+    names: frozenset[str]
+    # modules imported at the top of the module, imports within functions are lazy and not listed
+    imports: frozenset[str]
+
+    @property
+    def has_part_two(self) -> bool:
+        return "part_two" in self.names
+
+    @property
+    def streaming(self) -> bool:
+        return "parse_lines" in self.names
+
+    @property
+    def heavy_imports(self) -> frozenset[str]:
+        "Heavy modules loaded by importing the day, directly or through other solutions modules"
+        return heavy_imports_of(f"solutions.day_{self.day:02}")
+
+
+def read_module(path: str) -> tuple[frozenset[str], frozenset[str]]:
+    "Names defined and modules imported at the top level of a python file"
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    names, imports = set(), set()
+    for node in tree.body:
+        match node:
+            case ast.FunctionDef(name=name) | ast.ClassDef(name=name):
+                names.add(name)
+            case ast.Assign(targets=targets):
+                names.update(t.id for t in targets if isinstance(t, ast.Name))
+            case ast.AnnAssign(target=ast.Name(id=name)):
+                names.add(name)
+            case ast.Import(names=aliases):
+                imports.update(alias.name for alias in aliases)
+            case ast.ImportFrom(module=module, names=aliases) if module:
+                imports.add(module)
+                # from solutions import grid imports solutions.grid
+                imports.update(f"{module}.{alias.name}" for alias in aliases)
+
+    return frozenset(names), frozenset(imports)
+
+
+def all_imports(path: str) -> frozenset[str]:
+    "Modules imported anywhere in a python file, within functions included"
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    imports = set()
+    for node in ast.walk(tree):
+        match node:
+            case ast.Import(names=aliases):
+                imports.update(alias.name for alias in aliases)
+            case ast.ImportFrom(module=module, names=aliases) if module:
+                imports.add(module)
+                imports.update(f"{module}.{alias.name}" for alias in aliases)
+    return frozenset(imports)
+
+
+def module_path(module: str) -> str:
+    return os.path.join(SolutionsDir, f"{module.removeprefix('solutions.')}.py")
+
+
+def solution_sources(module: str) -> list[str]:
+    "The source files of a solutions module and of the solutions modules it imports, directly or not"
+    sources, pending = set(), [module]
+    while pending:
+        module = pending.pop()
+        path = module_path(module)
+        if not module.startswith("solutions.") or path in sources:
+            continue
+        if os.path.exists(path):
+            sources.add(path)
+            pending.extend(all_imports(path))
+    return sorted(sources)
+
+
+def adapter_source(day: int) -> str:
+    """The source of `runner.solver_for_day` as it applies to day: the cases adapting the other days are left out,
+    and so are comments and formatting."""
+    path = module_path("solutions.runner")
+    if not os.path.exists(path):
+        return ""
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "solver_for_day":
+            for match in ast.walk(node):
+                if isinstance(match, ast.Match):
+                    match.cases = [
+                        case for case in match.cases if matches_day(case.pattern, day)
+                    ]
+            return ast.unparse(node)
+    return ""
+
+
+def matches_day(pattern: ast.pattern, day: int) -> bool:
+    match pattern:
+        case ast.MatchValue(value=ast.Constant(value=value)):
+            return value == day
+        case ast.MatchOr(patterns=patterns):
+            return any(matches_day(p, day) for p in patterns)
+        case ast.MatchAs(pattern=None):
+            # the wildcard case
+            return True
+    return False
+
+
+@functools.cache
+def discover(root: str = SolutionsDir) -> dict[int, DaySpec]:
+    days = {}
+    for filename in sorted(os.listdir(root)):
+        match = re.fullmatch(r"day_(\d\d)\.py", filename)
+        if match:
+            day = int(match.group(1))
+            path = os.path.join(root, filename)
+            days[day] = DaySpec(day, path, *read_module(path))
+    return days
+
+
+@functools.cache
+def heavy_imports_of(module: str) -> frozenset[str]:
+    path = module_path(module)
+    if not module.startswith("solutions.") or not os.path.exists(path):
+        return frozenset()
+
+    _, imports = read_module(path)
+    heavy = {name.partition(".")[0] for name in imports} & HeavyModules
+    for imported in imports:
+        heavy |= heavy_imports_of(imported)
+    return frozenset(heavy)
+
+
+def format_days(days: dict[int, DaySpec]) -> str:
+    header = f"{'day':>3} | {'parts':>5} | {'stream':>6} | heavy imports"
+    rows = [header, "-" * len(header)]
+    for day, spec in days.items():
+        parts = 2 if spec.has_part_two else 1
+        stream = "yes" if spec.streaming else ""
+        heavy = ", ".join(sorted(spec.heavy_imports))
+        rows.append(f"{day:>3} | {parts:>5} | {stream:>6} | {heavy}".rstrip())
+    return "\n".join(rows)
@@ -0,0 +1,288 @@
+import importlib
+import os
+import sys
+import time
+import traceback
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from solutions import instrument
+from solutions.cache import AnswerCache
+from solutions.inputs import load_input
+
+AllDays = range(1, 25 + 1)
+Phases = ("parse", "part_one", "part_two")
+
+
+@dataclass
+class Solver:
+    parse: Callable[[str], Any]
+    part_one: Callable[[Any], Any]
+    part_two: Optional[Callable[[Any], Any]] = None
+    parse_part_two: Optional[Callable[[str], Any]] = None
+
+
+@dataclass
+class DayResult:
+    day: int
+    answers: dict[str, Any] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+    profile: dict[str, dict] = field(default_factory=dict)
+    cached: bool = False
+    out_of_memory: bool = False
+
+
+def day_module(day: int):
+    return importlib.import_module(f"solutions.day_{day:02}")
+
+
+def solver_for_day(day: int) -> Solver:
+    """Wrap a day module into a uniform parse / part_one / part_two interface.
+    Most days follow the template in day_xx.py, the rest are adapted here the same way as their __main__ block does."""
+    module = day_module(day)
+    solver = Solver(
+        parse=getattr(module, "parse_raw", lambda raw: raw),
+        part_one=module.part_one,
+        part_two=getattr(module, "part_two", None),
+    )
+
+    match day:
+        case 3:
+            # not solve_lines, which streaming.solve_stream runs: this is the reference equivalence checks it against,
+            # and run_day times each part on its own
+            solver.parse_part_two = module.parse_raw_part_two
+        case 11:
+
+            def parse_monkeys(raw: str):
+                # monkeys are registered on the class, so clear the ones left by previous runs
+                module.Monkey.reset_monkeys()
+                return module.parse_raw(raw)
+
+            solver.parse = parse_monkeys
+        case 12:
+            solver.part_one = lambda data: module.part_one(*data)
+            solver.part_two = lambda data: module.part_two(*data[1:])
+        case 13:
+            solver.part_two = lambda pairs: module.part_two(
+                module.add_divider_packets(pairs)
+            )
+        case 15:
+            solver.part_one = lambda data: module.part_one(data, y=2000000)
+            solver.part_two = lambda data: module.part_two(data, boundary=4000000)
+        case 22:
+            solver.parse_part_two = lambda raw: module.parse_raw(raw, as_cube=True)
+            solver.part_two = module.part_one
+
+    return solver
+
+
+def clear_instance_caches(day: int):
+    """Clear the caches of methods (e.g. `Network.maximized_release` of day 16).
+    They are keyed by the parsed puzzle, so they only grow in a long-lived process solving many inputs.
+    Caches on module functions are kept warm, those keyed by parts of the input (e.g. `parse_packet_string`
+    of day 13 or `manhattan_distance` of day 15) have a maxsize instead."""
+    module = day_module(day)
+    for cls in vars(module).values():
+        if isinstance(cls, type) and cls.__module__ == module.__name__:
+            for attribute in vars(cls).values():
+                if hasattr(attribute, "cache_clear"):
+                    attribute.cache_clear()
+
+
+def run_day(
+    day: int,
+    raw: Optional[str] = None,
+    profile_dir: Optional[str] = None,
+    cache: Optional[AnswerCache] = None,
+    memory_limit: Optional[int] = None,
+) -> DayResult:
+    """Solve both parts of a day and record the wall-clock time of each phase.
+    The input is parsed again for part two, as several days mutate the parsed data while solving part one.
+    With profile_dir, also record each phase with instrument.Profiler and save it to <profile_dir>/day_NN.json and .prof
+    With cache, return the cached answers if both parts are cached, otherwise solve and cache them.
+    With memory_limit (in bytes), solve with the address space of the process capped, and record the memory of each phase.
+    """
+    result = DayResult(day=day)
+    profiler = (
+        instrument.Profiler(cprofile=bool(profile_dir), top_allocations=5)
+        if profile_dir or memory_limit
+        else None
+    )
+
+    @contextmanager
+    def timed(phase: str):
+        with profiler.phase(phase) if profiler else nullcontext():
+            start = time.perf_counter()
+            yield
+            elapsed = time.perf_counter() - start
+        result.timings[phase] = result.timings.get(phase, 0) + elapsed
+
+    try:
+        raw = load_input(day) if raw is None else raw
+        solver = solver_for_day(day)
+
+        if cache:
+            parts = ["part_one"] + (["part_two"] if solver.part_two else [])
+            answers = {part: cache.get(day, part, raw) for part in parts}
+            if None not in answers.values():
+                result.answers, result.cached = answers, True
+                return result
+
+        with instrument.memory_limit(memory_limit):
+            with timed("parse"):
+                parsed = solver.parse(raw)
+
+            with timed("part_one"):
+                result.answers["part_one"] = solver.part_one(parsed)
+
+            if solver.part_two is not None:
+                parse_part_two = solver.parse_part_two or solver.parse
+                with timed("parse"):
+                    parsed = parse_part_two(raw)
+
+                with timed("part_two"):
+                    result.answers["part_two"] = solver.part_two(parsed)
+
+        if cache:
+            for part, answer in result.answers.items():
+                cache.put(day, part, raw, answer)
+    except MemoryError:
+        result.error = traceback.format_exc()
+        result.out_of_memory = True
+    except Exception:
+        result.error = traceback.format_exc()
+
+    if profiler:
+        result.profile = profiler.to_dict()
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+        profiler.save(os.path.join(profile_dir, f"day_{day:02}"))
+
+    return result
+
+
+def run_days(
+    days: list[int],
+    workers: Optional[int] = None,
+    inputs: Optional[dict[int, str]] = None,
+    profile_dir: Optional[str] = None,
+    cache: Optional[AnswerCache] = None,
+    memory_limit: Optional[int] = None,
+) -> list[DayResult]:
+    """With memory_limit, each day is solved in a fresh process (from Python 3.11,
+    on 3.10 workers are reused and the peak RSS of a day may include the days solved before it in the same worker),
+    so that the memory it reports and the limit it runs under are its own.
+    A single day is otherwise solved in this process, skipping the start up of a pool."""
+    inputs = inputs or {}
+    if len(days) == 1 and not memory_limit:
+        return [run_day(days[0], inputs.get(days[0]), profile_dir, cache)]
+
+    # imported here, as it takes longer to import than solving most days
+    from concurrent.futures import ProcessPoolExecutor
+
+    pool_options = {}
+    if memory_limit and sys.version_info >= (3, 11):
+        pool_options["max_tasks_per_child"] = 1
+
+    with ProcessPoolExecutor(max_workers=workers, **pool_options) as executor:
+        futures = [
+            executor.submit(
+                run_day, day, inputs.get(day), profile_dir, cache, memory_limit
+            )
+            for day in days
+        ]
+        return [future.result() for future in futures]
+
+
+def parse_day_range(spec: str) -> list[int]:
+    """Convert a day range like "1-25" or "1,3,5-7" to a sorted list of days.
+    >>> parse_day_range("1,3,5-7")
+    [1, 3, 5, 6, 7]
+    """
+    days = set()
+    for part in spec.split(","):
+        start, _, stop = part.strip().partition("-")
+        days.update(range(int(start), int(stop or start) + 1))
+
+    if not days.issubset(AllDays):
+        raise ValueError(f"days should be within 1~25, got {spec}")
+
+    return sorted(days)
+
+
+def parse_size(spec: str) -> int:
+    """Convert a size like "512M" or "2G" to bytes.
+    >>> parse_size("1.5K")
+    1536
+    """
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    spec = spec.strip().upper().removesuffix("B")
+    if spec and spec[-1] in units:
+        return int(float(spec[:-1]) * units[spec[-1]])
+    return int(spec)
+
+
+def format_timing_table(results: list[DayResult]) -> str:
+    header = f"{'day':>3} | {'parse':>10} | {'part one':>10} | {'part two':>10}"
+    rows = [header, "-" * len(header)]
+
+    for result in results:
+        if result.out_of_memory:
+            rows.append(f"{result.day:>3} | over memory limit")
+            continue
+        if result.error:
+            rows.append(f"{result.day:>3} | failed")
+            continue
+        if result.cached:
+            rows.append(f"{result.day:>3} | cached")
+            continue
+        cells = [
+            f"{result.timings[phase] * 1000:>8.1f}ms"
+            if phase in result.timings
+            else f"{'-':>10}"
+            for phase in Phases
+        ]
+        rows.append(f"{result.day:>3} | " + " | ".join(cells))
+
+    return "\n".join(rows)
+
+
+def format_answers(results: list[DayResult]) -> str:
+    lines = []
+    for result in results:
+        if result.error:
+            lines.append(f"day {result.day} failed:\n{result.error}")
+            continue
+        for part, answer in result.answers.items():
+            if "\n" in str(answer):
+                answer = f"\n\n{answer}"
+            lines.append(f"day {result.day} {part.replace('_', ' ')}: {answer}")
+    return "\n".join(lines)
+
+
+def format_profiles(results: list[DayResult]) -> str:
+    lines = []
+    for result in results:
+        for phase, profile in result.profile.items():
+            counters = ", ".join(f"{k}={v}" for k, v in profile["counters"].items())
+            lines.append(
+                f"{result.day:>3} | {phase:<8} | wall {profile['wall_seconds'] * 1000:>8.1f}ms"
+                f" | cpu {profile['cpu_seconds'] * 1000:>8.1f}ms"
+                f" | peak {profile['peak_memory_bytes'] / 1024:>9.1f}KiB"
+                f" | rss {profile['peak_rss_bytes'] / 1024:>9.1f}KiB | {counters}".rstrip(
+                    " |"
+                )
+            )
+            if profile["top_allocations"]:
+                lines.append(
+                    f"{'':>3} | {'':<8} | largest allocations when"
+                    f" {profile['top_allocations_at_bytes'] / 1024:.1f}KiB were allocated:"
+                )
+            for allocation in profile["top_allocations"]:
+                lines.append(
+                    f"{'':>3} | {'':<8} | {allocation['size_bytes'] / 1024:>9.1f}KiB"
+                    f" in {allocation['count']} blocks at {allocation['site']}"
+                )
+    return "\n".join(lines)
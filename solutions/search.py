@@ -0,0 +1,200 @@
+"""Shortest path searches over implicit graphs, shared by the search days.
+
+States are integers in range(n_states), so that the frontier is a plain list of ints and visited is a bitmap,
+instead of sets and dicts of tuples. A day maps its own states to ints, e.g. a grid cell (x, y) to x * height + y,
+or a cell at a turn of a repeating pattern to (turn % period) * n_cells + cell (see `time_expanded`).
+Neighbours are given by a function, so the graph is never built.
+
+All searches take several starts (multi-source) and an optional goal predicate, stopping at the first goal reached.
+`bfs_layers` expands a whole frontier at once with numpy, for state spaces too large for a loop over states,
+with a bitmap allocated in pages as they are reached, for state spaces too large for a whole bitmap.
+numpy is only imported by it, so days using the other searches start fast.
+"""
+import heapq
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
+Unreached = -1
+# the visited bitmap of bfs_layers is allocated in pages of 2 ** VisitedPageBits states, as they are reached,
+# so that a large time expanded space only takes memory for the turns searched
+VisitedPageBits = 16
+
+
+@dataclass
+class SearchResult:
+    "The goal reached (None if no goal was reached) and the distances found, Unreached for states not reached"
+    goal: Optional[int]
+    distances: list[int]
+
+    @property
+    def distance(self) -> Optional[int]:
+        return None if self.goal is None else self.distances[self.goal]
+
+
+def time_expanded(turn: int, cell: int, period: int, n_cells: int) -> int:
+    "State of a cell at a turn, for a graph that changes with turns and repeats every period turns"
+    return (turn % period) * n_cells + cell
+
+
+def bfs(
+    starts: Iterable[int],
+    neighbours: Callable[[int], Iterable[int]],
+    n_states: int,
+    is_goal: Optional[Callable[[int], bool]] = None,
+) -> SearchResult:
+    "Breadth first search from all starts, with edges of length 1"
+    distances = [Unreached] * n_states
+    visited = bytearray(n_states)
+    frontier = []
+    for start in starts:
+        if not visited[start]:
+            visited[start] = 1
+            distances[start] = 0
+            frontier.append(start)
+
+    distance = 0
+    while frontier:
+        if is_goal is not None:
+            for state in frontier:
+                if is_goal(state):
+                    return SearchResult(goal=state, distances=distances)
+
+        distance += 1
+        next_frontier = []
+        for state in frontier:
+            for neighbour in neighbours(state):
+                if not visited[neighbour]:
+                    visited[neighbour] = 1
+                    distances[neighbour] = distance
+                    next_frontier.append(neighbour)
+        frontier = next_frontier
+
+    return SearchResult(goal=None, distances=distances)
+
+
+def dijkstra(
+    starts: Iterable[int],
+    neighbours: Callable[[int], Iterable[tuple[int, int]]],
+    n_states: int,
+    is_goal: Optional[Callable[[int], bool]] = None,
+    heuristic: Optional[Callable[[int], int]] = None,
+) -> SearchResult:
+    """Shortest paths with non-negative edge lengths, neighbours giving (neighbour, length) pairs.
+    With a heuristic, this is A*: the heuristic must never overestimate the distance to the nearest goal,
+    nor drop by more than the length of an edge, so that a state is final the first time it is popped.
+    """
+    distances = [Unreached] * n_states
+    done = bytearray(n_states)
+    frontier: list[tuple[int, int]] = []
+    for start in starts:
+        distances[start] = 0
+        frontier.append((heuristic(start) if heuristic else 0, start))
+    heapq.heapify(frontier)
+
+    while frontier:
+        _, state = heapq.heappop(frontier)
+        if done[state]:
+            continue
+        done[state] = 1
+        if is_goal is not None and is_goal(state):
+            return SearchResult(goal=state, distances=distances)
+
+        distance = distances[state]
+        for neighbour, length in neighbours(state):
+            new_distance = distance + length
+            if done[neighbour] or (
+                distances[neighbour] != Unreached
+                and distances[neighbour] <= new_distance
+            ):
+                continue
+            distances[neighbour] = new_distance
+            priority = new_distance + (heuristic(neighbour) if heuristic else 0)
+            heapq.heappush(frontier, (priority, neighbour))
+
+    return SearchResult(goal=None, distances=distances)
+
+
+def astar(
+    starts: Iterable[int],
+    neighbours: Callable[[int], Iterable[tuple[int, int]]],
+    n_states: int,
+    is_goal: Callable[[int], bool],
+    heuristic: Callable[[int], int],
+) -> SearchResult:
+    return dijkstra(starts, neighbours, n_states, is_goal=is_goal, heuristic=heuristic)
+
+
+def unique(states: "np.ndarray") -> "np.ndarray":
+    "Sorted distinct states. Faster than np.unique for the small arrays of a frontier"
+    import numpy as np
+
+    states = np.sort(states)
+    if len(states) == 0:
+        return states
+    return states[np.concatenate(([True], states[1:] != states[:-1]))]
+
+
+class PagedBitmap:
+    """A bitmap over range(n_states), a bit per state packed in numpy uint8 pages,
+    each allocated when a state in it is first set"""
+
+    def __init__(self, n_states: int, page_bits: int = VisitedPageBits):
+        # at least a byte per page
+        self.page_bits = max(min(page_bits, (n_states - 1).bit_length()), 3)
+        self.pages: dict[int, "np.ndarray"] = {}
+
+    def add(self, states: "np.ndarray") -> "np.ndarray":
+        "Set the bits of sorted distinct states, and return the states that weren't set yet"
+        import numpy as np
+
+        page_ids = states >> self.page_bits
+        offsets = states & ((1 << self.page_bits) - 1)
+        bytes_, bits = offsets >> 3, (1 << (offsets & 7)).astype(np.uint8)
+        # states of a page are contiguous, as they are sorted
+        bounds = np.flatnonzero(page_ids[1:] != page_ids[:-1]) + 1
+        is_new = np.empty(len(states), dtype=bool)
+        for start, end in zip([0, *bounds.tolist()], [*bounds.tolist(), len(states)]):
+            page_id = int(page_ids[start])
+            page = self.pages.get(page_id)
+            if page is None:
+                page = np.zeros(1 << (self.page_bits - 3), dtype=np.uint8)
+                self.pages[page_id] = page
+            in_page, bit = bytes_[start:end], bits[start:end]
+            is_new[start:end] = (page[in_page] & bit) == 0
+            # several states may share a byte
+            np.bitwise_or.at(page, in_page, bit)
+        return states[is_new]
+
+
+def bfs_layers(
+    starts: Iterable[int],
+    expand: Callable[["np.ndarray", int], "np.ndarray"],
+    n_states: int,
+    is_goal: Callable[["np.ndarray"], "np.ndarray"],
+    start_depth: int = 0,
+) -> Optional[tuple[int, int]]:
+    """Breadth first search expanding a whole layer at once.
+    expand(frontier, depth) gives the states one step after an array of states at depth (duplicates allowed),
+    and is_goal gives a boolean mask over an array of states.
+    Return (depth, goal) of the first goal reached, or None when every reachable state is visited.
+
+    Visited states are kept in a `PagedBitmap`, checked and set for a whole layer at once.
+    """
+    import numpy as np
+
+    visited = PagedBitmap(n_states, VisitedPageBits)
+    frontier = visited.add(unique(np.fromiter(starts, dtype=np.int64)))
+
+    depth = start_depth
+    while len(frontier):
+        goals = frontier[is_goal(frontier)]
+        if len(goals):
+            return depth, int(goals[0])
+
+        frontier = visited.add(unique(expand(frontier, depth)))
+        depth += 1
+
+    return None
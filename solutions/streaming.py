@@ -0,0 +1,58 @@
+"""Solve line oriented days from a file without reading it into memory.
+
+Days 1, 2, 3, 4, 9, 10 and 25 have a `parse_lines` which lazily turns lines into records,
+and their part_one / part_two consume the records as an iterator. `parse_raw` is `parse_lines` over `raw.split("\\n")`.
+
+Days with a `solve_lines` compute both parts in a single pass over the lines instead, as day 3 does.
+Day 1 also has a `solve_file`, which memory maps the file and sums chunks of it in a pool of processes.
+"""
+from typing import Any, BinaryIO, Iterator, Optional
+
+from solutions.runner import day_module
+
+StreamingDays = (1, 2, 3, 4, 9, 10, 25)
+
+Source = str | BinaryIO
+
+
+def read_lines(source: Source) -> Iterator[str]:
+    "Yield the lines of a file path or a binary stream, without the line breaks"
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            yield from read_lines(f)
+        return
+
+    for line in source:
+        yield line.rstrip(b"\r\n").decode()
+
+
+def solve_stream(day: int, source: Source) -> dict[str, Any]:
+    """Solve both parts, reading the input once for each part, or only once for days with a solve_lines.
+    Otherwise a stream must be seekable, as it is read again from the start for part two."""
+    if day not in StreamingDays:
+        raise ValueError(f"day {day} can't be solved from a stream")
+
+    module = day_module(day)
+    if hasattr(module, "solve_lines"):
+        return module.solve_lines(read_lines(source))
+
+    parse_lines_part_two = getattr(module, "parse_lines_part_two", module.parse_lines)
+
+    answers = {"part_one": module.part_one(module.parse_lines(read_lines(source)))}
+    if hasattr(module, "part_two"):
+        if not isinstance(source, str):
+            source.seek(0)
+        records = parse_lines_part_two(read_lines(source))
+        answers["part_two"] = module.part_two(records)
+
+    return answers
+
+
+def solve_file_parallel(
+    day: int, path: str, workers: Optional[int] = None
+) -> dict[str, Any]:
+    "Solve both parts from a file split in chunks solved in parallel, for days with a solve_file"
+    module = day_module(day)
+    if not hasattr(module, "solve_file"):
+        raise ValueError(f"day {day} can't be solved in parallel chunks")
+    return module.solve_file(path, workers=workers)
@@ -0,0 +1,166 @@
+"""Record sampled frames of the simulation days, to see how a simulation evolves without printing whole worlds.
+
+Simulations emit their state with `frame("sand", step, cells)`, cells being a 2D array of small non-negative
+integers (0 for empty) indexed (row, column) as it should be displayed. This does nothing unless a Recorder is
+recording, so it is safe to leave in the solutions. When building the cells takes work, check `wants` first:
+
+    if trace.wants("valley", turn):
+        trace.frame("valley", turn, draw_valley(turn))
+
+A Recorder keeps one frame every `interval` steps, packed into bit planes in a ring buffer of `capacity` bytes,
+so that the oldest frames are dropped as new ones come in. Frames are drawn as text only on demand, within a viewport:
+
+    recorder = Recorder(interval=500)
+    with recorder.recording():
+        day_14.part_one(rocks)
+    print(recorder.render(recorder.frames[-1], viewport=((0, 480), (30, 520))))
+
+numpy is only imported once a frame is recorded, so that importing this module keeps the CLI fast.
+"""
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterator, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DefaultPalette = ".#o@"
+
+Point = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class Frame:
+    stream: str
+    step: int
+    shape: tuple[int, int]
+    # (row, column) in the coordinates of the simulation of cells[0, 0]
+    origin: Point
+    bits: int
+    # where the packed cells are in the ring buffer
+    start: int
+    size: int
+
+
+# the recorder recording, if any
+_recorder: Optional["Recorder"] = None
+
+
+class Recorder:
+    def __init__(
+        self,
+        interval: int = 1,
+        capacity: int = 1 << 22,
+        streams: Optional[set[str]] = None,
+    ):
+        "Keep a frame every interval steps, of every stream or only of the given streams"
+        self.interval = interval
+        self.streams = streams
+        self.buffer = bytearray(capacity)
+        self.frames: deque[Frame] = deque()
+        # where the next frame is written
+        self.head = 0
+
+    @contextmanager
+    def recording(self) -> Iterator["Recorder"]:
+        global _recorder
+        previous, _recorder = _recorder, self
+        try:
+            yield self
+        finally:
+            _recorder = previous
+
+    def records(self, stream: str) -> bool:
+        return self.streams is None or stream in self.streams
+
+    def record(
+        self, stream: str, step: int, cells: "np.ndarray", origin: Point = (0, 0)
+    ):
+        import numpy as np
+
+        values = np.asarray(cells).astype(np.uint8, copy=False)
+        bits = max(int(values.max(initial=1)).bit_length(), 1)
+        planes = (values >> np.arange(bits, dtype=np.uint8).reshape(-1, 1, 1)) & 1
+        packed = np.packbits(planes)
+
+        start = self.make_room(len(packed))
+        self.buffer[start : start + len(packed)] = packed.tobytes()
+        self.frames.append(
+            Frame(stream, step, values.shape, origin, bits, start, len(packed))
+        )
+
+    def make_room(self, size: int) -> int:
+        "Drop the oldest frames that are in the way of the next size bytes, and return where to write them"
+        if size > len(self.buffer):
+            raise ValueError(
+                f"a frame of {size} bytes doesn't fit in a buffer of {len(self.buffer)}"
+            )
+
+        if self.head + size > len(self.buffer):
+            # wrap around, the frames left at the end of the buffer are the oldest ones
+            while self.frames and self.frames[0].start >= self.head:
+                self.frames.popleft()
+            self.head = 0
+        while self.frames and self.head <= self.frames[0].start < self.head + size:
+            self.frames.popleft()
+
+        start = self.head
+        self.head += size
+        return start
+
+    def frames_of(self, stream: str) -> list[Frame]:
+        return [frame for frame in self.frames if frame.stream == stream]
+
+    def cells(self, frame: Frame) -> "np.ndarray":
+        import numpy as np
+
+        if frame not in self.frames:
+            raise ValueError("the frame was dropped from the ring buffer")
+
+        packed = np.frombuffer(
+            self.buffer, dtype=np.uint8, count=frame.size, offset=frame.start
+        )
+        rows, columns = frame.shape
+        planes = np.unpackbits(packed, count=frame.bits * rows * columns)
+        planes = planes.reshape(frame.bits, rows, columns)
+        weights = (1 << np.arange(frame.bits, dtype=np.uint8)).reshape(-1, 1, 1)
+        return (planes * weights).sum(axis=0)
+
+    def render(
+        self,
+        frame: Frame,
+        viewport: Optional[tuple[Point, Point]] = None,
+        palette: str = DefaultPalette,
+    ) -> str:
+        """Draw a frame with a character of palette for each value.
+        viewport is ((top, left), (bottom, right)) in the coordinates of the simulation, bottom and right excluded.
+        """
+        cells = self.cells(frame)
+        if viewport is not None:
+            (top, left), (bottom, right) = viewport
+            row, column = frame.origin
+            cells = cells[
+                max(top - row, 0) : max(bottom - row, 0),
+                max(left - column, 0) : max(right - column, 0),
+            ]
+
+        return "\n".join("".join(palette[v] for v in row) for row in cells.tolist())
+
+
+def interval(stream: str) -> Optional[int]:
+    "The sampling interval of stream, or None when it's not recorded"
+    if _recorder is None or not _recorder.records(stream):
+        return None
+    return _recorder.interval
+
+
+def wants(stream: str, step: int) -> bool:
+    "Whether a frame of stream at step would be recorded"
+    every = interval(stream)
+    return every is not None and step % every == 0
+
+
+def frame(stream: str, step: int, cells: "np.ndarray", origin: Point = (0, 0)):
+    if wants(stream, step):
+        _recorder.record(stream, step, cells, origin)
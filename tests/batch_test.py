@@ -0,0 +1,23 @@
+from solutions import day_17, day_24
+from solutions.batch import solve_batch, warm_up
+from solutions.generators import generate
+from solutions.runner import run_day
+
+
+def test_solve_batch():
+    inputs = [generate(4, size=50, seed=seed) for seed in range(4)] + ["oops"]
+
+    results = dict(solve_batch(4, inputs, workers=2))
+
+    assert sorted(results) == [0, 1, 2, 3, 4]
+    for index, raw in enumerate(inputs[:4]):
+        assert results[index].answers == run_day(4, raw=raw).answers
+    assert results[4].error is not None
+
+
+def test_warm_up():
+    warm_up(17)
+    warm_up(24)
+
+    assert day_17.rock_array.cache_info().currsize == 5
+    assert day_24.Tile.from_str("v") == day_24.Tile.BlizzardDown
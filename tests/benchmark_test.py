@@ -0,0 +1,151 @@
+import time
+
+import pytest
+
+from solutions import benchmark
+from solutions.benchmark import (
+    Measurement,
+    benchmark_input,
+    find_regressions,
+    format_report,
+    load_baseline,
+    measure,
+    measure_startup,
+    run_benchmark,
+    save_baseline,
+    scaling_exponent,
+)
+from solutions.generators import RealSizes
+from solutions.registry import discover
+from solutions.runner import Solver
+from tests.day_04_test import example as day_04_example
+
+
+def test_benchmark_input():
+    small = benchmark_input(4, scale=1)
+    large = benchmark_input(4, scale=10)
+
+    assert small.count("\n") + 1 == RealSizes[4]
+    assert large.count("\n") + 1 == RealSizes[4] * 10
+    assert benchmark_input(4, scale=1) == small
+
+
+def test_measure():
+    measurement = measure(4, day_04_example, scale=1, repeat=2)
+
+    assert set(measurement.seconds) == {"parse", "part_one", "part_two"}
+    assert measurement.input_bytes == len(day_04_example)
+    assert measurement.throughput("parse") > 0
+
+
+def test_measure_times_both_parses(monkeypatch):
+    solver = Solver(
+        parse=lambda raw: raw,
+        part_one=len,
+        part_two=len,
+        parse_part_two=lambda raw: time.sleep(0.05) or raw,
+    )
+    monkeypatch.setattr(benchmark, "solver_for_day", lambda day: solver)
+
+    measurement = measure(3, "abc", scale=1)
+
+    assert measurement.seconds["parse"] >= 0.05
+    assert measurement.seconds["part_two"] < 0.05
+
+
+def test_scaling_exponent():
+    linear = [
+        Measurement(day=1, scale=1, input_bytes=100, seconds={"parse": 0.01}),
+        Measurement(day=1, scale=10, input_bytes=1000, seconds={"parse": 0.1}),
+        Measurement(day=1, scale=100, input_bytes=10000, seconds={"parse": 1.0}),
+    ]
+    quadratic = [
+        Measurement(day=1, scale=1, input_bytes=100, seconds={"parse": 0.01}),
+        Measurement(day=1, scale=10, input_bytes=1000, seconds={"parse": 1.0}),
+    ]
+
+    assert scaling_exponent(linear, "parse") == pytest.approx(1.0)
+    assert scaling_exponent(quadratic, "parse") == pytest.approx(2.0)
+    assert scaling_exponent(linear[:1], "parse") is None
+    assert scaling_exponent(linear, "part_one") is None
+
+
+def test_run_benchmark_skips_scales(monkeypatch):
+    def fake_measure(day, raw, scale, repeat=1):
+        # day 2 is linear, taking a millisecond at 1x, day 4 takes 0.1s at 1x
+        seconds = scale * (0.1 if day == 4 else 0.001)
+        return Measurement(day, scale, len(raw), seconds={"parse": seconds})
+
+    monkeypatch.setattr(benchmark, "measure", fake_measure)
+    monkeypatch.setattr(benchmark, "benchmark_input", lambda day, scale: "x")
+
+    measurements = run_benchmark(
+        [2, 4, 16], scales=[10, 1, 100], budget=5, max_scales={16: 1}
+    )
+
+    measured = [(m.day, m.scale) for m in measurements if not m.skipped]
+    assert measured == [(2, 1), (2, 10), (2, 100), (4, 1), (16, 1)]
+    skipped = {(m.day, m.scale): m.skipped for m in measurements if m.skipped}
+    # day 4 is assumed to be quadratic from a single scale
+    assert skipped == {
+        (4, 10): "would take about 10s, over the budget of 5s",
+        (4, 100): "would take about 1000s, over the budget of 5s",
+        (16, 10): "over the largest scale of day 16, 1x",
+        (16, 100): "over the largest scale of day 16, 1x",
+    }
+    assert "10x | skipped: would take about 10s" in format_report(measurements)
+
+
+def test_find_regressions():
+    baseline = {"day_01/x10/parse": 0.1, "day_01/x10/part_one": 0.001}
+    measurements = [
+        Measurement(
+            day=1,
+            scale=10,
+            input_bytes=1000,
+            seconds={"parse": 0.2, "part_one": 0.003, "part_two": 5.0},
+        )
+    ]
+
+    assert find_regressions(measurements, baseline) == [
+        "day_01/x10/parse: 200.0ms > baseline 100.0ms"
+    ]
+    assert find_regressions(measurements, baseline, tolerance=1.5) == []
+
+
+def test_save_and_load_baseline(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    measurement = Measurement(day=2, scale=1, input_bytes=10, seconds={"parse": 0.5})
+
+    save_baseline([measurement], path)
+    save_baseline([Measurement(day=3, scale=1, input_bytes=10, seconds={})], path)
+
+    assert load_baseline(path) == {"day_02/x1/parse": 0.5}
+
+
+def test_startup_matches_registry():
+    days = [1, 4, 8, 16]
+    modules = [f"solutions.day_{day:02}" for day in days]
+
+    measurements = measure_startup(modules, repeat=1)
+
+    specs = discover()
+    for day, measurement in zip(days, measurements):
+        assert measurement.seconds > 0
+        assert set(measurement.heavy_imports) == specs[day].heavy_imports
+
+
+def test_cli_starts_without_heavy_imports():
+    (measurement,) = measure_startup(["solutions.__main__"], repeat=1)
+
+    assert measurement.heavy_imports == []
+
+
+def test_cli_starts_without_pools_or_subprocesses(monkeypatch):
+    # the modules of the commands are only imported by their command
+    pools = ["concurrent.futures", "multiprocessing", "socketserver", "subprocess"]
+    monkeypatch.setattr(benchmark, "HeavyModules", pools)
+
+    (measurement,) = measure_startup(["solutions.__main__"], repeat=1)
+
+    assert measurement.heavy_imports == []
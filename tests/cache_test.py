@@ -0,0 +1,114 @@
+import os
+
+import pytest
+
+from solutions import registry
+from solutions.cache import AnswerCache, source_digest
+from solutions.runner import run_day
+from tests.day_04_test import example as day_04_example
+
+
+@pytest.fixture(name="cache")
+def make_cache(tmp_path):
+    yield AnswerCache(root=str(tmp_path))
+
+
+@pytest.fixture(name="sources_dir")
+def make_sources_dir(monkeypatch, tmp_path):
+    "Solutions sources to edit, with the digests computed again for them"
+    monkeypatch.setattr(registry, "SolutionsDir", str(tmp_path))
+    source_digest.cache_clear()
+    yield tmp_path
+    source_digest.cache_clear()
+
+
+def test_answer_is_solved_once(cache):
+    calls = []
+
+    def solve():
+        calls.append(1)
+        return 42
+
+    assert cache.answer(4, "part_one", "2-4,6-8", solve) == 42
+    assert cache.answer(4, "part_one", "2-4,6-8", solve) == 42
+    assert len(calls) == 1
+
+
+def test_key_depends_on_day_part_and_input(cache):
+    cache.put(4, "part_one", "2-4,6-8", 2)
+
+    assert cache.get(4, "part_one", "2-4,6-8") == 2
+    assert cache.get(4, "part_two", "2-4,6-8") is None
+    assert cache.get(5, "part_one", "2-4,6-8") is None
+    assert cache.get(4, "part_one", "2-4,6-9") is None
+
+
+def test_key_depends_on_shared_modules(sources_dir):
+    (sources_dir / "day_04.py").write_text(
+        "def part_one(data):\n    from solutions.helper import count\n    return count(data)\n"
+    )
+    helper = sources_dir / "helper.py"
+    helper.write_text("def count(data):\n    return len(data)\n")
+
+    before = source_digest(4)
+    helper.write_text("def count(data):\n    return len(data) + 1\n")
+    source_digest.cache_clear()
+    assert source_digest(4) != before
+
+
+def test_key_depends_on_the_adapter_of_the_day(sources_dir):
+    (sources_dir / "day_15.py").write_text("def part_one(data, y):\n    return y\n")
+    runner = sources_dir / "runner.py"
+    adapter = """
+def solver_for_day(day):
+    match day:
+        case 15:
+            part_one = lambda data: module.part_one(data, y={y})
+        case 22:
+            part_two = {part_two}
+"""
+    runner.write_text(adapter.format(y=2000000, part_two="part_one"))
+    before = source_digest(15)
+    # computed once per day
+    runner.write_text(adapter.format(y=10, part_two="part_one"))
+    assert source_digest(15) == before
+
+    source_digest.cache_clear()
+    assert source_digest(15) != before
+
+    changed = source_digest(15)
+    runner.write_text(adapter.format(y=10, part_two="part_two"))
+    source_digest.cache_clear()
+    assert source_digest(15) == changed
+
+
+def test_answers_are_stored_as_json(cache):
+    cache.put(10, "part_two", "noop", "##..\n..##")
+    cache.put(8, "part_one", "30373", True)
+
+    assert cache.get(10, "part_two", "noop") == "##..\n..##"
+    assert cache.get(8, "part_one", "30373") is None
+
+
+def test_least_recently_used_answers_are_evicted(tmp_path):
+    cache = AnswerCache(root=str(tmp_path), max_bytes=150)
+    for i, raw in enumerate(["a", "b", "c"]):
+        cache.put(1, "part_one", raw, i)
+        # make the order of use visible to mtime
+        os.utime(cache.path(cache.key(1, "part_one", raw)), (i, i))
+    cache.get(1, "part_one", "a")
+    cache.put(1, "part_one", "d", 3)
+
+    assert cache.get(1, "part_one", "a") == 0
+    assert cache.get(1, "part_one", "b") is None
+    assert cache.get(1, "part_one", "d") == 3
+
+
+def test_run_day_uses_cache(cache):
+    first = run_day(4, raw=day_04_example, cache=cache)
+    second = run_day(4, raw=day_04_example, cache=cache)
+
+    assert not first.cached
+    assert second.cached
+    assert second.answers == first.answers == {"part_one": 2, "part_two": 4}
+    assert second.timings == {}
@@ -0,0 +1,76 @@
+import threading
+
+import pytest
+
+from solutions.daemon import SolverServer, Solvers, ask
+from solutions.generators import generate
+from solutions.runner import day_module
+from tests.day_04_test import example as day_04_example
+from tests.day_11_test import example as day_11_example
+from tests.day_13_test import example as day_13_example
+
+
+@pytest.fixture(scope="module", name="solvers")
+def make_solvers():
+    yield Solvers(max_answers=2)
+
+
+@pytest.fixture(scope="module", name="socket_path")
+def start_daemon(tmp_path_factory, solvers):
+    socket_path = str(tmp_path_factory.mktemp("daemon") / "aoc.sock")
+    server = SolverServer(socket_path, solvers=solvers)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+
+
+def test_ask(socket_path):
+    assert ask(4, "part_one", day_04_example, socket_path) == 2
+    assert ask(4, "part_two", day_04_example, socket_path) == 4
+    assert ask(13, "part_two", day_13_example, socket_path) == 140
+    # day 11 keeps the monkeys on the class, they must be reset between requests
+    assert ask(11, "part_one", day_11_example, socket_path) == 10605
+    assert ask(11, "part_two", day_11_example, socket_path) == 2713310158
+
+
+def test_ask_error(socket_path):
+    with pytest.raises(RuntimeError, match="day 25 has no part_two"):
+        ask(25, "part_two", "1=", socket_path)
+
+
+def test_answers_are_bounded(solvers):
+    for raw in ["1", "2", "3"]:
+        solvers.solve(1, "part_one", raw)
+
+    assert len(solvers.answers) == 2
+    assert [part for _, part, _ in solvers.answers] == ["part_one", "part_one"]
+
+
+def cache_infos(day: int) -> dict[str, tuple]:
+    "The cache_info of every functools cache of the day module, on its functions and on its classes"
+    module = day_module(day)
+    functions = dict(vars(module))
+    for cls in vars(module).values():
+        if isinstance(cls, type) and cls.__module__ == module.__name__:
+            for name, attribute in vars(cls).items():
+                functions[f"{cls.__name__}.{name}"] = getattr(
+                    attribute, "__func__", attribute
+                )
+    return {
+        name: function.cache_info()
+        for name, function in functions.items()
+        if hasattr(function, "cache_info")
+    }
+
+
+@pytest.mark.parametrize("day", [13, 15, 16])
+def test_caches_stay_flat(solvers, day):
+    solvers.solve(day, "part_one", generate(day, 10, seed=0))
+    first = cache_infos(day)
+    for seed in range(1, 5):
+        solvers.solve(day, "part_one", generate(day, 10, seed=seed))
+
+    # a cache keyed by the input either has a maxsize, or is cleared after each request
+    for name, info in cache_infos(day).items():
+        assert info.maxsize is not None or info.currsize == first[name].currsize, name
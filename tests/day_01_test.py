@@ -0,0 +1,93 @@
+import pytest
+
+from solutions.day_01 import (
+    chunk_bounds,
+    elf_totals,
+    parse_raw,
+    part_one,
+    part_two,
+    solve_file,
+    solve_numpy,
+    top_k,
+)
+from solutions.generators import generate
+
+example = """1000
+2000
+3000
+
+4000
+
+5000
+6000
+
+7000
+8000
+9000
+
+10000"""
+
+
+def test_parse_raw():
+    assert parse_raw(example) == [6000, 4000, 11000, 24000, 10000]
+
+
+def test_elf_totals():
+    assert elf_totals(example).tolist() == [6000, 4000, 11000, 24000, 10000]
+    # several blank lines in a row, and at the ends
+    assert elf_totals("\n\n1\n2\n\n\n\n3\n\n").tolist() == [3, 3]
+    assert elf_totals("").tolist() == []
+
+
+def test_part_one():
+    assert part_one(parse_raw(example)) == 24000
+
+
+def test_part_two():
+    assert part_two(parse_raw(example)) == 45000
+    assert part_two(parse_raw(example), k=1) == 24000
+
+
+def test_top_k():
+    totals = elf_totals(example)
+
+    assert sorted(top_k(totals)) == [10000, 11000, 24000]
+    assert top_k(totals, k=1) == [24000]
+    assert sorted(top_k(totals, k=10)) == [4000, 6000, 10000, 11000, 24000]
+
+
+def test_solve_numpy():
+    assert solve_numpy(example) == {"part_one": 24000, "part_two": 45000}
+    assert solve_numpy(example, k=1) == {"part_one": 24000, "part_two": 24000}
+
+
+def test_chunk_bounds():
+    data = (example + "\n\n\n" + example).encode()
+    bounds = chunk_bounds(data, chunk_size=7)
+
+    assert len(bounds) > 1
+    assert b"".join(data[start:end] for start, end in bounds) == data
+    # chunks are cut between the two newlines of a blank line, so no elf is cut in two
+    assert all(data[start - 1 : start + 1] == b"\n\n" for start, _ in bounds[1:])
+    assert chunk_bounds(data, chunk_size=len(data)) == [(0, len(data))]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_solve_file(workers, tmp_path):
+    raw = generate(1, size=300, seed=3)
+    path = tmp_path / "input.txt"
+    path.write_text(raw + "\n")
+    totals = parse_raw(raw)
+
+    assert solve_file(str(path), workers=workers, chunk_size=200) == {
+        "part_one": part_one(totals),
+        "part_two": part_two(totals),
+    }
+
+
+def test_solve_file_rejects_empty_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("")
+
+    with pytest.raises(ValueError, match="empty"):
+        solve_file(str(path))
@@ -1,8 +1,12 @@
+import pytest
+
 from solutions.day_02 import (
+    count_rounds,
     parse_raw,
     part_one,
     part_two,
     player_shape_score_part_two,
+    solve_counts,
     win_lose_score,
 )
 
@@ -55,3 +59,17 @@ def test_part_two():
     input_data = [("A", "Y"), ("B", "X"), ("C", "Z")]
 
     assert part_two(input_data) == 12
+
+
+def test_count_rounds():
+    counts = count_rounds("A Y\nB X\nC Z\nA Y\n")
+
+    assert counts[("A", "Y")] == 2
+    assert sum(counts.values()) == 4
+    assert sum(count_rounds("").values()) == 0
+    with pytest.raises(ValueError):
+        count_rounds("A Y\nB W\nC Z")
+
+
+def test_solve_counts():
+    assert solve_counts("A Y\nB X\nC Z\nA Y\n") == {"part_one": 23, "part_two": 16}
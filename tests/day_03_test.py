@@ -1,10 +1,19 @@
+import pytest
+
 from solutions.day_03 import (
+    common_priorities,
+    compartment_masks,
     find_repeat_item,
+    group_masks,
+    item_mask,
     item_priority,
+    mask_priority,
     parse_raw,
     parse_raw_part_two,
     part_one,
     part_two,
+    solve_lines,
+    solve_numpy,
 )
 
 example = """vJrwpWtwJgWrhcsFMMfFFhFp
@@ -78,3 +87,34 @@ def test_part_two():
     actual = part_two(input_data)
 
     assert actual == expected
+
+
+def test_item_mask():
+    assert item_mask("aab") == 0b11
+    assert item_mask("Z") == 1 << 51
+    assert mask_priority(item_mask("Z")) == 52
+    with pytest.raises(ValueError):
+        mask_priority(item_mask("ab"))
+    with pytest.raises(ValueError):
+        mask_priority(0)
+
+
+def test_masks():
+    assert compartment_masks("abca\nZz").tolist() == [
+        [item_mask("ab"), item_mask("ca")],
+        [item_mask("Z"), item_mask("z")],
+    ]
+    # the last incomplete group is left out, as in parse_raw_part_two
+    assert group_masks("a\nb\nc\nd").tolist() == [
+        [item_mask("a"), item_mask("b"), item_mask("c")]
+    ]
+    assert solve_numpy(example) == {"part_one": 157, "part_two": 70}
+    with pytest.raises(ValueError):
+        common_priorities(compartment_masks("ab"))
+
+
+def test_solve_lines():
+    # a single pass over an iterator, the last line being left out of part two as it isn't in a full group
+    lines = iter(example.split("\n") + ["abca"])
+
+    assert solve_lines(lines) == {"part_one": 157 + 1, "part_two": 70}
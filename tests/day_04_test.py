@@ -1,4 +1,14 @@
-from solutions.day_04 import find_overlap, parse_raw, part_one, part_two
+from solutions.day_04 import (
+    assignment_index,
+    contains,
+    find_overlap,
+    overlaps,
+    parse_raw,
+    part_one,
+    part_two,
+    solve_numpy,
+)
+from solutions.parsing import int_records
 
 example = """2-4,6-8
 2-3,4-5
@@ -56,3 +66,23 @@ def test_part_two():
     actual = part_two(data=input_data)
 
     assert actual == expected
+
+
+def test_vectorized():
+    pairs = int_records(example, 4)
+
+    assert contains(pairs).tolist() == [False, False, False, True, True, False]
+    assert overlaps(pairs).tolist() == [False, False, True, True, True, True]
+    assert solve_numpy(example) == {"part_one": 2, "part_two": 4}
+
+
+def test_assignment_index():
+    index = assignment_index(parse_raw(example))
+
+    # 2-8 overlaps all the eleven others
+    assert index.overlap_counts()[6] == 11
+    assert (index.overlap_counts() > 0).all()
+    assert sorted(index.stab(8).tolist()) == [1, 5, 6, 11]
+    pairs = set(index.overlapping_pairs())
+    # 2-4 and 2-8, but not 2-3 and 4-5 of the second pair
+    assert (0, 6) in pairs and (2, 3) not in pairs
@@ -1,11 +1,11 @@
 import pytest
 
 from solutions.day_12 import (
+    climbable_neighbours,
     find_shortest_path_length,
     parse_raw,
     part_one,
     part_two,
-    reachable_neighbours,
 )
 
 example = """Sabqponm
@@ -28,9 +28,9 @@ def test_parse_raw():
         ],
     )
 
-    actual = parse_raw(example)
+    start, dest, grid = parse_raw(example)
 
-    assert actual == expected
+    assert (start, dest, grid.array.T.tolist()) == expected
 
 
 @pytest.fixture(name="example_grid", scope="session")
@@ -39,7 +39,17 @@ def create_example_grid():
     yield grid
 
 
-def test_reachable_neighbours(example_grid):
+def reachable_neighbours(curr_coord, grid, reversed=False):
+    "climbable_neighbours of a coordinate, as coordinates"
+    _, height = grid.shape
+    neighbours = climbable_neighbours(grid, reversed=reversed)
+    return [
+        divmod(state, height)
+        for state in neighbours(curr_coord[0] * height + curr_coord[1])
+    ]
+
+
+def test_climbable_neighbours(example_grid):
     test_cases = [
         [(0, 0), [(0, 1), (1, 0)]],
         # top b, can go back to a or c
@@ -59,7 +69,7 @@ def test_reachable_neighbours(example_grid):
         assert sorted(actual) == sorted(expected)
 
 
-def test_reachable_neighbours_reverse(example_grid):
+def test_climbable_neighbours_reverse(example_grid):
     """reverse the reachable function to get path from dest to start"""
     test_cases = [
         # third row z, can go to y or dest only
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from solutions import day_01, day_14
+from solutions.equivalence import (
+    Comparison,
+    append_history,
+    compare_day,
+    engines_for_day,
+    equivalence_input,
+    format_comparisons,
+    load_history,
+    solve_day,
+    solve_reference,
+)
+from solutions.parsing import LargeInput
+
+
+def test_engines_for_day():
+    assert set(engines_for_day(1)) == {"stream", "numpy"}
+    assert set(engines_for_day(2)) == {"stream", "counts"}
+    assert set(engines_for_day(3)) == {"stream", "numpy"}
+    assert set(engines_for_day(4)) == {"stream", "numpy"}
+    # the Python source of a kernel is the reference, not an engine
+    assert "pour_sand=fallback" in engines_for_day(14)
+    assert "pour_sand=python" not in engines_for_day(14)
+    assert engines_for_day(5) == {}
+
+
+def test_compare_day():
+    comparisons = compare_day(1, scales=[0.1, 1])
+
+    assert [(c.engine, c.scale) for c in comparisons] == [
+        ("stream", 0.1),
+        ("numpy", 0.1),
+        ("stream", 1),
+        ("numpy", 1),
+    ]
+    assert comparisons[0].input_bytes < comparisons[2].input_bytes
+    assert all(c.mismatches == [] for c in comparisons)
+    assert compare_day(5, scales=[0.1]) == []
+
+
+@pytest.mark.parametrize("day", [1, 2, 3, 4])
+def test_engines_match_reference(day):
+    comparisons = compare_day(day, scales=[0.1, 1])
+
+    assert len(comparisons) == 2 * len(engines_for_day(day))
+    assert all(c.mismatches == [] for c in comparisons)
+
+
+def test_compare_day_large_input(monkeypatch):
+    # the reference stays on the list path past LargeInput, so a wrong numpy path is caught there too
+    monkeypatch.setattr(day_01, "elf_totals", lambda raw: np.array([1, 2, 3]))
+
+    (comparison,) = compare_day(1, scales=[100], engines=["numpy"])
+
+    assert comparison.input_bytes >= LargeInput
+    assert comparison.mismatches[0].startswith("part_one: 3 != ")
+
+
+def test_solve_reference_runs_kernels_as_python(monkeypatch):
+    raw = equivalence_input(14, 0.1)
+    expected = solve_day(14, raw)
+    monkeypatch.setattr(day_14.pour_sand, "implementation", lambda *args: 1 // 0)
+
+    assert solve_reference(14, raw) == expected
+    with pytest.raises(ZeroDivisionError):
+        solve_day(14, raw)
+
+
+def test_compare_day_finds_mismatches(monkeypatch):
+    engines = {
+        "part_one_only": lambda raw: {"part_one": 0},
+        "broken": lambda raw: 1 // 0,
+    }
+    monkeypatch.setattr(day_01, "Engines", engines, raising=False)
+
+    comparisons = compare_day(1, scales=[0.1], engines=list(engines))
+
+    part_one_only, broken = comparisons
+    assert part_one_only.mismatches[0].startswith("part_one: 0 != ")
+    assert part_one_only.mismatches[1] == "part_two: missing"
+    assert broken.mismatches == [
+        "failed: ZeroDivisionError: integer division or modulo by zero"
+    ]
+    assert "part_two: missing" in format_comparisons(comparisons)
+
+
+def test_history(tmp_path):
+    path = str(tmp_path / "history.json")
+    comparison = Comparison(
+        day=1,
+        engine="stream",
+        scale=1,
+        input_bytes=100,
+        reference_seconds=0.2,
+        engine_seconds=0.1,
+    )
+
+    assert load_history(path) == []
+    append_history([comparison], path, label="v1")
+    append_history([comparison], path, label="v2")
+
+    history = load_history(path)
+    assert [record["label"] for record in history] == ["v1", "v2"]
+    assert history[1]["comparisons"][0]["engine_seconds"] == 0.1
+    assert comparison.speedup == 2
@@ -0,0 +1,105 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fetch_puzzle import RateLimiter, fetch_all
+from solutions.inputs import InputStore
+
+
+class FakeServer(BaseHTTPRequestHandler):
+    "Serve `input of day N` for /day/N/input, failing the first request of some days"
+
+    requests: list[str] = []
+    flaky_days = {3}
+    missing_days = {5}
+
+    def do_GET(self):
+        day = int(self.path.split("/")[2])
+        FakeServer.requests.append(self.path)
+        if self.headers["Cookie"] != "session=secret":
+            self.send_error(400)
+        elif day in self.missing_days:
+            self.send_error(404)
+        elif day in self.flaky_days and FakeServer.requests.count(self.path) == 1:
+            self.send_error(503)
+        else:
+            body = f"input of day {day}\n".encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(name="url")
+def start_server():
+    FakeServer.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeServer)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/day/{{day}}/input"
+    server.shutdown()
+
+
+@pytest.fixture(name="store")
+def make_store(tmp_path):
+    yield InputStore(root=str(tmp_path))
+
+
+def test_fetch_all(url, store):
+    outcomes = fetch_all(
+        days=[1, 2, 3, 5],
+        rate=100,
+        backoff=0.01,
+        url=url,
+        session="secret",
+        store=store,
+    )
+
+    assert outcomes[1] == outcomes[2] == outcomes[3] == "fetched"
+    assert outcomes[5].startswith("failed")
+    assert store.load(3) == "input of day 3"
+    # 404 is not retried, 503 is
+    assert FakeServer.requests.count("/day/5/input") == 1
+    assert FakeServer.requests.count("/day/3/input") == 2
+
+
+def test_fetch_all_many_threads(url, store):
+    days = [day for day in range(1, 26) if day not in FakeServer.missing_days]
+    outcomes = fetch_all(
+        days=days,
+        max_workers=8,
+        rate=0,
+        backoff=0.01,
+        url=url,
+        session="secret",
+        store=store,
+    )
+
+    assert set(outcomes.values()) == {"fetched"}
+    assert all(store.load(day) == f"input of day {day}" for day in days)
+
+
+def test_fetch_all_skips_cached_inputs(url, store):
+    store.add(1, "input of day 1")
+
+    outcomes = fetch_all(days=[1, 2], rate=100, url=url, session="secret", store=store)
+
+    assert outcomes == {1: "cached", 2: "fetched"}
+    assert FakeServer.requests == ["/day/2/input"]
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(rate=50)
+    threads = [threading.Thread(target=limiter.wait) for _ in range(6)]
+
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - start >= 5 / 50
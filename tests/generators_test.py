@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from solutions import day_15
+from solutions.generators import (
+    Generators,
+    basin_is_passable,
+    generate,
+    write_input,
+)
+from solutions.runner import run_day, solver_for_day
+
+
+def test_all_days_have_a_generator():
+    assert sorted(Generators) == list(range(1, 26))
+
+
+@pytest.mark.parametrize("day", range(1, 26))
+def test_generated_input_can_be_parsed(day):
+    raw = generate(day, size=20, seed=1)
+
+    assert not raw.endswith("\n")
+    solver_for_day(day).parse(raw)
+
+
+@pytest.mark.parametrize(
+    "day", [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 13, 14, 18, 20, 21, 22, 23, 25]
+)
+def test_generated_input_can_be_solved(day):
+    result = run_day(day, raw=generate(day, size=60, seed=1))
+
+    assert result.error is None
+
+
+def test_generate_is_deterministic():
+    assert generate(8, size=100, seed=3) == generate(8, size=100, seed=3)
+    assert generate(8, size=100, seed=3) != generate(8, size=100, seed=4)
+
+
+def test_write_input(tmp_path):
+    path = tmp_path / "day_01.txt"
+    written = write_input(1, str(path), size=20000, seed=5)
+
+    assert path.read_text() == generate(1, size=20000, seed=5)
+    assert written == len(path.read_text())
+
+
+def test_day_03_rucksacks_share_exactly_one_item():
+    lines = generate(3, size=300, seed=7).splitlines()
+
+    for line in lines:
+        half = len(line) // 2
+        assert len(set(line[:half]) & set(line[half:])) == 1
+    for i in range(0, len(lines), 3):
+        a, b, c = lines[i : i + 3]
+        assert len(set(a) & set(b) & set(c)) == 1
+
+
+def test_day_15_has_exactly_one_hole():
+    boundary = 20
+    for seed in range(5):
+        raw = "".join(Generators[15](random.Random(seed), 12, boundary=boundary))
+        sensor_and_beacons = day_15.parse_raw(raw)
+        holes = [
+            (x, y)
+            for x in range(boundary + 1)
+            for y in range(boundary + 1)
+            if all(
+                day_15.manhattan_distance(sensor, (x, y))
+                > day_15.manhattan_distance(sensor, beacon)
+                for sensor, beacon in sensor_and_beacons
+            )
+        ]
+
+        assert holes == [day_15.find_only_hole_on_map(sensor_and_beacons, boundary)]
+
+
+def test_basin_is_passable():
+    assert basin_is_passable(["..", ".."])
+    assert basin_is_passable(["..", ".."], reverse=True)
+    # the only way out of the entrance is blocked forever
+    assert not basin_is_passable(["<<", ".."])
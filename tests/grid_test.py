@@ -0,0 +1,64 @@
+import numpy as np
+
+from solutions.grid import Grid, all_vectors, shift, unit_vectors
+
+
+def test_from_lines_is_indexed_by_x_y():
+    grid = Grid.from_lines(["ab", "cd", "ef"], cell=lambda char: ord(char) - ord("a"))
+
+    assert grid.shape == (2, 3)
+    assert grid[1, 2] == 5
+    assert grid[2, 0] == 0  # out of bounds reads fill
+
+
+def test_from_coords_with_negative_coords():
+    grid = Grid.from_coords([(-1, -3), (0, 10), (3, 1)], padding=1)
+
+    assert grid.lower == (-2, -4)
+    assert grid.upper == (5, 12)
+    assert grid[-1, -3] and grid[3, 1] and not grid[0, 0]
+    assert sorted(grid.coords()) == [(-1, -3), (0, 10), (3, 1)]
+    assert grid.bounding_box() == ((-1, -3), (3, 10))
+
+
+def test_setting_outside_grows_the_grid():
+    grid = Grid.zeros((2, 2), dtype=int)
+    grid[1, 1] = 7
+    grid[-5, 3] = 1
+
+    assert grid.in_bounds((-5, 3))
+    assert grid[1, 1] == 7
+    assert grid.count() == 2
+
+    # growth leaves padding, so the next cell nearby does not reallocate
+    array = grid.array
+    grid[-6, 3] = 1
+    assert grid.array is array
+
+
+def test_ensure_margin():
+    grid = Grid.from_coords([(0, 0), (2, 1)])
+    grid.ensure_margin(1)
+
+    lower, upper = grid.lower, grid.upper
+    assert lower[0] <= -1 and lower[1] <= -1
+    assert upper[0] >= 4 and upper[1] >= 3
+    assert sorted(grid.coords()) == [(0, 0), (2, 1)]
+
+
+def test_neighbours_are_bounds_checked():
+    grid = Grid.zeros((3, 3))
+
+    assert sorted(grid.neighbours((0, 0))) == [(0, 1), (1, 0)]
+    assert len(list(grid.neighbours((1, 1), diagonal=True))) == 8
+    assert len(unit_vectors(3)) == 6
+    assert len(all_vectors(3)) == 26
+
+
+def test_shift():
+    array = np.array([[1, 2], [3, 4]])
+
+    assert shift(array, (1, 0)).tolist() == [[0, 0], [1, 2]]
+    assert shift(array, (0, -1), fill=9).tolist() == [[2, 9], [4, 9]]
+    assert shift(array, (2, 0)).tolist() == [[0, 0], [0, 0]]
+    assert Grid(array, fill=-1).shifted((-1, 1)).tolist() == [[-1, 3], [-1, -1]]
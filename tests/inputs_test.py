@@ -0,0 +1,85 @@
+import hashlib
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from solutions.inputs import InputStore
+
+
+@pytest.fixture(name="store")
+def make_store(tmp_path):
+    yield InputStore(root=str(tmp_path))
+
+
+def test_add_and_load(store):
+    digest = store.add(1, "1000\n2000\n\n3000")
+
+    assert digest == hashlib.sha256(b"1000\n2000\n\n3000").hexdigest()
+    assert store.digest(1) == digest
+    assert store.load(1) == "1000\n2000\n\n3000"
+    assert store.is_valid(digest)
+
+
+def test_add_replaces_current_input_but_keeps_old_one(store):
+    old_digest = store.add(2, "A Y")
+    new_digest = store.add(2, "B X")
+
+    assert store.digest(2) == new_digest
+    assert store.load(2) == "B X"
+    assert store.load(2, digest=old_digest) == "A Y"
+
+
+def test_open_is_memory_mapped(store):
+    store.add(6, "mjqjpqmgbljsphdztnvjfqwrcgsmlb")
+
+    with store.open(6) as buffer:
+        assert buffer.find(b"jsph") == 10
+
+
+def test_load_empty_input(store):
+    store.add(3, "")
+
+    assert store.load(3) == ""
+
+
+def test_missing_input(store):
+    assert store.digest(5) is None
+    with pytest.raises(FileNotFoundError):
+        store.load(5)
+
+
+def test_import_legacy_input(store, tmp_path):
+    (tmp_path / "day_04.txt").write_text("2-4,6-8")
+
+    assert store.load(4) == "2-4,6-8"
+    assert store.read_index() == {"4": hashlib.sha256(b"2-4,6-8").hexdigest()}
+
+
+def test_is_valid_detects_corruption(store):
+    digest = store.add(7, "$ cd /")
+    with open(store.object_path(digest), "w") as f:
+        f.write("$ cd ..")
+
+    assert not store.is_valid(digest)
+
+
+def test_importing_solutions_does_no_network_io():
+    modules = ", ".join(f"solutions.day_{day:02}" for day in range(1, 26))
+    code = f"import sys, {modules}; print('aoc_helper' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert output.stdout.strip() == "False"
+
+
+def test_concurrent_adds(store):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda day: store.add(day, f"input {day}"), range(1, 26)))
+
+    assert sorted(map(int, store.read_index())) == list(range(1, 26))
+    # no temporary file is left behind
+    assert not [name for name in os.listdir(store.root) if name.endswith(".tmp")]
@@ -0,0 +1,88 @@
+import json
+import time
+
+import pytest
+
+from solutions import day_14
+from solutions.instrument import Profiler, count, memory_limit
+from solutions.runner import run_day
+from tests.day_14_test import example as day_14_example
+
+
+def test_count_does_nothing_when_not_recording():
+    count("grains", 10)
+
+    profiler = Profiler()
+    with profiler.phase("part_one"):
+        count("grains", 2)
+        count("grains")
+
+    assert profiler.phases["part_one"].counters == {"grains": 3}
+
+
+def test_phase_records_time_and_memory():
+    profiler = Profiler()
+    with profiler.phase("parse"):
+        data = [0] * 100000
+    with profiler.phase("parse"):
+        pass
+
+    profile = profiler.phases["parse"]
+    assert profile.wall_seconds > 0
+    assert profile.cpu_seconds >= 0
+    assert profile.peak_memory_bytes >= 8 * len(data)
+
+
+def test_phase_records_rss_and_top_allocations():
+    profiler = Profiler(top_allocations=3)
+    with profiler.phase("part_one"):
+        data = [bytes(1000) for _ in range(1000)]
+
+    profile = profiler.phases["part_one"]
+    assert profile.peak_rss_bytes > len(data) * 1000
+    assert 1 <= len(profile.top_allocations) <= 3
+    largest = profile.top_allocations[0]
+    assert largest["site"].startswith(__file__)
+    assert largest["size_bytes"] >= len(data) * 1000
+
+
+def test_top_allocations_near_the_peak():
+    profiler = Profiler(top_allocations=3)
+    with profiler.phase("part_one"):
+        temporary = [bytes(1000) for _ in range(10000)]
+        time.sleep(0.05)
+        del temporary
+        kept = [0] * 10
+
+    profile = profiler.phases["part_one"]
+    # the temporary list was freed before the end of the phase, but is found near the peak
+    assert profile.top_allocations_at_bytes >= profile.peak_memory_bytes / 1.2
+    assert profile.top_allocations[0]["size_bytes"] >= 10000 * 1000 / 1.2
+    assert len(kept) == 10
+
+
+def test_memory_limit_is_restored():
+    with pytest.raises(MemoryError):
+        with memory_limit(1 << 20):
+            bytearray(1 << 30)
+
+    assert len(bytearray(1 << 30)) == 1 << 30
+
+
+def test_hot_path_counters():
+    profiler = Profiler()
+    with profiler.phase("part_one"):
+        day_14.part_one(day_14.parse_raw(day_14_example))
+
+    assert profiler.phases["part_one"].counters == {"grains": 24}
+
+
+def test_run_day_with_profile(tmp_path):
+    result = run_day(14, raw=day_14_example, profile_dir=str(tmp_path))
+
+    assert result.error is None
+    assert set(result.profile) == {"parse", "part_one", "part_two"}
+    assert result.profile["part_two"]["counters"] == {"grains": 93}
+    with open(tmp_path / "day_14.json") as f:
+        assert json.load(f) == result.profile
+    assert (tmp_path / "day_14.prof").exists()
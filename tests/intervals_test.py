@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from solutions.intervals import IntervalIndex
+
+
+def random_intervals(count: int, seed: int) -> list[tuple[int, int]]:
+    rng = random.Random(seed)
+    intervals = []
+    for _ in range(count):
+        first = rng.randint(0, 200)
+        intervals.append((first, first + rng.choice([0, 1, 5, 30, 100])))
+    return intervals
+
+
+def brute_overlapping(intervals, first, last) -> list[int]:
+    return [i for i, (a, b) in enumerate(intervals) if a <= last and first <= b]
+
+
+@pytest.mark.parametrize("count", [0, 1, 10, 500])
+def test_queries_match_brute_force(count):
+    intervals = random_intervals(count, seed=count)
+    index = IntervalIndex(intervals)
+
+    for first, last in [(-5, -1), (0, 0), (50, 50), (20, 70), (150, 400), (0, 400)]:
+        expected = brute_overlapping(intervals, first, last)
+        assert sorted(index.overlapping(first, last).tolist()) == expected
+        assert index.count_overlapping(first, last) == len(expected)
+    assert sorted(index.stab(42).tolist()) == brute_overlapping(intervals, 42, 42)
+
+
+def test_overlapping_pairs():
+    intervals = random_intervals(300, seed=1)
+    index = IntervalIndex(intervals)
+
+    expected = {
+        (i, j)
+        for i, (a, b) in enumerate(intervals)
+        for j, (c, d) in enumerate(intervals)
+        if i < j and a <= d and c <= b
+    }
+    pairs = list(index.overlapping_pairs())
+    assert len(pairs) == len(expected)
+    assert set(pairs) == expected
+
+    counts = [0] * len(intervals)
+    for i, j in expected:
+        counts[i] += 1
+        counts[j] += 1
+    assert index.overlap_counts().tolist() == counts
+
+
+def test_rejects_reversed_intervals():
+    with pytest.raises(ValueError):
+        IntervalIndex([(3, 2)])
@@ -0,0 +1,55 @@
+import importlib
+
+import pytest
+
+from solutions import jit
+from solutions.generators import generate
+
+# day: (name of the kernel in the day module, size of the generated input)
+Kernels = {
+    14: ("pour_sand", 400),
+    17: ("settle_rock", 200),
+    20: ("mix_tokens", 300),
+    23: ("step_elves", 300),
+}
+
+
+def answers(module, raw: str) -> tuple[int, int]:
+    # parsed twice, as the parts may change what they are given
+    return tuple(
+        part(module.parse_raw(raw)) for part in (module.part_one, module.part_two)
+    )
+
+
+@pytest.mark.parametrize("day", Kernels)
+def test_kernel_variants_agree(day, monkeypatch):
+    module = importlib.import_module(f"solutions.day_{day:02}")
+    name, size = Kernels[day]
+    kernel = getattr(module, name)
+    raw = generate(day, size=size, seed=3)
+
+    expected = answers(module, raw)
+    for variant, implementation in kernel.variants().items():
+        monkeypatch.setattr(kernel, "implementation", implementation)
+
+        assert answers(module, raw) == expected, variant
+
+
+def test_fallback_without_numba(monkeypatch):
+    monkeypatch.setattr(jit, "Enabled", False)
+    jit.numba_module.cache_clear()
+    try:
+        kernel = jit.Kernel(lambda x: x + 1, fallback=lambda x: x + 2)
+
+        assert not jit.available()
+        assert kernel.variants().keys() == {"python", "fallback"}
+        assert kernel(1) == 3
+    finally:
+        jit.numba_module.cache_clear()
+
+
+@pytest.mark.skipif(not jit.available(), reason="numba is not installed")
+def test_numba_compiles_kernels():
+    kernel = jit.Kernel(lambda x: x + 1, fallback=lambda x: x + 2)
+
+    assert kernel(1) == 2
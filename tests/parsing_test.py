@@ -0,0 +1,72 @@
+import re
+
+import pytest
+
+from solutions import parsing
+from solutions.generators import generate
+from solutions.parsing import SmallInput, int_list, int_lists, int_records, ints
+
+Mixed = "x=-12, y=3 -5 7-8 --9 a-b 0 007 -"
+
+
+def test_ints():
+    assert ints(Mixed).tolist() == [-12, 3, -5, 7, 8, -9, 0, 7]
+    assert ints(Mixed, signed=False).tolist() == [12, 3, 5, 7, 8, 9, 0, 7]
+    assert ints("no numbers").tolist() == []
+
+
+def test_large_input_matches_small_input():
+    # large inputs take the numpy path, small ones the regex
+    raw = (Mixed + "\n") * (SmallInput // len(Mixed) + 1)
+
+    assert len(raw) >= SmallInput
+    assert ints(raw).tolist() == ints(Mixed).tolist() * (raw.count("\n"))
+    assert ints(" " * SmallInput).tolist() == []
+
+
+def test_ints_matches_regex_on_generated_input():
+    raw = generate(15, size=200, seed=1)
+    expected = [int(num) for num in re.findall(r"-?\d+", raw)]
+
+    assert ints(raw).tolist() == expected
+    assert ints(raw.encode()).tolist() == expected
+
+
+def test_int_records():
+    raw = "Sensor at x=2, y=-18: beacon at x=-2, y=15\nSensor at x=9, y=16: beacon at x=10, y=16\n"
+
+    assert int_records(raw, 4).tolist() == [[2, -18, -2, 15], [9, 16, 10, 16]]
+
+
+def test_int_records_checks_every_line():
+    with pytest.raises(ValueError, match="line 2 has 3 integers, expected 4"):
+        int_records("2-4,6-8\n2-3,4\n1-1,2-2", 4)
+
+    with pytest.raises(ValueError, match="line 1 has 0 integers"):
+        int_records("not a valid input", 4)
+
+
+def test_numbers_over_18_digits():
+    largest = "9" * 18
+    assert ints(f"-{largest}").tolist() == [-int(largest)]
+    # 19 digits would silently wrap around in int64
+    for raw in [f"1{largest}", f"x=-1{largest}\n" + " " * SmallInput]:
+        with pytest.raises(ValueError, match="number of 19 digits"):
+            ints(raw)
+    with pytest.raises(ValueError, match="number of 19 digits"):
+        int_records(f"1,1{largest}", 2)
+
+
+def test_list_parsers_match_array_parsers(monkeypatch):
+    raw = generate(15, size=200, seed=1)
+
+    for worth_numpy in (True, False):
+        # without numpy imported, the lists come from a regex
+        monkeypatch.setattr(parsing, "worth_numpy", lambda _: worth_numpy)
+
+        assert int_list(raw) == ints(raw).tolist()
+        assert int_lists(raw, 4) == int_records(raw, 4).tolist()
+        with pytest.raises(ValueError, match="line 2 has 3 integers, expected 4"):
+            int_lists("2-4,6-8\n2-3,4\n1-1,2-2", 4)
+        with pytest.raises(ValueError, match="number of 19 digits"):
+            int_lists("1,1" + "9" * 18, 2)
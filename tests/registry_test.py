@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+
+from solutions.registry import (
+    adapter_source,
+    discover,
+    read_module,
+    solution_sources,
+)
+from solutions.runner import AllDays
+from solutions.streaming import StreamingDays
+
+
+def test_discover_all_days():
+    days = discover()
+
+    assert list(days) == list(AllDays)
+    assert all("part_one" in spec.names for spec in days.values())
+    assert [day for day, spec in days.items() if not spec.has_part_two] == [22, 25]
+    assert tuple(day for day, spec in days.items() if spec.streaming) == StreamingDays
+
+
+def test_heavy_imports_through_shared_modules():
+    days = discover()
+
+    # numpy through solutions.grid
+    assert days[12].heavy_imports == {"numpy"}
+    # solutions.parsing and solutions.search import numpy lazily
+    assert days[4].heavy_imports == set()
+    assert days[16].heavy_imports == set()
+
+
+def test_read_module(tmp_path):
+    path = tmp_path / "day_99.py"
+    path.write_text(
+        "import re\nfrom solutions import grid\nLimit: int = 3\nX = 1\n"
+        "def part_one():\n    import numpy\n\nclass Cave:\n    pass\n"
+    )
+
+    names, imports = read_module(str(path))
+
+    assert names == {"Limit", "X", "part_one", "Cave"}
+    assert imports == {"re", "solutions", "solutions.grid"}
+
+
+def test_discover_does_not_import_days():
+    script = (
+        "import sys\nfrom solutions.registry import discover\ndiscover()\n"
+        "print([m for m in sys.modules if m.startswith('solutions.day')])"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == "[]"
+
+
+def test_solution_sources():
+    sources = [os.path.basename(path) for path in solution_sources("solutions.day_04")]
+
+    # intervals is only imported within a function
+    assert {"day_04.py", "parsing.py", "intervals.py"} <= set(sources)
+    assert "grid.py" not in sources
+
+
+def test_adapter_source():
+    assert "y=2000000" in adapter_source(15)
+    assert "y=2000000" not in adapter_source(22)
+    assert "as_cube=True" in adapter_source(22)
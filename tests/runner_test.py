@@ -0,0 +1,120 @@
+import concurrent.futures
+import sys
+
+import pytest
+
+from solutions.runner import (
+    DayResult,
+    format_timing_table,
+    parse_day_range,
+    parse_size,
+    run_day,
+    run_days,
+)
+from tests.day_04_test import example as day_04_example
+from tests.day_12_test import example as day_12_example
+from tests.day_13_test import example as day_13_example
+from tests.day_22_test import example as day_22_example
+
+
+def test_parse_day_range():
+    assert parse_day_range("1-25") == list(range(1, 26))
+    assert parse_day_range("3") == [3]
+    assert parse_day_range("1,3,5-7") == [1, 3, 5, 6, 7]
+    assert parse_day_range("7-5,2") == [2]
+
+    with pytest.raises(ValueError):
+        parse_day_range("0-26")
+
+
+def test_parse_size():
+    assert parse_size("4096") == 4096
+    assert parse_size("512M") == 512 << 20
+    assert parse_size("1.5g") == 3 << 29
+    assert parse_size("2KB") == 2048
+
+
+def test_run_day_over_memory_limit():
+    raw = "\n\n".join(["1000\n2000"] * 1_000_000)
+
+    result = run_day(1, raw=raw, memory_limit=1 << 20)
+
+    assert result.out_of_memory
+    assert "MemoryError" in result.error
+    assert set(result.profile) >= {"parse"}
+
+
+def test_run_day():
+    result = run_day(4, raw=day_04_example)
+
+    assert result.error is None
+    assert result.answers == {"part_one": 2, "part_two": 4}
+    assert set(result.timings) == {"parse", "part_one", "part_two"}
+
+
+@pytest.mark.parametrize(
+    "day, raw, expected",
+    [
+        (12, day_12_example, {"part_one": 31, "part_two": 29}),
+        (13, day_13_example, {"part_one": 13, "part_two": 140}),
+        (22, day_22_example, {"part_one": 6032, "part_two": 5031}),
+    ],
+)
+def test_run_day_with_special_signatures(day, raw, expected):
+    result = run_day(day, raw=raw)
+
+    assert result.error is None
+    assert result.answers == expected
+
+
+def test_run_day_captures_error():
+    result = run_day(4, raw="not a valid input")
+
+    assert result.error is not None
+    assert result.answers == {}
+
+
+def test_run_days():
+    inputs = {4: day_04_example, 13: day_13_example}
+    results = run_days([4, 13], workers=2, inputs=inputs)
+
+    assert [result.day for result in results] == [4, 13]
+    assert results[0].answers == {"part_one": 2, "part_two": 4}
+    assert results[1].answers == {"part_one": 13, "part_two": 140}
+
+
+@pytest.mark.parametrize("version", [(3, 10), (3, 11)])
+def test_run_days_memory_limit_pool(version, monkeypatch):
+    pools = []
+
+    class RecordingPool(concurrent.futures.ThreadPoolExecutor):
+        def __init__(self, max_workers=None, **options):
+            pools.append(options)
+            super().__init__(max_workers)
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", RecordingPool)
+    monkeypatch.setattr(sys, "version_info", version)
+
+    inputs = {4: day_04_example, 13: day_13_example}
+    results = run_days([4, 13], inputs=inputs, memory_limit=1 << 40)
+
+    assert results[0].answers == {"part_one": 2, "part_two": 4}
+    # max_tasks_per_child only exists from Python 3.11
+    assert pools == [{} if version < (3, 11) else {"max_tasks_per_child": 1}]
+
+
+def test_format_timing_table():
+    results = [
+        DayResult(day=1, timings={"parse": 0.001, "part_one": 0.5, "part_two": 1.25}),
+        DayResult(day=25, timings={"parse": 0.002, "part_one": 0.003}),
+        DayResult(day=3, error="Traceback"),
+        DayResult(day=19, error="Traceback", out_of_memory=True),
+    ]
+
+    rows = format_timing_table(results).splitlines()
+
+    assert len(rows) == 6
+    assert rows[2] == "  1 |      1.0ms |    500.0ms |   1250.0ms"
+    assert rows[3] == " 25 |      2.0ms |      3.0ms |          -"
+    assert rows[4] == "  3 | failed"
+    assert rows[5] == " 19 | over memory limit"
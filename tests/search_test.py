@@ -0,0 +1,165 @@
+import numpy as np
+
+from solutions import search
+from solutions.search import (
+    PagedBitmap,
+    Unreached,
+    astar,
+    bfs,
+    bfs_layers,
+    dijkstra,
+    time_expanded,
+    unique,
+)
+
+# 4 x 4 grid, cell = x * 4 + y, with walls at x == 1 except (1, 3)
+Walls = {4, 5, 6}
+
+
+def grid_neighbours(state: int) -> list[int]:
+    x, y = divmod(state, 4)
+    candidates = [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
+    return [
+        nx * 4 + ny
+        for nx, ny in candidates
+        if 0 <= nx < 4 and 0 <= ny < 4 and nx * 4 + ny not in Walls
+    ]
+
+
+def test_bfs_distances():
+    result = bfs(starts=[0], neighbours=grid_neighbours, n_states=16)
+
+    assert result.goal is None
+    assert result.distances[0] == 0
+    assert result.distances[3] == 3
+    # around the wall through (1, 3)
+    assert result.distances[8] == 8
+    assert [result.distances[wall] for wall in Walls] == [Unreached] * 3
+
+
+def test_bfs_early_exit():
+    result = bfs(
+        starts=[0], neighbours=grid_neighbours, n_states=16, is_goal=lambda s: s == 7
+    )
+
+    assert (result.goal, result.distance) == (7, 4)
+    # states beyond the goal are not searched
+    assert result.distances[15] == Unreached
+
+
+def test_bfs_multi_source():
+    result = bfs(
+        starts=[0, 12],
+        neighbours=grid_neighbours,
+        n_states=16,
+        is_goal=lambda s: s == 8,
+    )
+
+    assert result.distance == 1
+
+
+def test_bfs_goal_at_start():
+    result = bfs(starts=[5], neighbours=grid_neighbours, n_states=16, is_goal=bool)
+
+    assert (result.goal, result.distance) == (5, 0)
+
+
+def test_dijkstra():
+    # 0 -> 1 -> 2 is shorter than 0 -> 2
+    edges = {0: [(1, 1), (2, 5)], 1: [(2, 1)], 2: [(3, 2)], 3: []}
+
+    result = dijkstra(starts=[0], neighbours=edges.__getitem__, n_states=4)
+
+    assert result.distances == [0, 1, 2, 4]
+
+
+def test_astar_matches_dijkstra():
+    def weighted(state):
+        return [(neighbour, 1 + neighbour % 3) for neighbour in grid_neighbours(state)]
+
+    def manhattan(state):
+        x, y = divmod(state, 4)
+        return abs(3 - x) + abs(3 - y)
+
+    expected = dijkstra(starts=[0], neighbours=weighted, n_states=16)
+    actual = astar(
+        starts=[0],
+        neighbours=weighted,
+        n_states=16,
+        is_goal=lambda s: s == 15,
+        heuristic=manhattan,
+    )
+
+    assert actual.distance == expected.distances[15]
+
+
+def test_unique():
+    actual = unique(np.array([5, 3, 5, 1, 3]))
+
+    assert actual.tolist() == [1, 3, 5]
+
+
+def test_bfs_layers_time_expanded():
+    # a corridor of 5 cells, with a door on cell 2 that is only open on even turns
+    n_cells, period = 5, 2
+
+    def expand(states, turn):
+        cells = states % n_cells
+        next_cells = np.concatenate([cells, cells + 1, cells - 1])
+        next_cells = next_cells[(next_cells >= 0) & (next_cells < n_cells)]
+        if (turn + 1) % 2:
+            next_cells = next_cells[next_cells != 2]
+        return time_expanded(turn + 1, next_cells, period, n_cells)
+
+    actual = bfs_layers(
+        starts=[time_expanded(1, 0, period, n_cells)],
+        expand=expand,
+        n_states=period * n_cells,
+        is_goal=lambda states: states % n_cells == 4,
+        start_depth=1,
+    )
+
+    # turn 2 on cell 1, wait on turn 3, turn 4 on the door, turn 6 at the end
+    assert actual == (6, time_expanded(6, 4, period, n_cells))
+
+
+def test_bfs_layers_unreachable():
+    actual = bfs_layers(
+        starts=[0],
+        expand=lambda states, _: (states + 1) % 3,
+        n_states=3,
+        is_goal=lambda states: states == 5,
+    )
+
+    assert actual is None
+
+
+def test_paged_bitmap():
+    bitmap = PagedBitmap(n_states=1 << 20, page_bits=4)
+
+    assert bitmap.add(np.array([3, 5, 17, 40])).tolist() == [3, 5, 17, 40]
+    # 4 shares a byte with 3 and 5, 18 a page with 17
+    assert bitmap.add(np.array([3, 4, 5, 18, 40])).tolist() == [4, 18]
+    # only the pages reached are allocated
+    assert sorted(bitmap.pages) == [0, 1, 2]
+
+
+def test_bfs_layers_small_pages(monkeypatch):
+    monkeypatch.setattr(search, "VisitedPageBits", 3)
+
+    # a cycle of 20 states, the goal being only reachable the long way round
+    assert bfs_layers(
+        starts=[0],
+        expand=lambda states, _: (states + 1) % 20,
+        n_states=20,
+        is_goal=lambda states: states == 19,
+    ) == (19, 19)
+    assert (
+        bfs_layers(
+            starts=[0],
+            expand=lambda states, _: (states + 1) % 20,
+            n_states=20,
+            is_goal=lambda states: states == 25,
+        )
+        is None
+    )
@@ -0,0 +1,44 @@
+import io
+
+import pytest
+
+from solutions.generators import generate
+from solutions.runner import run_day
+from solutions.streaming import (
+    StreamingDays,
+    read_lines,
+    solve_file_parallel,
+    solve_stream,
+)
+
+
+def test_read_lines():
+    stream = io.BytesIO(b"A Y\r\nB X\nC Z\n")
+
+    assert list(read_lines(stream)) == ["A Y", "B X", "C Z"]
+
+
+@pytest.mark.parametrize("day", StreamingDays)
+def test_solve_stream_matches_run_day(day, tmp_path):
+    raw = generate(day, size=300, seed=2)
+    path = tmp_path / "input.txt"
+    path.write_text(raw + "\n")
+
+    expected = run_day(day, raw=raw).answers
+    assert solve_stream(day, str(path)) == expected
+    assert solve_stream(day, io.BytesIO(raw.encode())) == expected
+
+
+def test_solve_stream_rejects_other_days():
+    with pytest.raises(ValueError):
+        solve_stream(5, io.BytesIO(b""))
+
+
+def test_solve_file_parallel(tmp_path):
+    raw = generate(1, size=300, seed=2)
+    path = tmp_path / "input.txt"
+    path.write_text(raw)
+
+    assert solve_file_parallel(1, str(path), workers=1) == run_day(1, raw=raw).answers
+    with pytest.raises(ValueError):
+        solve_file_parallel(2, str(path))
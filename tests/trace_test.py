@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from solutions import day_14, day_17, day_23, day_24, trace
+from solutions.trace import Recorder
+from tests.day_14_test import example as day_14_example
+from tests.day_17_test import example as day_17_example
+from tests.day_23_test import example as day_23_example
+from tests.day_24_test import example as day_24_example
+
+
+def test_frame_does_nothing_when_not_recording():
+    trace.frame("sand", 0, np.ones((2, 2)))
+
+    assert trace.interval("sand") is None
+    assert not trace.wants("sand", 0)
+
+
+def test_record_and_render():
+    cells = np.array([[0, 1, 2], [3, 0, 1]])
+    recorder = Recorder()
+    with recorder.recording():
+        trace.frame("world", 0, cells, origin=(10, 20))
+
+    frame = recorder.frames[-1]
+    assert frame.bits == 2
+    assert recorder.cells(frame).tolist() == cells.tolist()
+    assert recorder.render(frame) == ".#o\n@.#"
+    assert recorder.render(frame, viewport=((11, 21), (15, 30))) == ".#"
+    assert recorder.render(frame, viewport=((0, 0), (10, 20))) == ""
+
+
+def test_sampled_by_interval_and_stream():
+    recorder = Recorder(interval=3, streams={"kept"})
+    with recorder.recording():
+        for step in range(10):
+            trace.frame("kept", step, np.zeros((1, 1)))
+            trace.frame("ignored", step, np.zeros((1, 1)))
+
+    assert [frame.step for frame in recorder.frames_of("kept")] == [0, 3, 6, 9]
+    assert recorder.frames_of("ignored") == []
+
+
+def test_ring_buffer_drops_oldest_frames():
+    # 3 frames of 2 bytes fit in 7 bytes
+    recorder = Recorder(capacity=7)
+    with recorder.recording():
+        for step in range(5):
+            trace.frame("world", step, np.full((1, 16), step % 2, dtype=bool))
+        first = recorder.frames[0]
+        for step in range(5, 8):
+            trace.frame("world", step, np.full((1, 16), step % 2, dtype=bool))
+
+    assert [frame.step for frame in recorder.frames] == [5, 6, 7]
+    assert [recorder.cells(frame)[0, 0] for frame in recorder.frames] == [1, 0, 1]
+    with pytest.raises(ValueError, match="dropped"):
+        recorder.cells(first)
+    with pytest.raises(ValueError, match="doesn't fit"):
+        recorder.record("world", 0, np.ones((8, 8)))
+
+
+def test_day_14_frames(capsys):
+    rocks = day_14.parse_raw(day_14_example)
+    recorder = Recorder(interval=5)
+    with recorder.recording():
+        answer = day_14.part_one(rocks)
+
+    assert answer == day_14.part_one(rocks) == 24
+    assert capsys.readouterr().out == ""
+    assert [frame.step for frame in recorder.frames_of("sand")] == [5, 10, 15, 20]
+    # the sand below the source, at (500, 8)
+    last = recorder.frames[-1]
+    assert recorder.render(last, viewport=((8, 499), (10, 502)), palette=" #o") == (
+        "ooo\n###"
+    )
+
+
+@pytest.mark.parametrize(
+    "module, raw, stream",
+    [
+        (day_17, day_17_example, "tower"),
+        (day_23, day_23_example, "elves"),
+        (day_24, day_24_example, "valley"),
+    ],
+)
+def test_simulation_frames(module, raw, stream):
+    recorder = Recorder(interval=2)
+    with recorder.recording():
+        answer = module.part_one(module.parse_raw(raw))
+
+    assert answer == module.part_one(module.parse_raw(raw))
+    frames = recorder.frames_of(stream)
+    assert frames and all(frame.step % 2 == 0 for frame in frames)
+    assert recorder.render(frames[-1])